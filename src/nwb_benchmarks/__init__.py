@@ -10,6 +10,9 @@ from .command_line_interface import main
 TSHARK_PATH = os.environ.get("TSHARK_PATH", None)
 NETWORK_INTERFACE = os.environ.get("NWB_BENCHMARKS_NETWORK_INTERFACE", None)
 RUN_DOWNLOAD_BENCHMARKS = os.environ.get("RUN_DOWNLOAD_BENCHMARKS", None)
+RUN_ADAPTIVE_SAMPLING_BENCHMARKS = os.environ.get("NWB_BENCHMARKS_ADAPTIVE_SAMPLING", None)
+RUN_LATENCY_DISTRIBUTION_BENCHMARKS = os.environ.get("NWB_BENCHMARKS_LATENCY_DISTRIBUTION", None)
+RUN_LARGE_SYNTHETIC_BENCHMARKS = os.environ.get("NWB_BENCHMARKS_LARGE_SYNTHETIC_FILES", None)
 
 if TSHARK_PATH is None:
     TSHARK_PATH = shutil.which("tshark")
@@ -26,9 +29,30 @@ if RUN_DOWNLOAD_BENCHMARKS:
         "RUN_DOWNLOAD_BENCHMARKS is set. Benchmarks that download the entire test file will be run, which may take a long time."
     )
 
+if RUN_ADAPTIVE_SAMPLING_BENCHMARKS:
+    warnings.warn(
+        "NWB_BENCHMARKS_ADAPTIVE_SAMPLING is set. Adaptive sampling benchmarks will be run, which repeat each case until "
+        "the median time is known precisely and may take a long time."
+    )
+
+if RUN_LATENCY_DISTRIBUTION_BENCHMARKS:
+    warnings.warn(
+        "NWB_BENCHMARKS_LATENCY_DISTRIBUTION is set. Latency distribution benchmarks will be run, which read many small "
+        "slices in each case to measure the tail latencies and may take a long time."
+    )
+
+if RUN_LARGE_SYNTHETIC_BENCHMARKS:
+    warnings.warn(
+        "NWB_BENCHMARKS_LARGE_SYNTHETIC_FILES is set. Synthetic scaling benchmarks will generate and run on files of "
+        "1 GB of data, which take several GB of disk space in total and a long time to generate."
+    )
+
 __all__ = [
     "main",
     "TSHARK_PATH",
     "NETWORK_INTERFACE",
     "RUN_DOWNLOAD_BENCHMARKS",
+    "RUN_ADAPTIVE_SAMPLING_BENCHMARKS",
+    "RUN_LATENCY_DISTRIBUTION_BENCHMARKS",
+    "RUN_LARGE_SYNTHETIC_BENCHMARKS",
 ]
@@ -3,6 +3,9 @@ Basic benchmarks for profiling network statistics for streaming access to slices
 
 The benchmarks should be consistent with the timing benchmarks - each function should be the same but wrapped in a
 network activity tracker. In fact, all of the benchmarking classes should be the same.
+
+Each slice also reports its read amplification: the bytes downloaded compared to the bytes of the returned array, the
+bytes downloaded beyond those, and the number of HTTP requests sent per megabyte returned.
 """
 
 import shutil
@@ -14,6 +17,8 @@ from asv_runner.benchmarks.mark import skip_benchmark_if
 from nwb_benchmarks import TSHARK_PATH
 from nwb_benchmarks.core import (
     BaseBenchmark,
+    compute_read_amplification,
+    count_http_requests,
     download_read_hdf5_pynwb_lindi,
     get_object_by_name,
     network_activity_tracker,
@@ -41,6 +46,9 @@ class TrackNetworkContinuousSliceBenchmark(BaseBenchmark, ABC):
     Note: in all cases, store the in-memory objects to be consistent with timing benchmarks.
     """
 
+    # Whether the HTTP requests of the streaming method are sent through urllib3 or aiohttp, and so can be counted
+    counts_http_requests: bool = True
+
     @abstractmethod
     def setup(self, params: dict[str, str | Tuple[slice]]):
         """Set up the benchmark by loading the NWB file and preparing data for slicing.
@@ -69,9 +77,16 @@ class TrackNetworkContinuousSliceBenchmark(BaseBenchmark, ABC):
     def track_network_during_slice(self, params: dict[str, str | Tuple[slice]]):
         """Slice a range of a dataset in a remote NWB file."""
         slice_range = params["slice_range"]
-        with network_activity_tracker(tshark_path=TSHARK_PATH) as network_tracker:
+        with network_activity_tracker(tshark_path=TSHARK_PATH) as network_tracker, count_http_requests() as counter:
             self._temp = self.data_to_slice[slice_range]
-        return network_tracker.asv_network_statistics
+
+        # Add the read amplification to a copy so that the statistics of the tracker keep only the network variables
+        read_amplification = compute_read_amplification(
+            logical_bytes=self._temp.nbytes,
+            transferred_bytes=network_tracker.network_statistics["amount_downloaded_in_bytes"],
+            number_of_requests=counter.number_of_requests if self.counts_http_requests else None,
+        )
+        return dict(samples={**network_tracker.network_statistics, **read_amplification}, number=None)
 
 
 class HDF5PyNWBFsspecHttpsNoCacheContinuousSliceBenchmark(TrackNetworkContinuousSliceBenchmark):
@@ -302,6 +317,7 @@ class HDF5PyNWBROS3ContinuousSliceBenchmark(TrackNetworkContinuousSliceBenchmark
     """
 
     params = hdf5_redirected_read_slice_params
+    counts_http_requests = False
 
     def setup(self, params: dict[str, str | Tuple[slice]]):
         https_url = params["https_url"]
@@ -319,6 +335,7 @@ class HDF5PyNWBROS3PreloadedContinuousSliceBenchmark(TrackNetworkContinuousSlice
     """
 
     params = hdf5_redirected_read_slice_params
+    counts_http_requests = False
 
     def setup(self, params: dict[str, str | Tuple[slice]]):
         https_url = params["https_url"]
@@ -1,3 +1,4 @@
+from nwb_benchmarks import RUN_LARGE_SYNTHETIC_BENCHMARKS
 from nwb_benchmarks.core import get_https_url
 
 ################################### BASE PARAMETERS ###################################
@@ -340,3 +341,408 @@ for index, slice_range in enumerate(icephys_slices):
             slice_range=slice_range,
         )
     )
+
+#################################### IMPORT PARAMETERS ###################################
+import_params = (
+    dict(name="NWBBenchmarks", module_name="nwb_benchmarks"),
+    dict(name="PyNWB", module_name="pynwb"),
+    dict(name="HDMFZarr", module_name="hdmf_zarr"),
+    dict(name="LINDI", module_name="lindi"),
+)
+
+#################################### OBJECT LOOKUP PARAMETERS ###################################
+object_lookup_params = tuple(
+    dict(name=f"{number_of_objects}Objects", number_of_objects=number_of_objects)
+    for number_of_objects in (1_000, 10_000, 100_000)
+)
+
+#################################### ZARR V3 LAYOUT PARAMETERS ###################################
+# Chunk and shard shapes of the sliced data in Zarr v3 copies of the local Zarr files; a shard shape of None means
+# unsharded. The first layout of each keeps the original chunk shape, the second shards smaller chunks into shards of
+# the original chunk shape, and the third groups several of the original chunks into each shard.
+zarr_v3_layouts = dict(
+    Ecephys=[((262_144, 32), None), ((65_536, 32), (262_144, 32)), ((262_144, 32), (262_144, 128))],
+    Ophys=[((20, 796, 512), None), ((5, 796, 512), (20, 796, 512)), ((20, 796, 512), (100, 796, 512))],
+    Icephys=[((8192,), None), ((2048,), (8192,)), ((8192,), (81_920,))],
+)
+
+zarr_v3_slice_params = []
+for modality, https_url, object_name, slices in (
+    ("Ecephys", zarr_ecephys_params["https_url_no_redirect"], "ElectricalSeries", ecephys_slices),
+    ("Ophys", zarr_ophys_params["https_url_no_redirect"], "TwoPhotonSeries", ophys_slices),
+    ("Icephys", zarr_icephys_params["https_url_no_redirect"], "data_00002_AD0", icephys_slices),
+):
+    for layout_index, (chunk_shape, shard_shape) in enumerate(zarr_v3_layouts[modality]):
+        for index, slice_range in enumerate(slices):
+            zarr_v3_slice_params.append(
+                dict(
+                    name=f"{modality}Layout{layout_index + 1}TestCase{index + 1}",
+                    https_url=https_url,
+                    object_name=object_name,
+                    slice_range=slice_range,
+                    chunk_shape=chunk_shape,
+                    shard_shape=shard_shape,
+                )
+            )
+
+#################################### CHUNK LAYOUT PARAMETERS ###################################
+# Chunk shapes and codecs that the data of the downloaded HDF5 files is rewritten with, locally to both HDF5 and Zarr.
+# Only the rows covered by the slices are rewritten. The first chunk shape of each modality is the original one.
+chunk_layout_codecs = ("none", "gzip-1", "gzip-4", "gzip-9", "blosc-lz4", "blosc-zstd")
+chunk_layout_cases = (
+    dict(
+        modality="Ecephys",
+        https_url=hdf5_ecephys_params["https_url_no_redirect"],
+        object_name="ElectricalSeries",
+        number_of_rows=262_144 * 5,
+        chunk_shapes=((262_144, 32), (65_536, 64), (16_384, 384)),
+        slices=(ecephys_slices[0], ecephys_slices[-1]),
+    ),
+    dict(
+        modality="Ophys",
+        https_url=hdf5_ophys_params["https_url_no_redirect"],
+        object_name="TwoPhotonSeries",
+        number_of_rows=20 * 5,
+        chunk_shapes=((20, 796, 512), (1, 796, 512), (100, 128, 128)),
+        slices=(ophys_slices[0], ophys_slices[-1]),
+    ),
+    dict(
+        modality="Icephys",
+        https_url=hdf5_icephys_params["https_url_no_redirect"],
+        object_name="data_00002_AD0",
+        number_of_rows=8192 * 5,
+        chunk_shapes=((8192,), (1024,), (32_768,)),
+        slices=(icephys_slices[0], icephys_slices[-1]),
+    ),
+)
+
+chunk_layout_slice_params = []
+for case in chunk_layout_cases:
+    for chunk_shape_index, chunk_shape in enumerate(case["chunk_shapes"]):
+        for codec in chunk_layout_codecs:
+            for index, slice_range in enumerate(case["slices"]):
+                chunk_layout_slice_params.append(
+                    dict(
+                        name=(
+                            f"{case['modality']}Chunks{chunk_shape_index + 1}"
+                            f"{codec.title().replace('-', '')}TestCase{index + 1}"
+                        ),
+                        https_url=case["https_url"],
+                        object_name=case["object_name"],
+                        slice_range=slice_range,
+                        number_of_rows=case["number_of_rows"],
+                        chunk_shape=chunk_shape,
+                        codec=codec,
+                    )
+                )
+
+#################################### DECOMPRESSION PARAMETERS ###################################
+# The chunks of the last slice of each modality, from the rewrites with the original chunk shape and each codec
+chunk_decompression_params = []
+for case in chunk_layout_cases:
+    for codec in chunk_layout_codecs:
+        chunk_decompression_params.append(
+            dict(
+                name=f"{case['modality']}{codec.title().replace('-', '')}",
+                https_url=case["https_url"],
+                object_name=case["object_name"],
+                slice_range=case["slices"][-1],
+                number_of_rows=case["number_of_rows"],
+                chunk_shape=case["chunk_shapes"][0],
+                codec=codec,
+            )
+        )
+
+# Uncompressed chunks are only included as a baseline for the filter pipeline of HDF5, as there is nothing to decode
+threaded_chunk_decompression_params = [
+    {**params, "name": f"{params['name']}Threads{number_of_threads}", "number_of_threads": number_of_threads}
+    for params in chunk_decompression_params
+    if params["codec"] != "none"
+    for number_of_threads in (1, 2, 4, 8)
+]
+blosc_threaded_chunk_decompression_params = [
+    params for params in threaded_chunk_decompression_params if params["codec"].startswith("blosc-")
+]
+
+#################################### SYNTHETIC SCALING PARAMETERS ###################################
+# Synthetic files scale the size of the data (in bytes) and the number of additional objects independently, each from
+# a 10 MB file with 10 objects. Larger files (up to hundreds of GB) can be generated in the same way, given the space;
+# the files of 1 GB (several GB in total across modalities and backends) are only generated when explicitly enabled
+synthetic_data_sizes = (10**7, 10**8)
+if RUN_LARGE_SYNTHETIC_BENCHMARKS:
+    synthetic_data_sizes += (10**9,)
+synthetic_numbers_of_objects = (10, 100, 1_000, 10_000)
+
+synthetic_scaling_params = []
+for modality, object_name, slice_range in (
+    ("Ecephys", "ElectricalSeries", ecephys_slices[0]),
+    ("Ophys", "TwoPhotonSeries", ophys_slices[0]),
+    ("Icephys", "data_00002_AD0", icephys_slices[0]),
+):
+    scaling_cases = [(data_size, synthetic_numbers_of_objects[0]) for data_size in synthetic_data_sizes]
+    scaling_cases += [(synthetic_data_sizes[0], number) for number in synthetic_numbers_of_objects[1:]]
+    for data_size, number_of_objects in scaling_cases:
+        synthetic_scaling_params.append(
+            dict(
+                name=f"{modality}{data_size // 10**6}MB{number_of_objects}Objects",
+                modality=modality,
+                data_size=data_size,
+                number_of_objects=number_of_objects,
+                object_name=object_name,
+                slice_range=slice_range,
+            )
+        )
+
+################################# SYNTHETIC METADATA PARAMETERS #################################
+# Metadata-heavy files scale the number of objects at the smallest data size, with HDF5 files written with and without
+# paged aggregation, and Zarr stores with and without consolidated metadata
+synthetic_metadata_page_size = 4 * 2**20
+
+synthetic_metadata_params = [
+    dict(
+        name=f"{modality}{number_of_objects}Objects",
+        modality=modality,
+        data_size=synthetic_data_sizes[0],
+        number_of_objects=number_of_objects,
+    )
+    for modality in ("Ecephys", "Ophys", "Icephys")
+    for number_of_objects in synthetic_numbers_of_objects
+]
+synthetic_metadata_hdf5_params = [
+    {**params, "name": f"{params['name']}{paging}", "page_size": page_size}
+    for params in synthetic_metadata_params
+    for paging, page_size in (("Unpaged", None), ("Paged", synthetic_metadata_page_size))
+]
+synthetic_metadata_zarr_params = [
+    {**params, "name": f"{params['name']}{consolidation}", "consolidated": consolidated}
+    for params in synthetic_metadata_params
+    for consolidation, consolidated in (("Consolidated", True), ("Unconsolidated", False))
+]
+
+################################### PAGED HDF5 PARAMETERS ###################################
+# The downloaded HDF5 files are repacked with paged aggregation at each page size, and opened with a page buffer large
+# enough for several pages; the original files (without a page size) are opened without a page buffer
+hdf5_paged_page_sizes = (2**20, 4 * 2**20, 16 * 2**20)
+hdf5_page_buffer_size = 64 * 2**20
+
+hdf5_paged_open_params = []
+for modality, https_url in (
+    ("Ecephys", hdf5_ecephys_params["https_url_no_redirect"]),
+    ("Ophys", hdf5_ophys_params["https_url_no_redirect"]),
+    ("Icephys", hdf5_icephys_params["https_url_no_redirect"]),
+):
+    hdf5_paged_open_params.append(
+        dict(name=f"{modality}Original", https_url=https_url, page_size=None, page_buffer_size=None)
+    )
+    for page_size in hdf5_paged_page_sizes:
+        hdf5_paged_open_params.append(
+            dict(
+                name=f"{modality}Paged{page_size // 2**20}MiB",
+                https_url=https_url,
+                page_size=page_size,
+                page_buffer_size=hdf5_page_buffer_size,
+            )
+        )
+
+################################### PARALLEL DOWNLOAD PARAMETERS ###################################
+# Each parallel download strategy is run with these numbers of concurrent byte ranges or files (and DANDI jobs)
+download_numbers_of_workers = (1, 4, 16)
+
+hdf5_parallel_download_params = [
+    {**params, "name": f"{params['name']}{number_of_workers}Workers", "number_of_workers": number_of_workers}
+    for params in hdf5_no_redirect_download_params
+    for number_of_workers in download_numbers_of_workers
+]
+zarr_parallel_download_params = [
+    {
+        **params,
+        "name": f"{params['name']}{number_of_workers}Workers",
+        "https_url_direct": zarr_params["https_url_direct"],
+        "number_of_workers": number_of_workers,
+    }
+    for params, zarr_params in zip(
+        zarr_no_redirect_download_params, (zarr_ecephys_params, zarr_ophys_params, zarr_icephys_params)
+    )
+    for number_of_workers in download_numbers_of_workers
+]
+
+################################### PARTIAL DOWNLOAD PARAMETERS ###################################
+# Each partial download reads a set of slices scattered through the data, so that only a few of its chunks are needed
+ecephys_scattered_slices = [
+    ("ElectricalSeries", (slice(262_144 * 4 * i, 262_144 * (4 * i + 1)), slice(0, 32))) for i in range(5)
+]
+ophys_scattered_slices = [
+    ("TwoPhotonSeries", (slice(200 * i, 200 * i + 20), slice(0, 796), slice(0, 512))) for i in range(5)
+]
+icephys_scattered_slices = [("data_00002_AD0", (slice(8192 * 8 * i, 8192 * (8 * i + 1)),)) for i in range(5)]
+
+# The byte ranges are fetched directly from the S3 URL that the DANDI API redirects to
+hdf5_partial_download_params = (
+    dict(
+        name="EcephysTestCase",
+        https_url=hdf5_ecephys_params["https_url_redirected"],
+        slices=ecephys_scattered_slices,
+    ),
+    dict(
+        name="OphysTestCase",
+        https_url=hdf5_ophys_params["https_url_redirected"],
+        slices=ophys_scattered_slices,
+    ),
+    dict(
+        name="IcephysTestCase",
+        https_url=hdf5_icephys_params["https_url_redirected"],
+        slices=icephys_scattered_slices,
+    ),
+)
+zarr_partial_download_params = (
+    dict(
+        name="EcephysTestCase",
+        https_url=zarr_ecephys_params["https_url_direct"],
+        slices=ecephys_scattered_slices,
+    ),
+    dict(
+        name="OphysTestCase",
+        https_url=zarr_ophys_params["https_url_direct"],
+        slices=ophys_scattered_slices,
+    ),
+    dict(
+        name="IcephysTestCase",
+        https_url=zarr_icephys_params["https_url_direct"],
+        slices=icephys_scattered_slices,
+    ),
+)
+
+################################### PREFETCH PARAMETERS ###################################
+# Each window is one chunk along the first axis, e.g., ecephys data has chunk shape (262144, 32)
+prefetch_window_cases = (
+    dict(name="Ecephys", object_name="ElectricalSeries", window_length=262_144, selection=(slice(0, 32),)),
+    dict(name="Ophys", object_name="TwoPhotonSeries", window_length=20, selection=()),
+    dict(name="Icephys", object_name="data_00002_AD0", window_length=8192 * 8, selection=()),
+)
+prefetch_depths = (0, 1, 2, 4)
+
+# The computation on each window is simulated with a fixed duration in seconds
+prefetch_compute_time_per_window = 0.25
+prefetch_number_of_windows = 10
+
+hdf5_prefetch_params = []
+zarr_prefetch_params = []
+for window_case, hdf5_params, zarr_params in zip(
+    prefetch_window_cases,
+    (hdf5_ecephys_params, hdf5_ophys_params, hdf5_icephys_params),
+    (zarr_ecephys_params, zarr_ophys_params, zarr_icephys_params),
+):
+    for prefetch_depth in prefetch_depths:
+        prefetch_params = dict(
+            window_case,
+            name=f"{window_case['name']}TestCaseDepth{prefetch_depth}",
+            prefetch_depth=prefetch_depth,
+            compute_time_per_window=prefetch_compute_time_per_window,
+            number_of_windows=prefetch_number_of_windows,
+        )
+        hdf5_prefetch_params.append(dict(prefetch_params, https_url=hdf5_params["https_url_redirected"]))
+        zarr_prefetch_params.append(dict(prefetch_params, https_url=zarr_params["https_url_direct"]))
+
+################################### CONCURRENT SLICE PARAMETERS ###################################
+# Many small slices of one chunk each, as requested at once by the clients of a service that serves previews of data
+concurrent_slice_cases = (
+    dict(
+        name="EcephysTestCase",
+        object_name="ElectricalSeries",
+        slices=[(slice(262_144 * i, 262_144 * (i + 1)), slice(0, 32)) for i in range(16)],
+    ),
+    dict(
+        name="OphysTestCase",
+        object_name="TwoPhotonSeries",
+        slices=[(slice(20 * i, 20 * (i + 1)), slice(0, 796), slice(0, 512)) for i in range(16)],
+    ),
+    dict(
+        name="IcephysTestCase",
+        object_name="data_00002_AD0",
+        slices=[(slice(8192 * i, 8192 * (i + 1)),) for i in range(16)],
+    ),
+)
+hdf5_concurrent_slice_params = [
+    dict(slice_case, https_url=hdf5_params["https_url_redirected"])
+    for slice_case, hdf5_params in zip(
+        concurrent_slice_cases, (hdf5_ecephys_params, hdf5_ophys_params, hdf5_icephys_params)
+    )
+]
+zarr_concurrent_slice_params = [
+    dict(slice_case, https_url=zarr_params["https_url_direct"])
+    for slice_case, zarr_params in zip(
+        concurrent_slice_cases, (zarr_ecephys_params, zarr_ophys_params, zarr_icephys_params)
+    )
+]
+
+################################### ACCESS PATTERN PARAMETERS ###################################
+# Declarative access patterns, as read by `get_access_pattern_selections`, with the modalities each applies to
+access_patterns = (
+    dict(name="SequentialScan", pattern="sequential_scan", window_duration=1.0, number_of_windows=10),
+    dict(name="SlidingWindow", pattern="sliding_window", window_duration=1.0, overlap=0.5, number_of_windows=10),
+    dict(name="TrialAligned", pattern="trial_aligned", time_before=0.5, time_after=1.0, number_of_trials=10),
+    dict(
+        name="ChannelSubset",
+        pattern="channel_subset",
+        channels=(0, 37, 74, 111, 148, 185, 222, 259, 296, 333),
+        window_duration=1.0,
+        number_of_windows=10,
+        modalities=("Ecephys",),
+    ),
+)
+
+# The downloaded files are served over HTTP from the local machine, to count the bytes that each pattern transfers
+hdf5_access_pattern_params = []
+zarr_access_pattern_params = []
+for modality, object_name, hdf5_params, zarr_params in (
+    ("Ecephys", "ElectricalSeries", hdf5_ecephys_params, zarr_ecephys_params),
+    ("Ophys", "TwoPhotonSeries", hdf5_ophys_params, zarr_ophys_params),
+    ("Icephys", "data_00002_AD0", hdf5_icephys_params, zarr_icephys_params),
+):
+    for access_pattern in access_patterns:
+        if modality not in access_pattern.get("modalities", (modality,)):
+            continue
+        pattern_params = dict(
+            name=f"{modality}{access_pattern['name']}",
+            object_name=object_name,
+            access_pattern={key: value for key, value in access_pattern.items() if key not in ("name", "modalities")},
+        )
+        hdf5_access_pattern_params.append(dict(pattern_params, https_url=hdf5_params["https_url_no_redirect"]))
+        zarr_access_pattern_params.append(dict(pattern_params, https_url=zarr_params["https_url_no_redirect"]))
+
+################################### LATENCY DISTRIBUTION PARAMETERS ###################################
+# Small slices, e.g., about 1 second of ecephys data or a single frame of ophys data, each read at a new position of the
+# data as when browsing it interactively
+latency_number_of_slices = 200
+latency_slice_cases = (
+    dict(name="EcephysTestCase", object_name="ElectricalSeries", slice_length=30_000, selection=(slice(0, 32),)),
+    dict(name="OphysTestCase", object_name="TwoPhotonSeries", slice_length=1, selection=()),
+    dict(name="IcephysTestCase", object_name="data_00002_AD0", slice_length=8192, selection=()),
+)
+hdf5_latency_slice_params = [
+    dict(slice_case, https_url=hdf5_params["https_url_redirected"], number_of_slices=latency_number_of_slices)
+    for slice_case, hdf5_params in zip(
+        latency_slice_cases, (hdf5_ecephys_params, hdf5_ophys_params, hdf5_icephys_params)
+    )
+]
+zarr_latency_slice_params = [
+    dict(slice_case, https_url=zarr_params["https_url_direct"], number_of_slices=latency_number_of_slices)
+    for slice_case, zarr_params in zip(
+        latency_slice_cases, (zarr_ecephys_params, zarr_ophys_params, zarr_icephys_params)
+    )
+]
+
+################################### TIME TO FIRST PLOT PARAMETERS ###################################
+# The first screen of a viewer of NWB files: about 1 second of all channels of ecephys data, or a single ophys frame
+first_plot_cases = (
+    dict(name="EcephysTestCase", object_name="ElectricalSeries", first_screen=(slice(0, 30_000), slice(0, 384))),
+    dict(name="OphysTestCase", object_name="TwoPhotonSeries", first_screen=(slice(0, 1), slice(0, 796), slice(0, 512))),
+)
+hdf5_first_plot_params = [
+    dict(first_plot_case, https_url=hdf5_params["https_url_redirected"])
+    for first_plot_case, hdf5_params in zip(first_plot_cases, (hdf5_ecephys_params, hdf5_ophys_params))
+]
+zarr_first_plot_params = [
+    dict(first_plot_case, https_url=zarr_params["https_url_direct"])
+    for first_plot_case, zarr_params in zip(first_plot_cases, (zarr_ecephys_params, zarr_ophys_params))
+]
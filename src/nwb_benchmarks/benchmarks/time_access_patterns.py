@@ -0,0 +1,188 @@
+"""
+Benchmarks for timing realistic access patterns to the data of a time series, e.g., a scan of a recording in windows of
+1 second or snippets aligned to trials, through each streaming method.
+
+The access patterns are declared in `params.py` and turned into the selections they read by
+`get_access_pattern_selections`. The downloaded files are served over HTTP from the local machine, which counts the
+bytes and the requests of each pattern; these are compared to the bytes of the selections themselves as a read
+amplification. The S3 variants of the streaming methods are not included, as they can only read from S3 itself.
+"""
+
+import shutil
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict
+
+import h5py
+import zarr
+from asv_runner.benchmarks.mark import SkipNotImplemented, skip_benchmark_if
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    LocalFileServer,
+    build_object_path_index,
+    compute_read_amplification,
+    get_access_pattern_selections,
+    get_asset_path_from_url,
+    get_dataset_by_name,
+    read_hdf5_h5py_fsspec_https_no_cache,
+    read_hdf5_h5py_fsspec_https_with_cache,
+    read_hdf5_h5py_remfile_no_cache,
+    read_hdf5_h5py_remfile_with_cache,
+    read_hdf5_h5py_ros3,
+    read_zarr_zarrpython_https,
+)
+from nwb_benchmarks.setup import get_persistent_download_directory
+
+from .params import hdf5_access_pattern_params, zarr_access_pattern_params
+
+
+def _close_read_outputs(read_outputs: tuple):
+    """Close the files, byte streams, and temporary directories returned by a streaming method."""
+    for read_output in read_outputs:
+        if isinstance(read_output, tempfile.TemporaryDirectory):
+            shutil.rmtree(path=read_output.name, ignore_errors=True)
+            read_output.cleanup()
+        elif hasattr(read_output, "close"):
+            read_output.close()
+
+
+class BaseAccessPatternBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for timing an access pattern to the data of a downloaded file served over HTTP, with each streaming
+    method in `streaming_methods`.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    # The streaming methods to open the served file with, by name; each returns the opened file first
+    streaming_methods: Dict[str, Callable[[str], tuple]] = dict()
+
+    @abstractmethod
+    def open_local_file(self) -> h5py.File | zarr.Group:
+        """Open the downloaded file, to compute the selections of the access pattern without any network access."""
+        pass
+
+    def setup(self, params: dict[str, str | dict]):
+        self.file_path = get_persistent_download_directory() / get_asset_path_from_url(https_url=params["https_url"])
+        if not self.file_path.exists():
+            raise SkipNotImplemented(f"Expected the asset {self.file_path} to be downloaded to serve it.")
+
+        local_file = self.open_local_file()
+        dataset = get_dataset_by_name(
+            file=local_file, object_name=params["object_name"], object_path_index=build_object_path_index(local_file)
+        )
+        try:
+            self.selections = get_access_pattern_selections(
+                file=local_file, dataset=dataset, access_pattern=params["access_pattern"]
+            )
+        except ValueError as exception:
+            raise SkipNotImplemented(str(exception))
+        self.bytes_used = sum(dataset[selection].nbytes for selection in self.selections)
+
+        self.server = LocalFileServer(directory=self.file_path.parent)
+        self.server.start()
+        self.https_url = self.server.get_url(file_path=self.file_path)
+        self.read_outputs = tuple()
+
+    def teardown(self, params: dict[str, str | dict]):
+        _close_read_outputs(read_outputs=self.read_outputs)
+        self.server.stop()
+
+    def _open_dataset(self, method_name: str, params: dict[str, str | dict]):
+        """Open the served file with a streaming method and get the dataset of the access pattern."""
+        read_outputs = self.streaming_methods[method_name](https_url=self.https_url)
+        self.read_outputs = read_outputs if isinstance(read_outputs, tuple) else (read_outputs,)
+        file = self.read_outputs[0]
+        return get_dataset_by_name(
+            file=file, object_name=params["object_name"], object_path_index=build_object_path_index(file=file)
+        )
+
+    def _run_access_pattern(self, dataset):
+        self._temp = [dataset[selection] for selection in self.selections]
+
+    def track_access_pattern(self, params: dict[str, str | dict]):
+        """
+        Track the time and the bytes transferred by the access pattern with each streaming method, and its read
+        amplification over the bytes of the selections read (see `compute_read_amplification`).
+
+        The file is opened, and the dataset located, before the time and the bytes are counted.
+        """
+        samples = dict()
+        for method_name in self.streaming_methods:
+            if method_name == "ros3" and not h5py.get_config().ros3:
+                continue
+
+            dataset = self._open_dataset(method_name=method_name, params=params)
+            self.server.reset_statistics()
+            start_time = time.perf_counter()
+            self._run_access_pattern(dataset=dataset)
+            samples[f"{method_name}_time"] = [time.perf_counter() - start_time]
+            samples[f"{method_name}_bytes"] = [self.server.bytes_sent]
+            read_amplification = compute_read_amplification(
+                logical_bytes=self.bytes_used,
+                transferred_bytes=self.server.bytes_sent,
+                number_of_requests=self.server.number_of_requests,
+            )
+            samples.update({f"{method_name}_{key}": [value] for key, value in read_amplification.items()})
+
+            _close_read_outputs(read_outputs=self.read_outputs)
+            self.read_outputs = tuple()
+        return dict(samples=samples, number=None)
+
+
+class HDF5H5pyAccessPatternBenchmark(BaseAccessPatternBenchmark):
+    """Time access patterns to the data of downloaded HDF5 NWB files served over HTTP, using h5py."""
+
+    params = hdf5_access_pattern_params
+    streaming_methods = dict(
+        fsspec_https_no_cache=read_hdf5_h5py_fsspec_https_no_cache,
+        fsspec_https_with_cache=read_hdf5_h5py_fsspec_https_with_cache,
+        remfile_no_cache=read_hdf5_h5py_remfile_no_cache,
+        remfile_with_cache=read_hdf5_h5py_remfile_with_cache,
+        ros3=read_hdf5_h5py_ros3,
+    )
+
+    def open_local_file(self) -> h5py.File:
+        self.local_file = h5py.File(name=self.file_path, mode="r")
+        return self.local_file
+
+    def teardown(self, params: dict[str, str | dict]):
+        super().teardown(params=params)
+        self.local_file.close()
+
+    def time_access_pattern_fsspec_https_no_cache(self, params: dict[str, str | dict]):
+        """Open a served HDF5 file using h5py and fsspec with HTTPS without cache, and run the access pattern."""
+        self._run_access_pattern(dataset=self._open_dataset(method_name="fsspec_https_no_cache", params=params))
+
+    def time_access_pattern_fsspec_https_with_cache(self, params: dict[str, str | dict]):
+        """Open a served HDF5 file using h5py and fsspec with HTTPS with cache, and run the access pattern."""
+        self._run_access_pattern(dataset=self._open_dataset(method_name="fsspec_https_with_cache", params=params))
+
+    def time_access_pattern_remfile_no_cache(self, params: dict[str, str | dict]):
+        """Open a served HDF5 file using h5py and remfile without cache, and run the access pattern."""
+        self._run_access_pattern(dataset=self._open_dataset(method_name="remfile_no_cache", params=params))
+
+    def time_access_pattern_remfile_with_cache(self, params: dict[str, str | dict]):
+        """Open a served HDF5 file using h5py and remfile with cache, and run the access pattern."""
+        self._run_access_pattern(dataset=self._open_dataset(method_name="remfile_with_cache", params=params))
+
+    @skip_benchmark_if(not h5py.get_config().ros3)
+    def time_access_pattern_ros3(self, params: dict[str, str | dict]):
+        """Open a served HDF5 file using h5py and the ROS3 HDF5 driver, and run the access pattern."""
+        self._run_access_pattern(dataset=self._open_dataset(method_name="ros3", params=params))
+
+
+class ZarrAccessPatternBenchmark(BaseAccessPatternBenchmark):
+    """Time access patterns to the data of downloaded Zarr NWB files served over HTTP, using Zarr-Python."""
+
+    params = zarr_access_pattern_params
+    streaming_methods = dict(zarrpython_https=read_zarr_zarrpython_https)
+
+    def open_local_file(self) -> zarr.Group:
+        return zarr.open(store=str(self.file_path), mode="r")
+
+    def time_access_pattern_zarrpython_https(self, params: dict[str, str | dict]):
+        """Open a served Zarr file using Zarr-Python with HTTPS, and run the access pattern."""
+        self._run_access_pattern(dataset=self._open_dataset(method_name="zarrpython_https", params=params))
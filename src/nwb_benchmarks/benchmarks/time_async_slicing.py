@@ -0,0 +1,155 @@
+"""
+Benchmarks for timing many slices of a remote dataset read concurrently from asyncio code, against reading the same
+slices one at a time with the synchronous fsspec and Zarr-Python readers.
+
+The asynchronous reads run on a single event loop, as in a web service built on asyncio, and are issued all at once
+with `asyncio.gather`; the latency of each slice is the time from issuing all reads until that slice is read.
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Any, List, Tuple
+
+from fsspec.implementations.http import HTTPFileSystem
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    get_dataset_by_name,
+    get_object_path_index,
+    open_hdf5_dataset_async,
+    open_zarr_array_async,
+    read_hdf5_h5py_fsspec_https_no_cache,
+    read_zarr_zarrpython_https,
+)
+
+from .params import hdf5_concurrent_slice_params, zarr_concurrent_slice_params
+
+
+async def _create_async_https_filesystem() -> HTTPFileSystem:
+    # The filesystem (and its session) must be created within the event loop that uses it
+    return HTTPFileSystem(asynchronous=True, skip_instance_cache=True)
+
+
+async def _close_async_https_filesystem(filesystem: HTTPFileSystem):
+    session = await filesystem.set_session()
+    await session.close()
+
+
+class BaseAsyncSliceBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for timing many slices of a remote dataset read one at a time synchronously, and concurrently on an
+    event loop.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    @abstractmethod
+    def open_sync_dataset(self, params: dict[str, str | List[Tuple[slice, ...]]]) -> Any:
+        """Open the remote file with a synchronous reader and return the dataset to slice."""
+        pass
+
+    @abstractmethod
+    async def open_async_dataset(self, params: dict[str, str | List[Tuple[slice, ...]]]) -> Any:
+        """Open the remote file with `self.filesystem` and return a dataset with an awaitable `getitem` method."""
+        pass
+
+    def setup(self, params: dict[str, str | List[Tuple[slice, ...]]]):
+        self.sync_dataset = self.open_sync_dataset(params=params)
+
+        self.loop = asyncio.new_event_loop()
+        self.filesystem = self.loop.run_until_complete(_create_async_https_filesystem())
+        self.async_dataset = self.loop.run_until_complete(self.open_async_dataset(params=params))
+
+    def teardown(self, params: dict[str, str | List[Tuple[slice, ...]]]):
+        if hasattr(self.async_dataset, "close"):
+            self.async_dataset.close()
+        self.loop.run_until_complete(_close_async_https_filesystem(filesystem=self.filesystem))
+        self.loop.close()
+
+    async def _read_slices_concurrently(self, slices: List[Tuple[slice, ...]]) -> List[Tuple[Any, float]]:
+        """Read all slices concurrently, and return each with the time from the start until it was read."""
+        start_time = time.perf_counter()
+
+        async def read_slice(slice_range: Tuple[slice, ...]) -> Tuple[Any, float]:
+            data = await self.async_dataset.getitem(slice_range)
+            return data, time.perf_counter() - start_time
+
+        return await asyncio.gather(*(read_slice(slice_range=slice_range) for slice_range in slices))
+
+    def time_slices_sync(self, params: dict[str, str | List[Tuple[slice, ...]]]):
+        """Read the slices one at a time with the synchronous reader."""
+        self._temp = [self.sync_dataset[slice_range] for slice_range in params["slices"]]
+
+    def time_slices_async_gather(self, params: dict[str, str | List[Tuple[slice, ...]]]):
+        """Read the slices concurrently with `asyncio.gather` on the event loop."""
+        self._temp = self.loop.run_until_complete(self._read_slices_concurrently(slices=params["slices"]))
+
+    def track_slice_latency_and_throughput(self, params: dict[str, str | List[Tuple[slice, ...]]]):
+        """
+        Track the mean and maximum latency of the slices, and the throughput in megabytes per second of reading all of
+        them, both synchronously and concurrently.
+        """
+        start_time = time.perf_counter()
+        sync_latencies = []
+        number_of_bytes = 0
+        for slice_range in params["slices"]:
+            number_of_bytes += self.sync_dataset[slice_range].nbytes
+            sync_latencies.append(time.perf_counter() - start_time)
+
+        async_results = self.loop.run_until_complete(self._read_slices_concurrently(slices=params["slices"]))
+        async_latencies = [latency for _, latency in async_results]
+
+        samples = dict()
+        for mode, latencies in (("sync", sync_latencies), ("async", async_latencies)):
+            samples[f"{mode}_mean_latency"] = [sum(latencies) / len(latencies)]
+            samples[f"{mode}_max_latency"] = [max(latencies)]
+            samples[f"{mode}_megabytes_per_second"] = [number_of_bytes / 1e6 / max(latencies)]
+        return dict(samples=samples, number=None)
+
+
+class HDF5FsspecAsyncSliceBenchmark(BaseAsyncSliceBenchmark):
+    """
+    Time many slices of a remote HDF5 NWB file read one at a time with h5py and fsspec (without cache), and
+    concurrently with their chunks fetched by the async HTTPS filesystem of fsspec.
+    """
+
+    params = hdf5_concurrent_slice_params
+
+    def open_sync_dataset(self, params: dict[str, str | List[Tuple[slice, ...]]]):
+        self.file, self.bytestream = read_hdf5_h5py_fsspec_https_no_cache(https_url=params["https_url"])
+        object_path_index = get_object_path_index(file=self.file, https_url=params["https_url"])
+        return get_dataset_by_name(
+            file=self.file, object_name=params["object_name"], object_path_index=object_path_index
+        )
+
+    async def open_async_dataset(self, params: dict[str, str | List[Tuple[slice, ...]]]):
+        return await open_hdf5_dataset_async(
+            https_url=params["https_url"], object_name=params["object_name"], filesystem=self.filesystem
+        )
+
+    def teardown(self, params: dict[str, str | List[Tuple[slice, ...]]]):
+        super().teardown(params=params)
+        self.file.close()
+        self.bytestream.close()
+
+
+class ZarrHTTPSAsyncSliceBenchmark(BaseAsyncSliceBenchmark):
+    """
+    Time many slices of a remote Zarr NWB file read one at a time with Zarr-Python over HTTPS, and concurrently with
+    the async HTTPS filesystem of fsspec (or the native asynchronous arrays of Zarr-Python 3).
+    """
+
+    params = zarr_concurrent_slice_params
+
+    def open_sync_dataset(self, params: dict[str, str | List[Tuple[slice, ...]]]):
+        self.zarr_file = read_zarr_zarrpython_https(https_url=params["https_url"])
+        object_path_index = get_object_path_index(file=self.zarr_file, https_url=params["https_url"])
+        return get_dataset_by_name(
+            file=self.zarr_file, object_name=params["object_name"], object_path_index=object_path_index
+        )
+
+    async def open_async_dataset(self, params: dict[str, str | List[Tuple[slice, ...]]]):
+        return await open_zarr_array_async(
+            https_url=params["https_url"], object_name=params["object_name"], filesystem=self.filesystem
+        )
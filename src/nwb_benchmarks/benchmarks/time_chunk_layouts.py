@@ -0,0 +1,125 @@
+"""
+Benchmarks for timing slices of the benchmarked data when rewritten locally with a grid of chunk shapes and codecs.
+
+The data of each downloaded HDF5 file is rewritten to both HDF5 and Zarr, so that layouts can be compared for the same
+slices. Beyond the time of the slices, the stored bytes of the chunks that each slice touches are tracked, along with
+the time to read those chunks without decoding them, which leaves the time to decode and assemble the slice.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+import h5py
+import zarr
+from asv_runner.benchmarks.mark import SkipNotImplemented
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    get_chunk_indices,
+    get_chunk_layout_copy,
+    read_raw_chunks,
+)
+
+from .params import chunk_layout_slice_params
+
+
+class ChunkLayoutSliceBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for benchmarking slices of data rewritten with a chunk shape and codec.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = chunk_layout_slice_params
+
+    # The rewrite of each layout is created from the downloaded file on first use
+    timeout = 60 * 60
+
+    backend: str
+
+    @abstractmethod
+    def open_data(self):
+        """Open the rewritten file at `self.file_path` and set `self.data_to_slice` to its data."""
+        pass
+
+    def setup(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        try:
+            self.file_path = get_chunk_layout_copy(
+                https_url=params["https_url"],
+                object_name=params["object_name"],
+                backend=self.backend,
+                chunk_shape=params["chunk_shape"],
+                codec=params["codec"],
+                number_of_rows=params["number_of_rows"],
+            )
+        except (FileNotFoundError, ImportError) as exception:
+            raise SkipNotImplemented(str(exception))
+
+        self.open_data()
+        self.chunk_indices = get_chunk_indices(dataset=self.data_to_slice, slice_range=params["slice_range"])
+
+    def teardown(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        if hasattr(self, "file"):
+            self.file.close()
+
+    def time_slice(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        """Slice a range of the rewritten data."""
+        self._temp = self.data_to_slice[params["slice_range"]]
+
+    def time_read_raw_chunks(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        """Read the stored bytes of the chunks touched by the slice without decoding them."""
+        self._temp = read_raw_chunks(dataset=self.data_to_slice, chunk_indices=self.chunk_indices)
+
+    def track_layout_statistics(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        """
+        Track the bytes read for the slice and the split of its time between reading and decoding the chunks.
+
+        The decode time is the difference between the time of the slice and of reading the same chunks undecoded.
+        """
+        start_time = time.perf_counter()
+        self._temp = read_raw_chunks(dataset=self.data_to_slice, chunk_indices=self.chunk_indices)
+        raw_chunk_read_time = time.perf_counter() - start_time
+        stored_bytes_read = sum(len(raw_chunk) for raw_chunk in self._temp)
+
+        start_time = time.perf_counter()
+        self._temp = self.data_to_slice[params["slice_range"]]
+        slice_time = time.perf_counter() - start_time
+
+        chunk_size = self.data_to_slice.dtype.itemsize
+        for chunk_length in self.data_to_slice.chunks:
+            chunk_size *= chunk_length
+
+        samples = dict(
+            number_of_chunks_read=[len(self.chunk_indices)],
+            stored_bytes_read=[stored_bytes_read],
+            compression_ratio=[chunk_size * len(self.chunk_indices) / stored_bytes_read],
+            slice_time=[slice_time],
+            raw_chunk_read_time=[raw_chunk_read_time],
+            decode_time=[max(0.0, slice_time - raw_chunk_read_time)],
+        )
+        return dict(samples=samples, number=None)
+
+
+class HDF5H5pyChunkLayoutSliceBenchmark(ChunkLayoutSliceBenchmark):
+    """
+    Time slices of data rewritten to a local HDF5 file with a chunk shape and codec, using h5py.
+
+    Blosc codecs require hdf5plugin, and are skipped if it is not installed.
+    """
+
+    backend = "hdf5"
+
+    def open_data(self):
+        self.file = h5py.File(name=self.file_path, mode="r")
+        self.data_to_slice = self.file["data"]
+
+
+class ZarrZarrPythonChunkLayoutSliceBenchmark(ChunkLayoutSliceBenchmark):
+    """Time slices of data rewritten to a local Zarr store with a chunk shape and codec, using Zarr-Python."""
+
+    backend = "zarr"
+
+    def open_data(self):
+        self.zarr_file = zarr.open(store=str(self.file_path), mode="r")
+        self.data_to_slice = self.zarr_file["data"]
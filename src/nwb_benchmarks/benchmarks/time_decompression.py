@@ -0,0 +1,187 @@
+"""
+Benchmarks for timing the decompression of chunks of the benchmarked data, isolated from fetching them.
+
+The raw (still compressed) chunks are read into memory in the setup from the local rewrites of the `time_chunk_layouts`
+benchmarks, so that only decoding them is timed. This attributes changes in the time of slices to either the codec or
+the transport. The HDF5 benchmarks also compare decoding the raw chunks directly with reading the same chunks through
+the filter pipeline of HDF5.
+"""
+
+import concurrent.futures
+import time
+from typing import Tuple
+
+import h5py
+import numcodecs.blosc
+import zarr
+from asv_runner.benchmarks.mark import SkipNotImplemented
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    decode_chunks,
+    get_chunk_codec,
+    get_chunk_indices,
+    get_chunk_layout_copy,
+    read_raw_chunks,
+)
+
+from .params import (
+    blosc_threaded_chunk_decompression_params,
+    chunk_decompression_params,
+    threaded_chunk_decompression_params,
+)
+
+
+def _get_chunk_layout_copy(backend: str, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+    try:
+        return get_chunk_layout_copy(
+            https_url=params["https_url"],
+            object_name=params["object_name"],
+            backend=backend,
+            chunk_shape=params["chunk_shape"],
+            codec=params["codec"],
+            number_of_rows=params["number_of_rows"],
+        )
+    except (FileNotFoundError, ImportError) as exception:
+        raise SkipNotImplemented(str(exception))
+
+
+class ChunkDecompressionBenchmark(BaseBenchmark):
+    """
+    Time decoding in-memory chunks with each codec, spread over a pool of threads that each decode whole chunks.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = threaded_chunk_decompression_params
+
+    # The rewrite of each layout is created from the downloaded file on first use
+    timeout = 60 * 60
+
+    def setup(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        file_path = _get_chunk_layout_copy(backend="zarr", params=params)
+        array = zarr.open(store=str(file_path), mode="r")["data"]
+        self.raw_chunks = read_raw_chunks(
+            dataset=array, chunk_indices=get_chunk_indices(dataset=array, slice_range=params["slice_range"])
+        )
+        self.codec = array.compressor
+
+        # Keep Blosc to a single thread per chunk, so that the parallelism only comes from the pool
+        self.blosc_use_threads = numcodecs.blosc.use_threads
+        numcodecs.blosc.use_threads = False
+        self.executor = None
+        if params["number_of_threads"] > 1:
+            self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=params["number_of_threads"])
+
+    def teardown(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        numcodecs.blosc.use_threads = self.blosc_use_threads
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def time_decode_chunks(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        """Decode all of the chunks."""
+        self._temp = decode_chunks(raw_chunks=self.raw_chunks, codec=self.codec, executor=self.executor)
+
+    def track_decode_throughput(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        """Track the throughput of decoding all of the chunks, in megabytes of compressed and decoded data per second."""
+        start_time = time.perf_counter()
+        self._temp = decode_chunks(raw_chunks=self.raw_chunks, codec=self.codec, executor=self.executor)
+        decode_time = time.perf_counter() - start_time
+
+        compressed_megabytes = sum(len(raw_chunk) for raw_chunk in self.raw_chunks) / 1e6
+        decoded_megabytes = sum(len(memoryview(decoded_chunk).cast("B")) for decoded_chunk in self._temp) / 1e6
+        samples = dict(
+            decode_time=[decode_time],
+            compressed_megabytes_per_second=[compressed_megabytes / decode_time],
+            decoded_megabytes_per_second=[decoded_megabytes / decode_time],
+        )
+        return dict(samples=samples, number=None)
+
+
+class BloscThreadsChunkDecompressionBenchmark(ChunkDecompressionBenchmark):
+    """
+    Time decoding in-memory Blosc chunks one after the other, with each chunk decoded by multiple Blosc threads.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = blosc_threaded_chunk_decompression_params
+
+    def setup(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        super().setup(params={**params, "number_of_threads": 1})
+        numcodecs.blosc.use_threads = True
+        self.blosc_number_of_threads = numcodecs.blosc.set_nthreads(params["number_of_threads"])
+
+    def teardown(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        numcodecs.blosc.set_nthreads(self.blosc_number_of_threads)
+        super().teardown(params=params)
+
+
+class HDF5FilterPipelineBenchmark(BaseBenchmark):
+    """
+    Time reading chunks of a local HDF5 file through the filter pipeline of HDF5, against reading them raw and decoding
+    them separately.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = chunk_decompression_params
+
+    # The rewrite of each layout is created from the downloaded file on first use
+    timeout = 60 * 60
+
+    def setup(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        file_path = _get_chunk_layout_copy(backend="hdf5", params=params)
+        self.file = h5py.File(name=file_path, mode="r")
+        self.dataset = self.file["data"]
+        self.chunk_indices = get_chunk_indices(dataset=self.dataset, slice_range=params["slice_range"])
+        self.chunk_selections = [
+            tuple(
+                slice(index * chunk_length, (index + 1) * chunk_length)
+                for index, chunk_length in zip(chunk_index, self.dataset.chunks)
+            )
+            for chunk_index in self.chunk_indices
+        ]
+        self.codec = get_chunk_codec(codec=params["codec"])
+        self.raw_chunks = read_raw_chunks(dataset=self.dataset, chunk_indices=self.chunk_indices)
+
+    def teardown(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        self.file.close()
+
+    def time_read_chunks_through_filter_pipeline(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        """Read each chunk through h5py, which decodes it in the filter pipeline of HDF5."""
+        self._temp = [self.dataset[chunk_selection] for chunk_selection in self.chunk_selections]
+
+    def time_read_raw_chunks(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        """Read each chunk without decoding it."""
+        self._temp = read_raw_chunks(dataset=self.dataset, chunk_indices=self.chunk_indices)
+
+    def time_decode_chunks(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        """Decode the raw chunks, which were read into memory beforehand, with numcodecs."""
+        self._temp = decode_chunks(raw_chunks=self.raw_chunks, codec=self.codec)
+
+    def track_filter_pipeline_overhead(self, params: dict[str, str | int | Tuple[slice] | Tuple[int, ...]]):
+        """
+        Track the time of reading the chunks through the filter pipeline beyond reading them raw and decoding them.
+
+        Includes the time of the selections of h5py and of copying the decoded chunks into the output arrays.
+        """
+        start_time = time.perf_counter()
+        self.time_read_chunks_through_filter_pipeline(params=params)
+        filter_pipeline_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        self.time_read_raw_chunks(params=params)
+        raw_chunk_read_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        self.time_decode_chunks(params=params)
+        decode_time = time.perf_counter() - start_time
+
+        samples = dict(
+            filter_pipeline_time=[filter_pipeline_time],
+            raw_chunk_read_time=[raw_chunk_read_time],
+            decode_time=[decode_time],
+            filter_pipeline_overhead=[filter_pipeline_time - raw_chunk_read_time - decode_time],
+        )
+        return dict(samples=samples, number=None)
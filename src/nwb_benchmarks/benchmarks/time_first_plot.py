@@ -0,0 +1,227 @@
+"""
+Benchmarks for the time from the URL of a remote NWB file to the data of the first screen of a viewer of the file.
+
+A viewer opens the file, reads the metadata it displays (e.g., the session and the electrodes of a recording), and
+then reads the first window of data to plot. These phases run one after another on the same opened file, so that any
+caching shared between them (e.g., of the pages read when opening the file) is included, unlike when adding up the
+times of the separate file reading and slicing benchmarks. The time and the network activity of each phase are tracked
+separately, as the network tracker adds its own overhead to the time.
+"""
+
+import shutil
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, List, Tuple
+
+import pynwb
+from asv_runner.benchmarks.mark import skip_benchmark_if
+
+from nwb_benchmarks import TSHARK_PATH
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    count_http_requests,
+    get_object_by_name,
+    network_activity_tracker,
+    read_hdf5_pynwb_fsspec_https_no_cache,
+    read_hdf5_pynwb_fsspec_https_with_cache,
+    read_hdf5_pynwb_fsspec_s3_no_cache,
+    read_hdf5_pynwb_fsspec_s3_with_cache,
+    read_hdf5_pynwb_remfile_no_cache,
+    read_hdf5_pynwb_remfile_with_cache,
+    read_hdf5_pynwb_ros3,
+    read_zarr_pynwb_s3,
+)
+
+from .params import hdf5_first_plot_params, zarr_first_plot_params
+
+
+def _read_displayed_metadata(nwbfile: pynwb.NWBFile, neurodata_object: pynwb.TimeSeries) -> dict:
+    """Read the metadata that a viewer displays along with the first screen of a time series."""
+    metadata = dict(
+        session_description=nwbfile.session_description,
+        session_start_time=nwbfile.session_start_time,
+        shape=neurodata_object.data.shape,
+        dtype=neurodata_object.data.dtype,
+        unit=neurodata_object.unit,
+        rate=neurodata_object.rate,
+        starting_time=neurodata_object.starting_time,
+    )
+    if neurodata_object.timestamps is not None:
+        metadata["first_timestamp"] = neurodata_object.timestamps[0]
+    if isinstance(neurodata_object, pynwb.ecephys.ElectricalSeries):
+        metadata["electrodes"] = neurodata_object.electrodes.to_dataframe()
+    return metadata
+
+
+class FirstPlotBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for the time to the first screen of data of a remote NWB file, with a breakdown by phase.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    # Whether the HTTP requests of the streaming method are sent through urllib3 or aiohttp, and so can be counted
+    counts_http_requests: bool = True
+
+    @abstractmethod
+    def open_nwbfile(self, https_url: str) -> pynwb.NWBFile:
+        """Open the remote NWB file, storing the objects that must be closed in the teardown, and return it."""
+        pass
+
+    def teardown(self, params: dict[str, str | Tuple[slice]]):
+        if hasattr(self, "io"):
+            self.io.close()
+        if hasattr(self, "file"):
+            self.file.close()
+        if hasattr(self, "bytestream"):
+            self.bytestream.close()
+        if hasattr(self, "tmpdir"):
+            shutil.rmtree(path=self.tmpdir.name, ignore_errors=True)
+            self.tmpdir.cleanup()
+
+    def _get_phases(self, params: dict[str, str | Tuple[slice]]) -> List[Tuple[str, Callable[[], None]]]:
+        """Get the phases from the URL to the first screen of data, by name and in order."""
+
+        def open_file():
+            self.nwbfile = self.open_nwbfile(https_url=params["https_url"])
+
+        def read_metadata():
+            self.neurodata_object = get_object_by_name(nwbfile=self.nwbfile, object_name=params["object_name"])
+            self.metadata = _read_displayed_metadata(nwbfile=self.nwbfile, neurodata_object=self.neurodata_object)
+
+        def read_first_screen():
+            self._temp = self.neurodata_object.data[params["first_screen"]]
+
+        return [("open", open_file), ("metadata", read_metadata), ("first_screen", read_first_screen)]
+
+    def time_first_plot(self, params: dict[str, str | Tuple[slice]]):
+        """Open a remote NWB file, read the displayed metadata, and read the first screen of data."""
+        for _, run_phase in self._get_phases(params=params):
+            run_phase()
+
+    def track_first_plot_phases(self, params: dict[str, str | Tuple[slice]]):
+        """Track the time of each phase from the URL to the first screen of data, and their total."""
+        samples = dict()
+        for phase_name, run_phase in self._get_phases(params=params):
+            start_time = time.perf_counter()
+            run_phase()
+            samples[f"{phase_name}_time"] = [time.perf_counter() - start_time]
+        samples["total_time"] = [sum(phase_times[0] for phase_times in samples.values())]
+        return dict(samples=samples, number=None)
+
+    @skip_benchmark_if(TSHARK_PATH is None)
+    def track_network_during_first_plot(self, params: dict[str, str | Tuple[slice]]):
+        """Track the bytes downloaded, and the HTTP requests sent where they can be counted, by each phase."""
+        samples = dict()
+        for phase_name, run_phase in self._get_phases(params=params):
+            with network_activity_tracker(tshark_path=TSHARK_PATH) as network_tracker, count_http_requests() as counter:
+                run_phase()
+            samples[f"{phase_name}_downloaded_bytes"] = [
+                network_tracker.network_statistics["amount_downloaded_in_bytes"]
+            ]
+            if self.counts_http_requests:
+                samples[f"{phase_name}_requests"] = [counter.number_of_requests]
+        return dict(samples=samples, number=None)
+
+
+class HDF5PyNWBFsspecHttpsNoCacheFirstPlotBenchmark(FirstPlotBenchmark):
+    """
+    Time the first screen of data of remote HDF5 NWB files using pynwb and fsspec with HTTPS without cache.
+    """
+
+    params = hdf5_first_plot_params
+
+    def open_nwbfile(self, https_url: str) -> pynwb.NWBFile:
+        nwbfile, self.io, self.file, self.bytestream = read_hdf5_pynwb_fsspec_https_no_cache(https_url=https_url)
+        return nwbfile
+
+
+class HDF5PyNWBFsspecHttpsWithCacheFirstPlotBenchmark(FirstPlotBenchmark):
+    """
+    Time the first screen of data of remote HDF5 NWB files using pynwb and fsspec with HTTPS with cache.
+    """
+
+    params = hdf5_first_plot_params
+
+    def open_nwbfile(self, https_url: str) -> pynwb.NWBFile:
+        nwbfile, self.io, self.file, self.bytestream, self.tmpdir = read_hdf5_pynwb_fsspec_https_with_cache(
+            https_url=https_url
+        )
+        return nwbfile
+
+
+class HDF5PyNWBFsspecS3NoCacheFirstPlotBenchmark(FirstPlotBenchmark):
+    """
+    Time the first screen of data of remote HDF5 NWB files using pynwb and fsspec with S3 without cache.
+    """
+
+    params = hdf5_first_plot_params
+
+    def open_nwbfile(self, https_url: str) -> pynwb.NWBFile:
+        nwbfile, self.io, self.file, self.bytestream = read_hdf5_pynwb_fsspec_s3_no_cache(https_url=https_url)
+        return nwbfile
+
+
+class HDF5PyNWBFsspecS3WithCacheFirstPlotBenchmark(FirstPlotBenchmark):
+    """
+    Time the first screen of data of remote HDF5 NWB files using pynwb and fsspec with S3 with cache.
+    """
+
+    params = hdf5_first_plot_params
+
+    def open_nwbfile(self, https_url: str) -> pynwb.NWBFile:
+        nwbfile, self.io, self.file, self.bytestream, self.tmpdir = read_hdf5_pynwb_fsspec_s3_with_cache(
+            https_url=https_url
+        )
+        return nwbfile
+
+
+class HDF5PyNWBRemfileNoCacheFirstPlotBenchmark(FirstPlotBenchmark):
+    """
+    Time the first screen of data of remote HDF5 NWB files using pynwb and remfile without cache.
+    """
+
+    params = hdf5_first_plot_params
+
+    def open_nwbfile(self, https_url: str) -> pynwb.NWBFile:
+        nwbfile, self.io, self.file, self.bytestream = read_hdf5_pynwb_remfile_no_cache(https_url=https_url)
+        return nwbfile
+
+
+class HDF5PyNWBRemfileWithCacheFirstPlotBenchmark(FirstPlotBenchmark):
+    """
+    Time the first screen of data of remote HDF5 NWB files using pynwb and remfile with cache.
+    """
+
+    params = hdf5_first_plot_params
+
+    def open_nwbfile(self, https_url: str) -> pynwb.NWBFile:
+        nwbfile, self.io, self.file, self.bytestream, self.tmpdir = read_hdf5_pynwb_remfile_with_cache(
+            https_url=https_url
+        )
+        return nwbfile
+
+
+class HDF5PyNWBROS3FirstPlotBenchmark(FirstPlotBenchmark):
+    """
+    Time the first screen of data of remote HDF5 NWB files using pynwb and the ROS3 driver.
+    """
+
+    params = hdf5_first_plot_params
+    counts_http_requests = False
+
+    def open_nwbfile(self, https_url: str) -> pynwb.NWBFile:
+        nwbfile, self.io, _ = read_hdf5_pynwb_ros3(https_url=https_url)
+        return nwbfile
+
+
+class ZarrPyNWBS3FirstPlotBenchmark(FirstPlotBenchmark):
+    """
+    Time the first screen of data of remote Zarr NWB files using pynwb with S3.
+    """
+
+    params = zarr_first_plot_params
+
+    def open_nwbfile(self, https_url: str) -> pynwb.NWBFile:
+        nwbfile, self.io = read_zarr_pynwb_s3(https_url=https_url, mode="r")
+        return nwbfile
@@ -0,0 +1,20 @@
+"""Benchmarks for timing the cold import of this package and of the NWB reading libraries."""
+
+from nwb_benchmarks.core import BaseBenchmark
+
+from .params import import_params
+
+
+class ImportBenchmark(BaseBenchmark):
+    """
+    Time the import of a package in a fresh interpreter, so that none of its dependencies are already imported.
+
+    This is the startup cost paid by every benchmark process and every command line call.
+    """
+
+    params = import_params
+    repeat = 5  # Imports are fast relative to the other benchmarks, but sensitive to the state of the file system cache
+
+    def timeraw_import(self, params: dict[str, str]) -> str:
+        """Import the package in a fresh interpreter."""
+        return f"import {params['module_name']}"
@@ -0,0 +1,93 @@
+"""
+Benchmarks for separating the construction of the PyNWB objects in `io.read()` from the I/O it requires.
+
+A metadata-only copy of each remote file (all groups, attributes, links, and small datasets) is made once in the
+persistent download directory. Reading this copy from disk measures `io.read()` with local I/O, while reading it
+through the in-memory HDF5 core driver measures the object mapping (type resolution, namespace loading, and object
+construction by PyNWB/HDMF) with almost no I/O. Comparing these to reading the original remote file shows whether
+`io.read()` is limited by the backend or by the object mapper.
+"""
+
+import time
+
+import h5py
+from pynwb import NWBHDF5IO
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    get_metadata_only_copy,
+    profile_top_functions,
+    read_hdf5_pynwb_remfile_no_cache,
+)
+
+from .params import hdf5_redirected_read_params
+
+
+class HDF5PyNWBObjectConstructionBenchmark(BaseBenchmark):
+    """
+    Time `io.read()` of the metadata of remote HDF5 NWB files from a local copy and from an in-memory copy.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = hdf5_redirected_read_params
+
+    def setup(self, params: dict[str, str]):
+        self.file_path = get_metadata_only_copy(https_url=params["https_url"])
+        # The core driver loads the entire (small) copy into memory when the file is opened
+        self.in_memory_file = h5py.File(name=self.file_path, mode="r", driver="core", backing_store=False)
+
+    def teardown(self, params: dict[str, str]):
+        if hasattr(self, "io"):
+            self.io.close()
+        if hasattr(self, "remote_io"):
+            self.remote_io.close()
+        self.in_memory_file.close()
+
+    def _read_in_memory(self):
+        self.io = NWBHDF5IO(file=self.in_memory_file)
+        self.nwbfile = self.io.read()
+
+    def time_read_local(self, params: dict[str, str]):
+        """Read the NWB objects of the metadata-only copy from disk."""
+        self.io = NWBHDF5IO(path=self.file_path, mode="r")
+        self.nwbfile = self.io.read()
+
+    def time_read_in_memory(self, params: dict[str, str]):
+        """Read the NWB objects of the metadata-only copy from memory."""
+        self._read_in_memory()
+
+    def track_io_fraction(self, params: dict[str, str]):
+        """
+        Track the fraction of the time of `io.read()` spent on I/O, for both the remote file and its local copy.
+
+        The time to read the in-memory copy is taken as the cost of constructing the objects; the remainder of the
+        time to read the same objects remotely (using remfile) or from disk is attributed to I/O.
+        """
+        start_time = time.perf_counter()
+        self.remote_nwbfile, self.remote_io, *_ = read_hdf5_pynwb_remfile_no_cache(https_url=params["https_url"])
+        remote_read_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        self.time_read_local(params=params)
+        local_read_time = time.perf_counter() - start_time
+        self.io.close()
+
+        start_time = time.perf_counter()
+        self._read_in_memory()
+        in_memory_read_time = time.perf_counter() - start_time
+
+        samples = dict(
+            remote_read_time=[remote_read_time],
+            local_read_time=[local_read_time],
+            in_memory_read_time=[in_memory_read_time],
+            remote_io_fraction=[max(0.0, 1.0 - in_memory_read_time / remote_read_time)],
+            local_io_fraction=[max(0.0, 1.0 - in_memory_read_time / local_read_time)],
+        )
+        return dict(samples=samples, number=None)
+
+    def track_hdmf_profile(self, params: dict[str, str]):
+        """Track the cumulative time of the ten HDMF functions that take the longest to read the in-memory copy."""
+        top_functions = profile_top_functions(function=self._read_in_memory, package_name="hdmf")
+        samples = {function_name: [cumulative_time] for function_name, cumulative_time in top_functions.items()}
+        return dict(samples=samples, number=None)
@@ -0,0 +1,76 @@
+"""Micro-benchmarks for timing the lookup of neurodata objects by name in NWB files with many objects."""
+
+from typing import List, Tuple
+
+import pynwb
+from pynwb.testing.mock.file import mock_NWBFile
+
+from nwb_benchmarks.core import BaseBenchmark, get_object_by_name
+
+from .params import object_lookup_params
+
+NUMBER_OF_LOOKUPS = 10
+
+
+def create_nwbfile_with_objects(number_of_objects: int) -> Tuple[pynwb.NWBFile, List[str]]:
+    """Create an in-memory NWBFile with many small objects, along with the names of some spread across the file."""
+    nwbfile = mock_NWBFile()
+    for index in range(number_of_objects):
+        nwbfile.add_acquisition(pynwb.TimeSeries(name=f"TimeSeries{index}", data=[0.0], rate=1.0, unit="n.a."))
+
+    # PyNWB collects the objects of a file on first access, which is part of reading a file rather than of a lookup
+    nwbfile.objects
+
+    step = number_of_objects // NUMBER_OF_LOOKUPS
+    object_names = [f"TimeSeries{index}" for index in range(0, number_of_objects, step)]
+    return nwbfile, object_names
+
+
+class ObjectLookupBenchmark(BaseBenchmark):
+    """
+    Time looking up several objects by name in an in-memory NWBFile with a large number of objects.
+
+    The first lookup builds the name index of the file. A linear scan over all objects for each name (the approach
+    without an index) is timed for comparison.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = object_lookup_params
+    timeout = 300  # Constructing the largest files takes about half a minute
+
+    # The first lookup indexes the file, so time it only once after each setup rather than calibrating the number
+    number = 1
+
+    def setup(self, params: dict[str, str | int]):
+        self.nwbfile, self.object_names = create_nwbfile_with_objects(number_of_objects=params["number_of_objects"])
+
+    def time_first_lookups(self, params: dict[str, str | int]):
+        """Look up several objects by name in a file that was not indexed yet."""
+        self._temp = [get_object_by_name(nwbfile=self.nwbfile, object_name=name) for name in self.object_names]
+
+    def time_linear_scan_lookups(self, params: dict[str, str | int]):
+        """Look up several objects by name by scanning all objects of the file for each name."""
+        self._temp = [
+            [neurodata_object for neurodata_object in self.nwbfile.objects.values() if neurodata_object.name == name]
+            for name in self.object_names
+        ]
+
+
+class IndexedObjectLookupBenchmark(BaseBenchmark):
+    """
+    Time looking up several objects by name in an in-memory NWBFile with a large number of objects that was indexed.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = object_lookup_params
+    timeout = 300  # Constructing the largest files takes about half a minute
+
+    def setup(self, params: dict[str, str | int]):
+        self.nwbfile, self.object_names = create_nwbfile_with_objects(number_of_objects=params["number_of_objects"])
+        get_object_by_name(nwbfile=self.nwbfile, object_name=self.object_names[0])
+
+    def time_indexed_lookups(self, params: dict[str, str | int]):
+        """Look up several objects by name in a file that was already indexed."""
+        self._temp = [get_object_by_name(nwbfile=self.nwbfile, object_name=name) for name in self.object_names]
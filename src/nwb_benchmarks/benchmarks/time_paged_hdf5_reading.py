@@ -0,0 +1,136 @@
+"""
+Benchmarks for timing the streaming open of HDF5 files repacked with paged aggregation and read with a page buffer.
+
+Paged aggregation gathers the metadata of a file into a few pages, which a page buffer reads whole, so that the
+metadata takes a few large reads instead of many small ones. The downloaded HDF5 files and their repacked copies are
+served over HTTP from the local machine, which counts the requests of each open; the original files are the baseline
+for the repacked ones.
+"""
+
+import shutil
+import tempfile
+import time
+
+import h5py
+from asv_runner.benchmarks.mark import SkipNotImplemented
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    LocalFileServer,
+    get_asset_path_from_url,
+    get_paged_hdf5_copy,
+    read_hdf5_h5py_fsspec_https_no_cache,
+    read_hdf5_h5py_fsspec_https_with_cache,
+    read_hdf5_h5py_remfile_no_cache,
+    read_hdf5_h5py_remfile_with_cache,
+    read_hdf5_h5py_ros3,
+)
+from nwb_benchmarks.setup import get_persistent_download_directory
+
+from .params import hdf5_paged_open_params
+
+
+def _read_attributes(name: str, h5py_object: h5py.Group | h5py.Dataset):
+    """Read the values of every attribute of an object; returns None so that `visititems` visits every object."""
+    for attribute_name in h5py_object.attrs:
+        h5py_object.attrs[attribute_name]
+
+
+def _close_open_outputs(open_outputs: tuple):
+    """Close the files, byte streams, and temporary directories returned by a streaming method."""
+    for open_output in open_outputs:
+        if isinstance(open_output, tempfile.TemporaryDirectory):
+            shutil.rmtree(path=open_output.name, ignore_errors=True)
+            open_output.cleanup()
+        elif hasattr(open_output, "close"):
+            open_output.close()
+
+
+class HDF5PagedFileOpenBenchmark(BaseBenchmark):
+    """
+    Time the open of original and paged HDF5 files using h5py with each HTTPS streaming method, with a page buffer for
+    the paged files.
+
+    Every `time_open_*` method stores the outputs of its streaming method in `self.open_outputs`.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = hdf5_paged_open_params
+
+    # Each paged copy is repacked from the downloaded file on first use
+    timeout = 60 * 60
+
+    def setup(self, params: dict[str, str | int | None]):
+        self.file_path = get_persistent_download_directory() / get_asset_path_from_url(https_url=params["https_url"])
+        if not self.file_path.exists():
+            raise SkipNotImplemented(f"Expected the asset {self.file_path} to be downloaded to repack it.")
+        if params["page_size"] is not None:
+            self.file_path = get_paged_hdf5_copy(source_file_path=self.file_path, page_size=params["page_size"])
+
+        self.server = LocalFileServer(directory=self.file_path.parent)
+        self.server.start()
+        self.https_url = self.server.get_url(file_path=self.file_path)
+        self.open_outputs = tuple()
+
+    def teardown(self, params: dict[str, str | int | None]):
+        _close_open_outputs(open_outputs=self.open_outputs)
+        self.server.stop()
+
+    def time_open_fsspec_https_no_cache(self, params: dict[str, str | int | None]):
+        """Open a served HDF5 file using h5py and fsspec with HTTPS without cache."""
+        self.open_outputs = read_hdf5_h5py_fsspec_https_no_cache(
+            https_url=self.https_url, page_buffer_size=params["page_buffer_size"]
+        )
+
+    def time_open_fsspec_https_with_cache(self, params: dict[str, str | int | None]):
+        """Open a served HDF5 file using h5py and fsspec with HTTPS with cache."""
+        self.open_outputs = read_hdf5_h5py_fsspec_https_with_cache(
+            https_url=self.https_url, page_buffer_size=params["page_buffer_size"]
+        )
+
+    def time_open_remfile_no_cache(self, params: dict[str, str | int | None]):
+        """Open a served HDF5 file using h5py and remfile without cache."""
+        self.open_outputs = read_hdf5_h5py_remfile_no_cache(
+            https_url=self.https_url, page_buffer_size=params["page_buffer_size"]
+        )
+
+    def time_open_remfile_with_cache(self, params: dict[str, str | int | None]):
+        """Open a served HDF5 file using h5py and remfile with cache."""
+        self.open_outputs = read_hdf5_h5py_remfile_with_cache(
+            https_url=self.https_url, page_buffer_size=params["page_buffer_size"]
+        )
+
+    def time_open_ros3(self, params: dict[str, str | int | None]):
+        """Open a served HDF5 file using h5py and the ROS3 HDF5 driver."""
+        self.open_outputs = read_hdf5_h5py_ros3(https_url=self.https_url, page_buffer_size=params["page_buffer_size"])
+
+    def track_open_requests(self, params: dict[str, str | int | None]):
+        """
+        Track the time and number of requests of the open with each streaming method, and of visiting every object
+        (and its attributes) of the opened file, which reads all of its metadata.
+        """
+        samples = dict()
+        for method_name in dir(self):
+            if not method_name.startswith("time_open_"):
+                continue
+            if method_name.endswith("_ros3") and not h5py.get_config().ros3:
+                continue
+
+            open_method = getattr(self, method_name)
+            method_name = method_name.removeprefix("time_")
+            self.server.reset_statistics()
+            start_time = time.perf_counter()
+            open_method(params=params)
+            samples[f"{method_name}_time"] = [time.perf_counter() - start_time]
+            samples[f"{method_name}_requests"] = [self.server.number_of_requests]
+
+            self.server.reset_statistics()
+            start_time = time.perf_counter()
+            self.open_outputs[0].visititems(_read_attributes)
+            samples[f"{method_name}_visit_time"] = [time.perf_counter() - start_time]
+            samples[f"{method_name}_visit_requests"] = [self.server.number_of_requests]
+
+            _close_open_outputs(open_outputs=self.open_outputs)
+            self.open_outputs = tuple()
+        return dict(samples=samples, number=None)
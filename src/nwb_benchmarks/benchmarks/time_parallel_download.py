@@ -0,0 +1,161 @@
+"""
+Benchmarks for the throughput of downloading remote NWB files with concurrent transfers.
+
+Each strategy is run with several numbers of concurrent byte ranges (or files, for Zarr stores), and reports the
+download time and throughput in megabytes per second, to compare with the default download of the DANDI API in
+`time_download.py`.
+"""
+
+import pathlib
+import shutil
+import time
+from abc import ABC
+from typing import Callable
+
+from asv_runner.benchmarks.mark import skip_benchmark_if
+from dandi.download import DownloadExisting, download
+
+from nwb_benchmarks import RUN_DOWNLOAD_BENCHMARKS
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    download_byte_ranges,
+    download_byte_ranges_fsspec,
+    download_s3fs_multipart,
+    download_zarr_files,
+    resolve_download_url,
+)
+from nwb_benchmarks.setup import get_temporary_directory
+
+from .params import hdf5_parallel_download_params, zarr_parallel_download_params
+
+
+def _get_directory_size(directory: pathlib.Path) -> int:
+    return sum(file_path.stat().st_size for file_path in directory.rglob("*") if file_path.is_file())
+
+
+class BaseParallelDownloadBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for tracking the throughput of downloading remote NWB files with concurrent transfers.
+
+    Each download is written to a temporary directory, which is removed after the benchmark.
+    """
+
+    # Download each file only once per run, as each track method downloads the whole file
+    number = 1
+    repeat = 1
+
+    # 12 hours max per download benchmark
+    timeout = 60 * 60 * 12
+
+    def setup(self, params: dict[str, str | int]):
+        self.tmpdir = get_temporary_directory()
+        self.download_dir = pathlib.Path(self.tmpdir.name)
+
+    def teardown(self, params: dict[str, str | int]):
+        shutil.rmtree(path=self.tmpdir.name, ignore_errors=True)
+        self.tmpdir.cleanup()
+
+    def _track_download_throughput(self, download_function: Callable[[], int]) -> dict:
+        """Time a function that downloads a file and returns its number of bytes, and compute the throughput."""
+        start_time = time.perf_counter()
+        number_of_bytes = download_function()
+        download_time = time.perf_counter() - start_time
+
+        samples = dict(download_time=[download_time], megabytes_per_second=[number_of_bytes / 1e6 / download_time])
+        return dict(samples=samples, number=None)
+
+
+class HDF5ParallelDownloadBenchmark(BaseParallelDownloadBenchmark):
+    """Track the throughput of downloading remote HDF5 NWB files with concurrent byte ranges or DANDI jobs."""
+
+    params = hdf5_parallel_download_params
+
+    def setup(self, params: dict[str, str | int]):
+        super().setup(params=params)
+        # The ranged downloads go directly to the S3 URL that the DANDI API redirects to
+        self.download_url, self.file_size = resolve_download_url(https_url=params["https_url"])
+        self.file_path = self.download_dir / "download.nwb"
+
+    # NOTE - these benchmarks download the full file which can take a long time.
+    # Only run explicitly using RUN_DOWNLOAD_BENCHMARKS=true when needed.
+    @skip_benchmark_if(not RUN_DOWNLOAD_BENCHMARKS)
+    def track_download_hdf5_dandi_api(self, params: dict[str, str | int]):
+        """Download a remote HDF5 NWB file using the DANDI API with a number of jobs."""
+
+        def download_function() -> int:
+            download(
+                urls=params["https_url"],
+                output_dir=self.download_dir,
+                existing=DownloadExisting.OVERWRITE,
+                jobs=params["number_of_workers"],
+            )
+            return _get_directory_size(directory=self.download_dir)
+
+        return self._track_download_throughput(download_function=download_function)
+
+    @skip_benchmark_if(not RUN_DOWNLOAD_BENCHMARKS)
+    def track_download_hdf5_byte_ranges(self, params: dict[str, str | int]):
+        """Download a remote HDF5 NWB file as concurrent byte ranges written into a preallocated file."""
+        return self._track_download_throughput(
+            download_function=lambda: download_byte_ranges(
+                https_url=self.download_url,
+                file_path=self.file_path,
+                file_size=self.file_size,
+                number_of_workers=params["number_of_workers"],
+            )
+        )
+
+    @skip_benchmark_if(not RUN_DOWNLOAD_BENCHMARKS)
+    def track_download_hdf5_fsspec_byte_ranges(self, params: dict[str, str | int]):
+        """Download a remote HDF5 NWB file as byte ranges fetched concurrently by fsspec."""
+        return self._track_download_throughput(
+            download_function=lambda: download_byte_ranges_fsspec(
+                https_url=self.download_url,
+                file_path=self.file_path,
+                file_size=self.file_size,
+                number_of_workers=params["number_of_workers"],
+            )
+        )
+
+    @skip_benchmark_if(not RUN_DOWNLOAD_BENCHMARKS)
+    def track_download_hdf5_s3fs_multipart(self, params: dict[str, str | int]):
+        """Download a remote HDF5 NWB file as parts fetched concurrently by s3fs."""
+        return self._track_download_throughput(
+            download_function=lambda: download_s3fs_multipart(
+                https_url=self.download_url, file_path=self.file_path, number_of_workers=params["number_of_workers"]
+            )
+        )
+
+
+class ZarrParallelDownloadBenchmark(BaseParallelDownloadBenchmark):
+    """Track the throughput of downloading remote Zarr NWB directories with concurrent files or DANDI jobs."""
+
+    params = zarr_parallel_download_params
+
+    # NOTE - these benchmarks download the full file which can take a long time.
+    # Only run explicitly using RUN_DOWNLOAD_BENCHMARKS=true when needed.
+    @skip_benchmark_if(not RUN_DOWNLOAD_BENCHMARKS)
+    def track_download_zarr_dandi_api(self, params: dict[str, str | int]):
+        """Download a remote Zarr NWB directory using the DANDI API with a number of jobs for the files of the store."""
+
+        def download_function() -> int:
+            download(
+                urls=params["https_url"],
+                output_dir=self.download_dir,
+                existing=DownloadExisting.OVERWRITE,
+                jobs_per_zarr=params["number_of_workers"],
+            )
+            return _get_directory_size(directory=self.download_dir)
+
+        return self._track_download_throughput(download_function=download_function)
+
+    @skip_benchmark_if(not RUN_DOWNLOAD_BENCHMARKS)
+    def track_download_zarr_files(self, params: dict[str, str | int]):
+        """Download a remote Zarr NWB directory as files fetched concurrently over HTTPS."""
+        return self._track_download_throughput(
+            download_function=lambda: download_zarr_files(
+                https_url=params["https_url_direct"],
+                directory=self.download_dir / "download.nwb.zarr",
+                number_of_workers=params["number_of_workers"],
+            )
+        )
@@ -0,0 +1,148 @@
+"""
+Benchmarks for timing the read of a set of slices by downloading only the chunks they need, then reading them locally.
+
+This partial download is a middle strategy between streaming each slice from the remote file and downloading the entire
+file before reading it locally, so both are timed as well for the same slices. The full downloads can take a long time,
+so they only run with RUN_DOWNLOAD_BENCHMARKS=true.
+"""
+
+import pathlib
+import shutil
+from abc import ABC
+from typing import List, Tuple
+
+import h5py
+import zarr
+from asv_runner.benchmarks.mark import skip_benchmark_if
+
+from nwb_benchmarks import RUN_DOWNLOAD_BENCHMARKS
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    build_object_path_index,
+    download_byte_ranges,
+    download_hdf5_chunks_for_slices,
+    download_zarr_chunks_for_slices,
+    download_zarr_files,
+    get_dataset_by_name,
+    read_hdf5_h5py_remfile_no_cache,
+    read_zarr_zarrpython_https,
+    resolve_download_url,
+)
+from nwb_benchmarks.setup import get_temporary_directory
+
+from .params import hdf5_partial_download_params, zarr_partial_download_params
+
+
+def _read_slices(file: h5py.File | zarr.Group, slices: List[Tuple[str, Tuple[slice, ...]]]) -> list:
+    """Read every slice of a set from the datasets of an opened file, locating each dataset by name."""
+    object_path_index = build_object_path_index(file=file)
+    return [
+        get_dataset_by_name(file=file, object_name=object_name, object_path_index=object_path_index)[slice_range]
+        for object_name, slice_range in slices
+    ]
+
+
+class BasePartialDownloadBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for timing the read of a set of slices from a remote NWB file by partial download, streaming, and full
+    download.
+
+    Each download is written to a temporary directory, which is removed after the benchmark.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    # The full downloads are slow, so only run them once
+    number = 1
+    repeat = 1
+
+    # 12 hours max per download benchmark
+    timeout = 60 * 60 * 12
+
+    def setup(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        self.tmpdir = get_temporary_directory()
+        self.download_dir = pathlib.Path(self.tmpdir.name)
+
+    def teardown(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        if hasattr(self, "file"):
+            self.file.close()
+        if hasattr(self, "bytestream"):
+            self.bytestream.close()
+        shutil.rmtree(path=self.tmpdir.name, ignore_errors=True)
+        self.tmpdir.cleanup()
+
+
+class HDF5PartialDownloadBenchmark(BasePartialDownloadBenchmark):
+    """Time reading a set of slices from a remote HDF5 NWB file by partial download, remfile, and full download."""
+
+    params = hdf5_partial_download_params
+
+    def setup(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        super().setup(params=params)
+        self.download_url, self.file_size = resolve_download_url(https_url=params["https_url"])
+        self.file_path = self.download_dir / "download.nwb"
+
+    def time_partial_download_and_slice(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        """Download the metadata and chunks of the slices into a sparse local copy, then read the slices from it."""
+        download_hdf5_chunks_for_slices(https_url=self.download_url, slices=params["slices"], file_path=self.file_path)
+        self.file = h5py.File(name=self.file_path, mode="r")
+        self._temp = _read_slices(file=self.file, slices=params["slices"])
+
+    def time_stream_and_slice(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        """Read the slices by streaming the remote file with remfile (without cache)."""
+        self.file, self.bytestream = read_hdf5_h5py_remfile_no_cache(https_url=self.download_url)
+        self._temp = _read_slices(file=self.file, slices=params["slices"])
+
+    @skip_benchmark_if(not RUN_DOWNLOAD_BENCHMARKS)
+    def time_full_download_and_slice(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        """Download the entire file as concurrent byte ranges, then read the slices from it."""
+        download_byte_ranges(
+            https_url=self.download_url, file_path=self.file_path, file_size=self.file_size, number_of_workers=8
+        )
+        self.file = h5py.File(name=self.file_path, mode="r")
+        self._temp = _read_slices(file=self.file, slices=params["slices"])
+
+    def track_partial_download_fraction(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        """Track the bytes of the partial download, and their fraction of the size of the entire file."""
+        number_of_bytes = download_hdf5_chunks_for_slices(
+            https_url=self.download_url, slices=params["slices"], file_path=self.file_path
+        )
+        samples = dict(bytes=[number_of_bytes], fraction_of_file=[number_of_bytes / self.file_size])
+        return dict(samples=samples, number=None)
+
+
+class ZarrPartialDownloadBenchmark(BasePartialDownloadBenchmark):
+    """Time reading a set of slices from a remote Zarr NWB file by partial download, HTTPS, and full download."""
+
+    params = zarr_partial_download_params
+
+    def setup(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        super().setup(params=params)
+        self.store_path = self.download_dir / "download.nwb.zarr"
+
+    def time_partial_download_and_slice(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        """Download the metadata and chunks of the slices into a local store, then read the slices from it."""
+        download_zarr_chunks_for_slices(
+            https_url=params["https_url"], slices=params["slices"], directory=self.store_path
+        )
+        self.zarr_file = zarr.open(store=str(self.store_path), mode="r")
+        self._temp = _read_slices(file=self.zarr_file, slices=params["slices"])
+
+    def time_stream_and_slice(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        """Read the slices by streaming the remote store with Zarr-Python over HTTPS."""
+        self.zarr_file = read_zarr_zarrpython_https(https_url=params["https_url"])
+        self._temp = _read_slices(file=self.zarr_file, slices=params["slices"])
+
+    @skip_benchmark_if(not RUN_DOWNLOAD_BENCHMARKS)
+    def time_full_download_and_slice(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        """Download all files of the store concurrently, then read the slices from it."""
+        download_zarr_files(https_url=params["https_url"], directory=self.store_path, number_of_workers=8)
+        self.zarr_file = zarr.open(store=str(self.store_path), mode="r")
+        self._temp = _read_slices(file=self.zarr_file, slices=params["slices"])
+
+    def track_partial_download_bytes(self, params: dict[str, str | List[Tuple[str, Tuple[slice, ...]]]]):
+        """Track the bytes of the partial download."""
+        number_of_bytes = download_zarr_chunks_for_slices(
+            https_url=params["https_url"], slices=params["slices"], directory=self.store_path
+        )
+        return dict(samples=dict(bytes=[number_of_bytes]), number=None)
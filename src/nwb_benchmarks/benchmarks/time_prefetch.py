@@ -0,0 +1,106 @@
+"""
+Benchmarks for timing analysis loops over consecutive windows of remote data, with windows read ahead in the background.
+
+Each window is followed by a computation of fixed duration, simulated by sleeping, so that without prefetching the time
+of the loop is the sum of the reads and the computations; with prefetching, the reads of the next windows overlap with
+the computation on the current one.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    get_dataset_by_name,
+    get_object_path_index,
+    iterate_windows_with_prefetch,
+    read_hdf5_h5py_remfile_no_cache,
+    read_zarr_zarrpython_https,
+)
+
+from .params import hdf5_prefetch_params, zarr_prefetch_params
+
+
+class BasePrefetchBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for timing a loop over windows of a remote dataset with a number of windows read ahead.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    @abstractmethod
+    def setup(self, params: dict[str, str | int | float | tuple]):
+        """Open the remote file and set `self.dataset` to the dataset to iterate over."""
+        pass
+
+    def _run_analysis_loop(self, params: dict[str, str | int | float | tuple]) -> Tuple[int, int]:
+        """
+        Iterate over the windows of the dataset, simulating the computation on each, and return the numbers of bytes
+        and windows read.
+        """
+        number_of_bytes = 0
+        number_of_windows = 0
+        for window in iterate_windows_with_prefetch(
+            dataset=self.dataset,
+            window_length=params["window_length"],
+            prefetch_depth=params["prefetch_depth"],
+            selection=params["selection"],
+            number_of_windows=params["number_of_windows"],
+        ):
+            self._temp = window
+            number_of_bytes += window.nbytes
+            number_of_windows += 1
+            time.sleep(params["compute_time_per_window"])
+        return number_of_bytes, number_of_windows
+
+    def time_windowed_analysis(self, params: dict[str, str | int | float | tuple]):
+        """Iterate over the windows of the dataset, with a fixed computation time per window."""
+        self._run_analysis_loop(params=params)
+
+    def track_windowed_analysis_throughput(self, params: dict[str, str | int | float | tuple]):
+        """
+        Track the effective throughput of the loop in megabytes per second, and the fraction of its time spent on the
+        computation (1 when the reads are entirely hidden behind the computation).
+        """
+        start_time = time.perf_counter()
+        number_of_bytes, number_of_windows = self._run_analysis_loop(params=params)
+        loop_time = time.perf_counter() - start_time
+
+        compute_time = params["compute_time_per_window"] * number_of_windows
+        samples = dict(
+            loop_time=[loop_time],
+            megabytes_per_second=[number_of_bytes / 1e6 / loop_time],
+            compute_fraction=[compute_time / loop_time],
+        )
+        return dict(samples=samples, number=None)
+
+
+class HDF5RemfilePrefetchBenchmark(BasePrefetchBenchmark):
+    """Time a loop over windows of a remote HDF5 NWB file streamed with remfile (without cache)."""
+
+    params = hdf5_prefetch_params
+
+    def setup(self, params: dict[str, str | int | float | tuple]):
+        self.file, self.bytestream = read_hdf5_h5py_remfile_no_cache(https_url=params["https_url"])
+        object_path_index = get_object_path_index(file=self.file, https_url=params["https_url"])
+        self.dataset = get_dataset_by_name(
+            file=self.file, object_name=params["object_name"], object_path_index=object_path_index
+        )
+
+    def teardown(self, params: dict[str, str | int | float | tuple]):
+        self.file.close()
+        self.bytestream.close()
+
+
+class ZarrHTTPSPrefetchBenchmark(BasePrefetchBenchmark):
+    """Time a loop over windows of a remote Zarr NWB file streamed with Zarr-Python over HTTPS."""
+
+    params = zarr_prefetch_params
+
+    def setup(self, params: dict[str, str | int | float | tuple]):
+        self.zarr_file = read_zarr_zarrpython_https(https_url=params["https_url"])
+        object_path_index = get_object_path_index(file=self.zarr_file, https_url=params["https_url"])
+        self.dataset = get_dataset_by_name(
+            file=self.zarr_file, object_name=params["object_name"], object_path_index=object_path_index
+        )
@@ -0,0 +1,98 @@
+"""
+Benchmarks for timing the whole path from opening a remote NWB file to reading a slice of one of its datasets.
+
+The slice benchmarks only time the slice itself, while most of the cost of a first access lies in locating the data.
+These compare constructing the entire `pynwb.NWBFile` to find the object by name against resolving its dataset path
+from the cached name to path index of the file, which only requires opening the file with h5py or Zarr-Python.
+"""
+
+from typing import Tuple
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    get_dataset_by_name,
+    get_object_by_name,
+    get_object_path_index,
+    read_hdf5_h5py_remfile_no_cache,
+    read_hdf5_pynwb_remfile_no_cache,
+    read_zarr_pynwb_s3,
+    read_zarr_zarrpython_s3,
+)
+
+from .params import hdf5_redirected_read_slice_params, zarr_direct_read_slice_params
+
+
+class HDF5RemfileOpenAndSliceBenchmark(BaseBenchmark):
+    """
+    Time opening a remote HDF5 NWB file with remfile (without cache), locating a dataset by name, and slicing it.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = hdf5_redirected_read_slice_params
+
+    def setup(self, params: dict[str, str | Tuple[slice]]):
+        # Make sure the index is cached, so that it is not built within the timing
+        file, bytestream = read_hdf5_h5py_remfile_no_cache(https_url=params["https_url"])
+        get_object_path_index(file=file, https_url=params["https_url"])
+        file.close()
+        bytestream.close()
+
+    def teardown(self, params: dict[str, str | Tuple[slice]]):
+        if hasattr(self, "io"):
+            self.io.close()
+        if hasattr(self, "file"):
+            self.file.close()
+        if hasattr(self, "bytestream"):
+            self.bytestream.close()
+
+    def time_open_and_slice_pynwb(self, params: dict[str, str | Tuple[slice]]):
+        """Read the NWBFile, get the object by name, and slice its data."""
+        self.nwbfile, self.io, self.file, self.bytestream = read_hdf5_pynwb_remfile_no_cache(
+            https_url=params["https_url"]
+        )
+        self.neurodata_object = get_object_by_name(nwbfile=self.nwbfile, object_name=params["object_name"])
+        self._temp = self.neurodata_object.data[params["slice_range"]]
+
+    def time_open_and_slice_h5py(self, params: dict[str, str | Tuple[slice]]):
+        """Open the HDF5 file, get the dataset through the cached index, and slice it."""
+        self.file, self.bytestream = read_hdf5_h5py_remfile_no_cache(https_url=params["https_url"])
+        object_path_index = get_object_path_index(file=self.file, https_url=params["https_url"])
+        self.dataset = get_dataset_by_name(
+            file=self.file, object_name=params["object_name"], object_path_index=object_path_index
+        )
+        self._temp = self.dataset[params["slice_range"]]
+
+
+class ZarrS3OpenAndSliceBenchmark(BaseBenchmark):
+    """
+    Time opening a remote Zarr NWB file with S3, locating a dataset by name, and slicing it.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = zarr_direct_read_slice_params
+
+    def setup(self, params: dict[str, str | Tuple[slice]]):
+        # Make sure the index is cached, so that it is not built within the timing
+        zarr_file = read_zarr_zarrpython_s3(https_url=params["https_url"])
+        get_object_path_index(file=zarr_file, https_url=params["https_url"])
+
+    def teardown(self, params: dict[str, str | Tuple[slice]]):
+        if hasattr(self, "io"):
+            self.io.close()
+
+    def time_open_and_slice_pynwb(self, params: dict[str, str | Tuple[slice]]):
+        """Read the NWBFile, get the object by name, and slice its data."""
+        self.nwbfile, self.io = read_zarr_pynwb_s3(https_url=params["https_url"], mode="r")
+        self.neurodata_object = get_object_by_name(nwbfile=self.nwbfile, object_name=params["object_name"])
+        self._temp = self.neurodata_object.data[params["slice_range"]]
+
+    def time_open_and_slice_zarr(self, params: dict[str, str | Tuple[slice]]):
+        """Open the Zarr file, get the dataset through the cached index, and slice it."""
+        self.zarr_file = read_zarr_zarrpython_s3(https_url=params["https_url"])
+        object_path_index = get_object_path_index(file=self.zarr_file, https_url=params["https_url"])
+        self.dataset = get_dataset_by_name(
+            file=self.zarr_file, object_name=params["object_name"], object_path_index=object_path_index
+        )
+        self._temp = self.dataset[params["slice_range"]]
@@ -7,7 +7,13 @@ from typing import Tuple
 from nwb_benchmarks.core import (
     BaseBenchmark,
     download_read_hdf5_pynwb_lindi,
+    get_dataset_by_name,
     get_object_by_name,
+    get_object_path_index,
+    read_hdf5_h5py_fsspec_https_no_cache,
+    read_hdf5_h5py_fsspec_s3_no_cache,
+    read_hdf5_h5py_remfile_no_cache,
+    read_hdf5_h5py_ros3,
     read_hdf5_pynwb_fsspec_https_no_cache,
     read_hdf5_pynwb_fsspec_https_with_cache,
     read_hdf5_pynwb_fsspec_s3_no_cache,
@@ -16,6 +22,7 @@ from nwb_benchmarks.core import (
     read_hdf5_pynwb_remfile_with_cache,
     read_hdf5_pynwb_ros3,
     read_zarr_pynwb_s3,
+    read_zarr_zarrpython_s3,
 )
 
 from .params import (
@@ -429,3 +436,103 @@ class ZarrPyNWBS3ForceNoConsolidatedPreloadedContinuousSliceBenchmark(TimeContin
         self.neurodata_object = get_object_by_name(nwbfile=self.nwbfile, object_name=object_name)
         self.data_to_slice = self.neurodata_object.data
         self._temp = self.data_to_slice[slice_range]
+
+
+class HDF5H5pyFsspecHttpsNoCacheContinuousSliceBenchmark(TimeContinuousSliceBenchmark):
+    """
+    Time the read of a continuous data slice from remote HDF5 NWB files using h5py and fsspec with HTTPS without cache.
+
+    The dataset is located through the cached name to path index of the file rather than by constructing the NWBFile.
+    """
+
+    params = hdf5_redirected_read_slice_params
+
+    def setup(self, params: dict[str, str | Tuple[slice]]):
+        https_url = params["https_url"]
+        object_name = params["object_name"]
+
+        self.file, self.bytestream = read_hdf5_h5py_fsspec_https_no_cache(https_url=https_url)
+        object_path_index = get_object_path_index(file=self.file, https_url=https_url)
+        self.data_to_slice = get_dataset_by_name(
+            file=self.file, object_name=object_name, object_path_index=object_path_index
+        )
+
+
+class HDF5H5pyFsspecS3NoCacheContinuousSliceBenchmark(TimeContinuousSliceBenchmark):
+    """
+    Time the read of a continuous data slice from remote HDF5 NWB files using h5py and fsspec with S3 without cache.
+
+    The dataset is located through the cached name to path index of the file rather than by constructing the NWBFile.
+    """
+
+    params = hdf5_redirected_read_slice_params
+
+    def setup(self, params: dict[str, str | Tuple[slice]]):
+        https_url = params["https_url"]
+        object_name = params["object_name"]
+
+        self.file, self.bytestream = read_hdf5_h5py_fsspec_s3_no_cache(https_url=https_url)
+        object_path_index = get_object_path_index(file=self.file, https_url=https_url)
+        self.data_to_slice = get_dataset_by_name(
+            file=self.file, object_name=object_name, object_path_index=object_path_index
+        )
+
+
+class HDF5H5pyRemfileNoCacheContinuousSliceBenchmark(TimeContinuousSliceBenchmark):
+    """
+    Time the read of a continuous data slice from remote HDF5 NWB files using h5py and remfile without cache.
+
+    The dataset is located through the cached name to path index of the file rather than by constructing the NWBFile.
+    """
+
+    params = hdf5_redirected_read_slice_params
+
+    def setup(self, params: dict[str, str | Tuple[slice]]):
+        https_url = params["https_url"]
+        object_name = params["object_name"]
+
+        self.file, self.bytestream = read_hdf5_h5py_remfile_no_cache(https_url=https_url)
+        object_path_index = get_object_path_index(file=self.file, https_url=https_url)
+        self.data_to_slice = get_dataset_by_name(
+            file=self.file, object_name=object_name, object_path_index=object_path_index
+        )
+
+
+class HDF5H5pyROS3ContinuousSliceBenchmark(TimeContinuousSliceBenchmark):
+    """
+    Time the read of a continuous data slice from remote HDF5 NWB files using h5py and the ROS3 driver.
+
+    The dataset is located through the cached name to path index of the file rather than by constructing the NWBFile.
+    """
+
+    params = hdf5_redirected_read_slice_params
+
+    def setup(self, params: dict[str, str | Tuple[slice]]):
+        https_url = params["https_url"]
+        object_name = params["object_name"]
+
+        self.file, _ = read_hdf5_h5py_ros3(https_url=https_url)
+        object_path_index = get_object_path_index(file=self.file, https_url=https_url)
+        self.data_to_slice = get_dataset_by_name(
+            file=self.file, object_name=object_name, object_path_index=object_path_index
+        )
+
+
+class ZarrZarrPythonS3ContinuousSliceBenchmark(TimeContinuousSliceBenchmark):
+    """
+    Time the read of a continuous data slice from remote Zarr NWB files using Zarr-Python with S3.
+
+    The dataset is located through the cached name to path index of the file rather than by constructing the NWBFile.
+    """
+
+    params = zarr_direct_read_slice_params
+
+    def setup(self, params: dict[str, str | Tuple[slice]]):
+        https_url = params["https_url"]
+        object_name = params["object_name"]
+
+        self.zarr_file = read_zarr_zarrpython_s3(https_url=https_url)
+        object_path_index = get_object_path_index(file=self.zarr_file, https_url=https_url)
+        self.data_to_slice = get_dataset_by_name(
+            file=self.zarr_file, object_name=object_name, object_path_index=object_path_index
+        )
@@ -0,0 +1,117 @@
+"""
+Benchmarks for timing streaming access to slices of data stored in NWB files with adaptive sampling.
+
+Each benchmark wraps the corresponding case of `time_remote_slicing`, but rather than taking a single sample it keeps
+re-opening the file and slicing until the confidence interval of the median time is narrow enough or the time budget
+runs out. The achieved interval and number of samples are recorded alongside the timing samples.
+
+These are only run in adaptive sampling mode (`nwb_benchmarks run --adaptive`).
+"""
+
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+from asv_runner.benchmarks.mark import skip_benchmark_if
+
+from nwb_benchmarks import RUN_ADAPTIVE_SAMPLING_BENCHMARKS
+from nwb_benchmarks.core import BaseBenchmark, sample_adaptively
+
+from . import time_remote_slicing
+from .params import hdf5_redirected_read_slice_params, zarr_direct_read_slice_params
+
+
+class AdaptiveContinuousSliceBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for adaptively sampling slice access to NWB data.
+
+    Setup and teardown are delegated to an instance of the wrapped `time_remote_slicing` benchmark, so that the
+    file is opened the same way and each sample starts with a freshly opened file.
+    """
+
+    target_relative_width = 0.1
+    time_budget = 60.0 * 5
+    minimum_number_of_samples = 5
+    maximum_number_of_samples = 100
+
+    # Allow the time budget to be used in full, along with the setup and teardown of the final sample
+    timeout = time_budget + 60.0 * 5
+
+    @property
+    @abstractmethod
+    def wrapped_benchmark_class(self) -> type:
+        """The `time_remote_slicing` benchmark whose setup and teardown are used for each sample."""
+        pass
+
+    def setup(self, params: dict[str, str | Tuple[slice]]):
+        self.wrapped_benchmark = self.wrapped_benchmark_class()
+        self.wrapped_benchmark.setup(params)
+
+    def teardown(self, params: dict[str, str | Tuple[slice]]):
+        if hasattr(self, "wrapped_benchmark"):
+            self.wrapped_benchmark.teardown(params)
+
+    @skip_benchmark_if(not RUN_ADAPTIVE_SAMPLING_BENCHMARKS)
+    def track_slice(self, params: dict[str, str | Tuple[slice]]):
+        """Slice a range of a dataset in a remote NWB file until the median time is known to the target precision."""
+        slice_range = params["slice_range"]
+
+        def slice_data():
+            self.wrapped_benchmark._temp = self.wrapped_benchmark.data_to_slice[slice_range]
+
+        return sample_adaptively(
+            function=slice_data,
+            setup=lambda: self.setup(params),
+            teardown=lambda: self.teardown(params),
+            target_relative_width=self.target_relative_width,
+            time_budget=self.time_budget,
+            minimum_number_of_samples=self.minimum_number_of_samples,
+            maximum_number_of_samples=self.maximum_number_of_samples,
+        )
+
+
+class HDF5PyNWBFsspecHttpsNoCacheContinuousSliceBenchmark(AdaptiveContinuousSliceBenchmark):
+    """
+    Adaptively time the read of a continuous data slice from remote HDF5 NWB files using pynwb and fsspec with HTTPS
+    without cache.
+    """
+
+    params = hdf5_redirected_read_slice_params
+    wrapped_benchmark_class = time_remote_slicing.HDF5PyNWBFsspecHttpsNoCacheContinuousSliceBenchmark
+
+
+class HDF5PyNWBFsspecS3NoCacheContinuousSliceBenchmark(AdaptiveContinuousSliceBenchmark):
+    """
+    Adaptively time the read of a continuous data slice from remote HDF5 NWB files using pynwb and fsspec with S3
+    without cache.
+    """
+
+    params = hdf5_redirected_read_slice_params
+    wrapped_benchmark_class = time_remote_slicing.HDF5PyNWBFsspecS3NoCacheContinuousSliceBenchmark
+
+
+class HDF5PyNWBRemfileNoCacheContinuousSliceBenchmark(AdaptiveContinuousSliceBenchmark):
+    """
+    Adaptively time the read of a continuous data slice from remote HDF5 NWB files using pynwb and remfile without
+    cache.
+    """
+
+    params = hdf5_redirected_read_slice_params
+    wrapped_benchmark_class = time_remote_slicing.HDF5PyNWBRemfileNoCacheContinuousSliceBenchmark
+
+
+class HDF5PyNWBROS3ContinuousSliceBenchmark(AdaptiveContinuousSliceBenchmark):
+    """
+    Adaptively time the read of a continuous data slice from remote HDF5 NWB files using pynwb and the ROS3 driver.
+    """
+
+    params = hdf5_redirected_read_slice_params
+    wrapped_benchmark_class = time_remote_slicing.HDF5PyNWBROS3ContinuousSliceBenchmark
+
+
+class ZarrPyNWBS3ContinuousSliceBenchmark(AdaptiveContinuousSliceBenchmark):
+    """
+    Adaptively time the read of a continuous data slice from remote Zarr NWB files using pynwb with S3.
+    """
+
+    params = zarr_direct_read_slice_params
+    wrapped_benchmark_class = time_remote_slicing.ZarrPyNWBS3ContinuousSliceBenchmark
@@ -0,0 +1,118 @@
+"""
+Benchmarks for the distribution of the latency of many small slices of data stored in NWB files.
+
+Each benchmark opens the file once, with the setup of the corresponding case of `time_remote_slicing`, and then reads
+many small slices at positions spread through the data. Every latency is recorded in a `LatencyHistogram`, and the
+percentiles of the latencies (e.g., the p99 felt by interactive users) are recorded in the results.
+
+These are only run in latency distribution mode (`nwb_benchmarks run --latency`).
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy
+from asv_runner.benchmarks.mark import skip_benchmark_if
+
+from nwb_benchmarks import RUN_LATENCY_DISTRIBUTION_BENCHMARKS
+from nwb_benchmarks.core import BaseBenchmark, sample_latencies
+
+from . import time_remote_slicing
+from .params import hdf5_latency_slice_params, zarr_latency_slice_params
+
+
+class LatencyDistributionContinuousSliceBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for the distribution of the latency of many small slices of NWB data, read within a single setup.
+
+    Setup and teardown are delegated to an instance of the wrapped `time_remote_slicing` benchmark, so that the file is
+    opened the same way.
+    """
+
+    time_budget = 60.0 * 5
+
+    # The positions of the slices are drawn from a fixed seed, so that every run reads the same slices
+    seed = 0
+
+    # Allow the time budget to be used in full, along with opening the file
+    timeout = time_budget + 60.0 * 5
+
+    @property
+    @abstractmethod
+    def wrapped_benchmark_class(self) -> type:
+        """The `time_remote_slicing` benchmark whose setup and teardown are used."""
+        pass
+
+    def setup(self, params: dict[str, str | int | tuple]):
+        self.wrapped_benchmark = self.wrapped_benchmark_class()
+        self.wrapped_benchmark.setup(params)
+
+        first_axis_length = self.wrapped_benchmark.data_to_slice.shape[0]
+        random_number_generator = numpy.random.default_rng(seed=self.seed)
+        self.slice_starts = random_number_generator.integers(
+            low=0, high=max(first_axis_length - params["slice_length"], 1), size=params["number_of_slices"]
+        )
+
+    def teardown(self, params: dict[str, str | int | tuple]):
+        if hasattr(self, "wrapped_benchmark"):
+            self.wrapped_benchmark.teardown(params)
+
+    @skip_benchmark_if(not RUN_LATENCY_DISTRIBUTION_BENCHMARKS)
+    def track_slice_latency(self, params: dict[str, str | int | tuple]):
+        """Read many small slices of a dataset in a remote NWB file, and track the percentiles of their latency."""
+        slice_length = params["slice_length"]
+        selection = params["selection"]
+
+        def slice_data(slice_index: int):
+            start = int(self.slice_starts[slice_index])
+            self.wrapped_benchmark._temp = self.wrapped_benchmark.data_to_slice[
+                (slice(start, start + slice_length), *selection)
+            ]
+
+        return sample_latencies(
+            function=slice_data, number_of_samples=params["number_of_slices"], time_budget=self.time_budget
+        )
+
+
+class HDF5PyNWBFsspecHttpsNoCacheContinuousSliceBenchmark(LatencyDistributionContinuousSliceBenchmark):
+    """
+    Track the latency of small slices of remote HDF5 NWB files read using pynwb and fsspec with HTTPS without cache.
+    """
+
+    params = hdf5_latency_slice_params
+    wrapped_benchmark_class = time_remote_slicing.HDF5PyNWBFsspecHttpsNoCacheContinuousSliceBenchmark
+
+
+class HDF5PyNWBFsspecS3NoCacheContinuousSliceBenchmark(LatencyDistributionContinuousSliceBenchmark):
+    """
+    Track the latency of small slices of remote HDF5 NWB files read using pynwb and fsspec with S3 without cache.
+    """
+
+    params = hdf5_latency_slice_params
+    wrapped_benchmark_class = time_remote_slicing.HDF5PyNWBFsspecS3NoCacheContinuousSliceBenchmark
+
+
+class HDF5PyNWBRemfileNoCacheContinuousSliceBenchmark(LatencyDistributionContinuousSliceBenchmark):
+    """
+    Track the latency of small slices of remote HDF5 NWB files read using pynwb and remfile without cache.
+    """
+
+    params = hdf5_latency_slice_params
+    wrapped_benchmark_class = time_remote_slicing.HDF5PyNWBRemfileNoCacheContinuousSliceBenchmark
+
+
+class HDF5PyNWBROS3ContinuousSliceBenchmark(LatencyDistributionContinuousSliceBenchmark):
+    """
+    Track the latency of small slices of remote HDF5 NWB files read using pynwb and the ROS3 driver.
+    """
+
+    params = hdf5_latency_slice_params
+    wrapped_benchmark_class = time_remote_slicing.HDF5PyNWBROS3ContinuousSliceBenchmark
+
+
+class ZarrPyNWBS3ContinuousSliceBenchmark(LatencyDistributionContinuousSliceBenchmark):
+    """
+    Track the latency of small slices of remote Zarr NWB files read using pynwb with S3.
+    """
+
+    params = zarr_latency_slice_params
+    wrapped_benchmark_class = time_remote_slicing.ZarrPyNWBS3ContinuousSliceBenchmark
@@ -0,0 +1,231 @@
+"""
+Benchmarks for timing the streaming read of metadata-heavy NWB files as their number of objects grows.
+
+The synthetic files are served over HTTP from the local machine, so that every HTTPS streaming method can read them
+while the size of their data stays fixed. Beyond the time of each read, the number of requests it issues (and the bytes
+it transfers) are tracked, which is what multiplies the latency to remote storage. The S3 variants of the streaming
+methods are not included, as they can only read from S3 itself.
+"""
+
+import json
+import pathlib
+import shutil
+import tempfile
+import time
+from abc import ABC, abstractmethod
+
+import h5py
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    LocalFileServer,
+    get_synthetic_asset,
+    read_hdf5_h5py_fsspec_https_no_cache,
+    read_hdf5_h5py_fsspec_https_with_cache,
+    read_hdf5_h5py_lindi,
+    read_hdf5_h5py_remfile_no_cache,
+    read_hdf5_h5py_remfile_with_cache,
+    read_hdf5_h5py_ros3,
+    read_hdf5_pynwb_fsspec_https_no_cache,
+    read_hdf5_pynwb_fsspec_https_with_cache,
+    read_hdf5_pynwb_lindi,
+    read_hdf5_pynwb_remfile_no_cache,
+    read_hdf5_pynwb_remfile_with_cache,
+    read_hdf5_pynwb_ros3,
+    read_zarr_pynwb_https,
+    read_zarr_zarrpython_https,
+)
+from nwb_benchmarks.setup import get_temporary_directory
+
+from .params import (
+    synthetic_metadata_hdf5_params,
+    synthetic_metadata_params,
+    synthetic_metadata_zarr_params,
+)
+
+
+def _close_read_outputs(read_outputs: tuple):
+    """Close the IO objects, files, byte streams, and temporary directories returned by a streaming method."""
+    for read_output in read_outputs:
+        if isinstance(read_output, tempfile.TemporaryDirectory):
+            shutil.rmtree(path=read_output.name, ignore_errors=True)
+            read_output.cleanup()
+        elif hasattr(read_output, "close"):
+            read_output.close()
+
+
+class SyntheticMetadataReadBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for timing the read of synthetic files served over HTTP with each streaming method of a backend.
+
+    Every `time_read_*` method stores the outputs of its streaming method in `self.read_outputs`.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    # Each file is generated on first use, which can take a while for the largest numbers of objects
+    timeout = 60 * 60
+
+    @property
+    @abstractmethod
+    def backend(self) -> str:
+        """The backend of the synthetic files, as passed to `get_synthetic_asset`."""
+        pass
+
+    def setup(self, params: dict[str, str | int | bool | None]):
+        self.file_path = get_synthetic_asset(
+            modality=params["modality"],
+            backend=self.backend,
+            data_size=params["data_size"],
+            number_of_objects=params["number_of_objects"],
+            page_size=params.get("page_size"),
+            consolidated=params.get("consolidated", True),
+        )
+        self.server = LocalFileServer(directory=self.file_path.parent)
+        self.server.start()
+        self.https_url = self.server.get_url(file_path=self.file_path)
+        self.read_outputs = tuple()
+
+    def teardown(self, params: dict[str, str | int | bool | None]):
+        _close_read_outputs(read_outputs=self.read_outputs)
+        self.server.stop()
+
+    def track_read_requests(self, params: dict[str, str | int | bool | None]):
+        """Track the time, number of requests, and bytes transferred of the read with each streaming method."""
+        samples = dict()
+        for method_name in dir(self):
+            if not method_name.startswith("time_read_"):
+                continue
+            if method_name.endswith("_ros3") and not h5py.get_config().ros3:
+                continue
+
+            read_method = getattr(self, method_name)
+            method_name = method_name.removeprefix("time_")
+            self.server.reset_statistics()
+            start_time = time.perf_counter()
+            read_method(params=params)
+            samples[f"{method_name}_time"] = [time.perf_counter() - start_time]
+            samples[f"{method_name}_requests"] = [self.server.number_of_requests]
+            samples[f"{method_name}_bytes"] = [self.server.bytes_sent]
+
+            _close_read_outputs(read_outputs=self.read_outputs)
+            self.read_outputs = tuple()
+        return dict(samples=samples, number=None)
+
+
+class HDF5H5pySyntheticMetadataReadBenchmark(SyntheticMetadataReadBenchmark):
+    """
+    Time the read of synthetic HDF5 files, with and without paged aggregation, using h5py with each streaming method.
+
+    There is no formal parsing of the `pynwb.NWBFile` object.
+    """
+
+    params = synthetic_metadata_hdf5_params
+    backend = "hdf5"
+
+    def time_read_hdf5_h5py_fsspec_https_no_cache(self, params: dict[str, str | int | bool | None]):
+        """Read a served HDF5 file using h5py and fsspec with HTTPS without cache."""
+        self.read_outputs = read_hdf5_h5py_fsspec_https_no_cache(https_url=self.https_url)
+
+    def time_read_hdf5_h5py_fsspec_https_with_cache(self, params: dict[str, str | int | bool | None]):
+        """Read a served HDF5 file using h5py and fsspec with HTTPS with cache."""
+        self.read_outputs = read_hdf5_h5py_fsspec_https_with_cache(https_url=self.https_url)
+
+    def time_read_hdf5_h5py_remfile_no_cache(self, params: dict[str, str | int | bool | None]):
+        """Read a served HDF5 file using h5py and remfile without cache."""
+        self.read_outputs = read_hdf5_h5py_remfile_no_cache(https_url=self.https_url)
+
+    def time_read_hdf5_h5py_remfile_with_cache(self, params: dict[str, str | int | bool | None]):
+        """Read a served HDF5 file using h5py and remfile with cache."""
+        self.read_outputs = read_hdf5_h5py_remfile_with_cache(https_url=self.https_url)
+
+    def time_read_hdf5_h5py_ros3(self, params: dict[str, str | int | bool | None]):
+        """Read a served HDF5 file using h5py and the ROS3 HDF5 driver."""
+        self.read_outputs = read_hdf5_h5py_ros3(https_url=self.https_url)
+
+
+class HDF5PyNWBSyntheticMetadataReadBenchmark(SyntheticMetadataReadBenchmark):
+    """Time the read of synthetic HDF5 NWB files, with and without paged aggregation, using pynwb with each method."""
+
+    params = synthetic_metadata_hdf5_params
+    backend = "hdf5"
+
+    def time_read_hdf5_pynwb_fsspec_https_no_cache(self, params: dict[str, str | int | bool | None]):
+        """Read a served HDF5 NWB file using pynwb and fsspec with HTTPS without cache."""
+        self.read_outputs = read_hdf5_pynwb_fsspec_https_no_cache(https_url=self.https_url)
+
+    def time_read_hdf5_pynwb_fsspec_https_with_cache(self, params: dict[str, str | int | bool | None]):
+        """Read a served HDF5 NWB file using pynwb and fsspec with HTTPS with cache."""
+        self.read_outputs = read_hdf5_pynwb_fsspec_https_with_cache(https_url=self.https_url)
+
+    def time_read_hdf5_pynwb_remfile_no_cache(self, params: dict[str, str | int | bool | None]):
+        """Read a served HDF5 NWB file using pynwb and remfile without cache."""
+        self.read_outputs = read_hdf5_pynwb_remfile_no_cache(https_url=self.https_url)
+
+    def time_read_hdf5_pynwb_remfile_with_cache(self, params: dict[str, str | int | bool | None]):
+        """Read a served HDF5 NWB file using pynwb and remfile with cache."""
+        self.read_outputs = read_hdf5_pynwb_remfile_with_cache(https_url=self.https_url)
+
+    def time_read_hdf5_pynwb_ros3(self, params: dict[str, str | int | bool | None]):
+        """Read a served HDF5 NWB file using pynwb and the ROS3 HDF5 driver."""
+        self.read_outputs = read_hdf5_pynwb_ros3(https_url=self.https_url)
+
+
+class LindiSyntheticMetadataReadBenchmark(SyntheticMetadataReadBenchmark):
+    """
+    Time the read of local LINDI JSON files referring to synthetic HDF5 NWB files served over HTTP, using LINDI.
+
+    The metadata is read from the JSON file, while the chunks of data it refers to are read from the served HDF5 file,
+    so that requests are only expected for the data that is not inlined in the JSON file.
+    """
+
+    params = synthetic_metadata_params
+    backend = "lindi"
+
+    def setup(self, params: dict[str, str | int | bool | None]):
+        super().setup(params=params)
+
+        # The generated LINDI JSON file refers to the HDF5 file by its local path, so refer to its URL in a copy instead
+        lindi_json = json.loads(self.file_path.read_text())
+        lindi_json["templates"] = {
+            name: self.server.get_url(file_path=path) for name, path in lindi_json["templates"].items()
+        }
+        self.tmpdir = get_temporary_directory()
+        self.served_lindi_file_path = pathlib.Path(self.tmpdir.name) / self.file_path.name
+        self.served_lindi_file_path.write_text(json.dumps(lindi_json))
+
+    def teardown(self, params: dict[str, str | int | bool | None]):
+        super().teardown(params=params)
+        self.tmpdir.cleanup()
+
+    def time_read_hdf5_h5py_lindi(self, params: dict[str, str | int | bool | None]):
+        """Read the LINDI JSON file using h5py and LINDI."""
+        self.read_outputs = (read_hdf5_h5py_lindi(rfs=str(self.served_lindi_file_path)),)
+
+    def time_read_hdf5_pynwb_lindi(self, params: dict[str, str | int | bool | None]):
+        """Read the LINDI JSON file using pynwb and LINDI."""
+        self.read_outputs = read_hdf5_pynwb_lindi(rfs=str(self.served_lindi_file_path))
+
+
+class ZarrSyntheticMetadataReadBenchmark(SyntheticMetadataReadBenchmark):
+    """
+    Time the read of synthetic Zarr NWB files, with and without consolidated metadata, using Zarr-Python and pynwb over
+    HTTPS.
+    """
+
+    params = synthetic_metadata_zarr_params
+    backend = "zarr"
+
+    def time_read_zarr_zarrpython_https(self, params: dict[str, str | int | bool | None]):
+        """Open a served Zarr file using Zarr-Python with HTTPS."""
+        self.read_outputs = (
+            read_zarr_zarrpython_https(
+                https_url=self.https_url, open_without_consolidated_metadata=not params["consolidated"]
+            ),
+        )
+
+    def time_read_zarr_pynwb_https(self, params: dict[str, str | int | bool | None]):
+        """Read a served Zarr NWB file using pynwb with HTTPS."""
+        self.read_outputs = read_zarr_pynwb_https(
+            https_url=self.https_url, mode="r" if params["consolidated"] else "r-"
+        )
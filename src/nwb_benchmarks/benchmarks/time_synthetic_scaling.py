@@ -0,0 +1,112 @@
+"""
+Benchmarks for timing how opening and slicing local NWB files scale with the size of their data and their number of
+objects, using synthetic files generated for each case rather than fixed DANDI assets.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+import h5py
+import pynwb
+import zarr
+from hdmf_zarr import NWBZarrIO
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    get_synthetic_asset,
+    read_hdf5_h5py_lindi,
+    read_hdf5_pynwb_lindi,
+)
+
+from .params import synthetic_scaling_params
+
+
+class SyntheticScalingBenchmark(BaseBenchmark, ABC):
+    """
+    Base class for benchmarking local synthetic NWB files of a modality, data size, and number of objects.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = synthetic_scaling_params
+
+    # Each file is generated on first use, which can take a while for the largest sizes
+    timeout = 60 * 60
+
+    # Each call opens a file or reads an NWBFile, whose handles are closed on teardown, so call once per setup
+    number = 1
+
+    backend: str
+
+    @abstractmethod
+    def open_file(self):
+        """Open the file at `self.file_path` without PyNWB, and return it."""
+        pass
+
+    def setup(self, params: dict[str, str | int | Tuple[slice]]):
+        self.file_path = get_synthetic_asset(
+            modality=params["modality"],
+            backend=self.backend,
+            data_size=params["data_size"],
+            number_of_objects=params["number_of_objects"],
+        )
+        self.file = self.open_file()
+        self.opened_files = []
+        self.data_to_slice = self.file[f"acquisition/{params['object_name']}/data"]
+
+    def teardown(self, params: dict[str, str | int | Tuple[slice]]):
+        if hasattr(self, "io"):
+            self.io.close()
+        for file in [getattr(self, "file", None)] + getattr(self, "opened_files", []):
+            if hasattr(file, "close"):
+                file.close()
+
+    def time_open(self, params: dict[str, str | int | Tuple[slice]]):
+        """Open the file again without constructing any NWB objects."""
+        # Each file opened is kept to be closed on teardown, so that closing it is not timed
+        self.opened_files.append(self.open_file())
+
+    def time_slice(self, params: dict[str, str | int | Tuple[slice]]):
+        """Slice a range of the main series of a file that was already opened."""
+        self._temp = self.data_to_slice[params["slice_range"]]
+
+
+class HDF5PyNWBSyntheticScalingBenchmark(SyntheticScalingBenchmark):
+    """Time opening and slicing synthetic HDF5 NWB files, using h5py and PyNWB."""
+
+    backend = "hdf5"
+
+    def open_file(self):
+        return h5py.File(name=self.file_path, mode="r")
+
+    def time_read_pynwb(self, params: dict[str, str | int | Tuple[slice]]):
+        """Read the NWBFile with PyNWB."""
+        self.io = pynwb.NWBHDF5IO(path=self.file_path, mode="r")
+        self.nwbfile = self.io.read()
+
+
+class ZarrPyNWBSyntheticScalingBenchmark(SyntheticScalingBenchmark):
+    """Time opening and slicing synthetic Zarr NWB files, using Zarr-Python and PyNWB."""
+
+    backend = "zarr"
+
+    def open_file(self):
+        return zarr.open(store=str(self.file_path), mode="r")
+
+    def time_read_pynwb(self, params: dict[str, str | int | Tuple[slice]]):
+        """Read the NWBFile with PyNWB."""
+        self.io = NWBZarrIO(path=str(self.file_path), mode="r")
+        self.nwbfile = self.io.read()
+
+
+class LindiPyNWBSyntheticScalingBenchmark(SyntheticScalingBenchmark):
+    """Time opening and slicing synthetic LINDI JSON files referring to HDF5 NWB files, using LINDI and PyNWB."""
+
+    backend = "lindi"
+
+    def open_file(self):
+        return read_hdf5_h5py_lindi(rfs=str(self.file_path))
+
+    def time_read_pynwb(self, params: dict[str, str | int | Tuple[slice]]):
+        """Read the NWBFile with PyNWB."""
+        self.nwbfile, self.io, self.client = read_hdf5_pynwb_lindi(rfs=str(self.file_path))
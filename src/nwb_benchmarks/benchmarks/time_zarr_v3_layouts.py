@@ -0,0 +1,108 @@
+"""
+Benchmarks for timing the streaming of slices from Zarr v3 copies of the Zarr NWB files with different layouts.
+
+Each layout sets the chunk shape and (optionally) the shard shape of the sliced data, and is tagged in the parameter
+case, so that the results for the same slice can be compared across layouts. The copies are served over HTTP from the
+local machine, so that each read of an object or of a byte range is an actual request; with sharding, the chunks are
+read as ranges of fewer, larger objects, which is counted by the number of requests to the server.
+
+These require Zarr-Python 3 or above and are skipped otherwise. As HDMF-Zarr requires Zarr-Python 2, they are skipped in
+the environment of the project until it supports Zarr v3; the copies can only be read with Zarr-Python for the same
+reason.
+"""
+
+import logging
+from typing import Tuple
+
+import zarr
+from asv_runner.benchmarks.mark import SkipNotImplemented, skip_benchmark_if
+
+from nwb_benchmarks.core import (
+    BaseBenchmark,
+    LocalFileServer,
+    get_asset_path_from_url,
+    get_zarr_v3_copy,
+)
+from nwb_benchmarks.setup import get_persistent_download_directory
+
+from .params import zarr_v3_slice_params
+
+ZARR_V3_AVAILABLE = int(zarr.__version__.split(".")[0]) >= 3
+
+# The methods of a Zarr store that make a request to the underlying storage, e.g., one per object or byte range read
+STORE_REQUEST_METHODS = ("exists", "get", "get_partial_values", "list", "list_dir", "list_prefix")
+
+
+class ZarrV3LayoutSliceBenchmark(BaseBenchmark):
+    """
+    Time opening and slicing Zarr v3 copies of Zarr NWB files served over HTTP, and count the requests to their store.
+
+    Note: in all cases, store the in-memory objects to avoid timing garbage collection steps.
+    """
+
+    params = zarr_v3_slice_params
+
+    # The copy of each layout is converted from the downloaded file on first use
+    timeout = 60 * 60
+
+    def setup(self, params: dict[str, str | Tuple[slice] | Tuple[int, ...] | None]):
+        file_path = get_persistent_download_directory() / get_asset_path_from_url(https_url=params["https_url"])
+        if not file_path.exists():
+            raise SkipNotImplemented(f"Expected file {file_path} to exist for Zarr v3 conversion benchmark.")
+
+        self.store_path, self.array_path = get_zarr_v3_copy(
+            source_path=file_path,
+            object_name=params["object_name"],
+            chunk_shape=params["chunk_shape"],
+            shard_shape=params["shard_shape"],
+        )
+        self.server = LocalFileServer(directory=self.store_path.parent)
+        self.server.start()
+        self.https_url = self.server.get_url(file_path=self.store_path)
+        self.zarr_file = zarr.open_group(store=self.https_url, mode="r")
+        self.data_to_slice = self.zarr_file[self.array_path]
+
+    def teardown(self, params: dict[str, str | Tuple[slice] | Tuple[int, ...] | None]):
+        if hasattr(self, "server"):
+            self.server.stop()
+
+    @skip_benchmark_if(not ZARR_V3_AVAILABLE)
+    def time_open(self, params: dict[str, str | Tuple[slice] | Tuple[int, ...] | None]):
+        """Open the Zarr file and the array to slice."""
+        self.opened_zarr_file = zarr.open_group(store=self.https_url, mode="r")
+        self.opened_array = self.opened_zarr_file[self.array_path]
+
+    @skip_benchmark_if(not ZARR_V3_AVAILABLE)
+    def time_slice(self, params: dict[str, str | Tuple[slice] | Tuple[int, ...] | None]):
+        """Slice a range of an array that was already opened."""
+        self._temp = self.data_to_slice[params["slice_range"]]
+
+    @skip_benchmark_if(not ZARR_V3_AVAILABLE)
+    def time_open_and_slice(self, params: dict[str, str | Tuple[slice] | Tuple[int, ...] | None]):
+        """Open the Zarr file and the array to slice, and slice a range of it."""
+        self.time_open(params=params)
+        self._temp = self.opened_array[params["slice_range"]]
+
+    @skip_benchmark_if(not ZARR_V3_AVAILABLE)
+    def track_store_requests(self, params: dict[str, str | Tuple[slice] | Tuple[int, ...] | None]):
+        """
+        Track the requests when opening the Zarr file and slicing the array.
+
+        These are counted both by kind, as calls to the methods of the store, and as the requests and bytes received by
+        the server.
+        """
+        store = zarr.storage.LoggingStore(
+            store=zarr.storage.FsspecStore.from_url(url=self.https_url, read_only=True),
+            log_level="WARNING",
+            log_handler=logging.NullHandler(),
+        )
+        self.server.reset_statistics()
+        zarr_file = zarr.open_group(store=store, mode="r")
+        self._temp = zarr_file[self.array_path][params["slice_range"]]
+
+        request_counts = {method: store.counter[method] for method in STORE_REQUEST_METHODS if method in store.counter}
+        samples = {f"{method}_requests": [count] for method, count in request_counts.items()}
+        samples["total_requests"] = [sum(request_counts.values())]
+        samples["http_requests"] = [self.server.number_of_requests]
+        samples["http_bytes"] = [self.server.bytes_sent]
+        return dict(samples=samples, number=None)
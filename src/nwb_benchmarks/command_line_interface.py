@@ -3,17 +3,29 @@
 import argparse
 import datetime
 import locale
+import os
 import pathlib
 import shutil
 import subprocess
 import sys
 import warnings
 
-from .core import clean_results, upload_results
-from .globals import LOGS_DIR
+from .core import (
+    assign_cases_to_shards,
+    clean_results,
+    discover_benchmark_cases,
+    get_shard_plan_checksum,
+    load_historical_case_costs,
+    parse_shard,
+    run_benchmark_cases,
+    upload_results,
+)
+from .globals import LOGS_DIR, PROFILES_DIR, QUICK_RESULTS_DIR, SHARDS_DIR
 from .setup import (
     clean_cache,
     generate_machine_file,
+    merge_results,
+    reduce_in_process_results,
     reduce_results,
     set_cache_directory,
 )
@@ -39,6 +51,81 @@ def clone_results_repo(repo_path: pathlib.Path) -> pathlib.Path:
     )
 
 
+def get_results_directory(results_dir: str = None) -> pathlib.Path:
+    """
+    Resolve the results directory, cloning the results repository to the default cache location if needed.
+
+    Args:
+        results_dir: Path to the results directory passed on the command line, if any
+    """
+    if results_dir:
+        results_dir = pathlib.Path(results_dir)
+        if not results_dir.exists():
+            raise FileNotFoundError(f"Results directory not found: {results_dir}")
+        return results_dir
+
+    # Use default cache location
+    cache_directory = pathlib.Path.home() / ".cache" / "nwb-benchmarks"
+    cache_directory.mkdir(parents=True, exist_ok=True)
+    repo_path = cache_directory / "nwb-benchmarks-results"
+    if not repo_path.exists():
+        warnings.warn(f"No results repository found at {repo_path}, attempting to clone from GitHub...")
+        return clone_results_repo(repo_path)
+    return repo_path
+
+
+def write_raw_environment_info(asv_root: pathlib.Path) -> pathlib.Path:
+    """
+    Save the latest environment list from conda (most thorough) to a file in the .asv directory.
+
+    Args:
+        asv_root: The .asv directory at the GitHub repository root
+    """
+    # subprocess tends to have issues inheriting `conda` entrypoint
+    shell = sys.platform == "win32"  # Use shell on Windows
+    raw_environment_info_file_path = asv_root / ".raw_environment_info.txt"
+    with open(file=raw_environment_info_file_path, mode="w") as stdout:
+        environment_info_process = subprocess.Popen(args=["conda", "list"], stdout=stdout, shell=shell)
+        environment_info_process.wait()
+
+    if not raw_environment_info_file_path.exists():
+        raise FileNotFoundError(f"Unable to create environment file at {raw_environment_info_file_path}!")
+
+    return raw_environment_info_file_path
+
+
+def quick_command(args: argparse.Namespace) -> None:
+    """
+    Run benchmarks in the current interpreter, skipping the subprocess overhead of ASV, and write reduced results.
+
+    Args:
+        args: Parsed command-line arguments from argparse
+    """
+    cases = discover_benchmark_cases(pattern=args.bench)
+    if len(cases) == 0:
+        print(f"No benchmark cases match the pattern '{args.bench}'.")
+        return
+
+    print(f"Running {len(cases)} benchmark cases in the current interpreter...\n")
+    results = run_benchmark_cases(cases=cases, show_traceback=args.debug)
+    if args.debug:
+        print("\nDebug mode is set - results were not written.")
+        return
+
+    asv_root = pathlib.Path(__file__).parent.parent.parent / ".asv"
+    asv_root.mkdir(exist_ok=True)
+    reduce_in_process_results(
+        machine_id=generate_machine_file(),
+        commit_hash=subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).decode("ascii").strip(),
+        results=results,
+        raw_environment_info_file_path=write_raw_environment_info(asv_root=asv_root),
+    )
+    print(
+        "Results of quick runs are not isolated from each other as those of ASV; they were written to "
+        f"{QUICK_RESULTS_DIR} and will not be uploaded."
+    )
+
+
 def generate_figures_command(args: argparse.Namespace) -> None:
     """
     Generate manuscript figures from benchmark results.
@@ -48,21 +135,7 @@ def generate_figures_command(args: argparse.Namespace) -> None:
     """
     from nwb_benchmarks.database import BenchmarkDatabase, BenchmarkVisualizer
 
-    # Determine results directory
-    if args.results_dir:
-        results_dir = pathlib.Path(args.results_dir)
-        if not results_dir.exists():
-            raise FileNotFoundError(f"Results directory not found: {results_dir}")
-    else:
-        # Use default cache location
-        cache_directory = pathlib.Path.home() / ".cache" / "nwb-benchmarks"
-        cache_directory.mkdir(parents=True, exist_ok=True)
-        repo_path = cache_directory / "nwb-benchmarks-results"
-        if not repo_path.exists():
-            warnings.warn(f"No results repository found at {repo_path}, attempting to clone from GitHub...")
-            results_dir = clone_results_repo(repo_path)
-        else:
-            results_dir = repo_path
+    results_dir = get_results_directory(results_dir=args.results_dir)
 
     # Set default output directory if not specified
     output_dir = pathlib.Path(args.output_dir) if args.output_dir else pathlib.Path.cwd() / "figures"
@@ -77,7 +150,26 @@ def generate_figures_command(args: argparse.Namespace) -> None:
 
     # Initialize visualizer and generate plots
     visualizer = BenchmarkVisualizer(output_directory=output_dir)
-    visualizer.plot_all(db)
+    visualizer.plot_all(db, max_workers=args.max_workers, force=args.force)
+
+
+def detect_regressions_command(args: argparse.Namespace) -> None:
+    """
+    Detect step changes in the benchmark results and write a ranked report.
+
+    Args:
+        args: Parsed command-line arguments from argparse
+    """
+    from nwb_benchmarks.database import BenchmarkDatabase, RegressionDetector
+
+    results_dir = get_results_directory(results_dir=args.results_dir)
+
+    db = BenchmarkDatabase(results_directory=results_dir, machine_id=args.machine_id, exclude_older=args.exclude_older)
+    db.create_database()
+
+    detector = RegressionDetector(db=db, threshold=args.threshold, confidence=args.confidence, method=args.method)
+    report = detector.write_report(file_path=pathlib.Path(args.output_file))
+    print(report.head(args.top))
 
 
 def main() -> None:
@@ -91,9 +183,17 @@ def main() -> None:
     flags_list = sys.argv[2:]
 
     debug_mode = "--debug" in flags_list
+    adaptive_mode = "--adaptive" in flags_list
+    latency_mode = "--latency" in flags_list
+    profile_mode = "--profile" in flags_list
     bench_mode = "--bench" in flags_list
     if bench_mode:
         specific_benchmark_pattern = flags_list[flags_list.index("--bench") + 1]
+    shard_mode = "--shard" in flags_list
+    shard = parse_shard(shard=flags_list[flags_list.index("--shard") + 1]) if shard_mode else None
+    if profile_mode and shard_mode:
+        # Profiled results are kept apart from the shards directory, so their shards could never be merged
+        raise ValueError("The flags --profile and --shard cannot be combined; profile the benchmarks without sharding.")
 
     if command == "run":
         try:
@@ -101,13 +201,16 @@ def main() -> None:
             asv_root = pathlib.Path(__file__).parent.parent.parent / ".asv"
             asv_root.mkdir(exist_ok=True)
             intermediate_results_folder = asv_root / "intermediate_results"
+            intermediate_profiles_folder = asv_root / "intermediate_profiles"
 
-            if intermediate_results_folder.exists():
+            for intermediate_folder in [intermediate_results_folder, intermediate_profiles_folder]:
+                if not intermediate_folder.exists():
+                    continue
                 try:
-                    shutil.rmtree(path=intermediate_results_folder)
+                    shutil.rmtree(path=intermediate_folder)
                 except:
                     message = (
-                        f"Unable to automatically remove {intermediate_results_folder} - please manually delete by running "
+                        f"Unable to automatically remove {intermediate_folder} - please manually delete by running "
                         "`nwb_benchmarks clean` and try again."
                     )
                     raise FileExistsError(message)
@@ -118,16 +221,7 @@ def main() -> None:
 
             commit_hash = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).decode("ascii").strip()
 
-            # Save latest environment list from conda (most thorough)
-            # subprocess tends to have issues inheriting `conda` entrypoint
-            shell = sys.platform == "win32"  # Use shell on Windows
-            raw_environment_info_file_path = asv_root / ".raw_environment_info.txt"
-            with open(file=raw_environment_info_file_path, mode="w") as stdout:
-                environment_info_process = subprocess.Popen(args=["conda", "list"], stdout=stdout, shell=shell)
-                environment_info_process.wait()
-
-            if not raw_environment_info_file_path.exists():
-                raise FileNotFoundError(f"Unable to create environment file at {raw_environment_info_file_path}!")
+            raw_environment_info_file_path = write_raw_environment_info(asv_root=asv_root)
 
             # Create log file path to capture all output from the ASV run
             timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
@@ -144,11 +238,39 @@ def main() -> None:
             ]
             if debug_mode:
                 cmd.extend(["--verbose", "--show-stderr"])
-            if bench_mode:
+            if shard_mode:
+                # Every machine computes the same assignment given the same cases and historical costs
+                cases = discover_benchmark_cases(pattern=specific_benchmark_pattern if bench_mode else None)
+                assignments = assign_cases_to_shards(
+                    cases=cases, number_of_shards=shard[1], costs=load_historical_case_costs()
+                )
+                shard_plan_checksum = get_shard_plan_checksum(assignments=assignments)
+                shard_cases = assignments[shard[0] - 1]
+                if len(shard_cases) == 0:
+                    print(f"Shard {shard[0]}/{shard[1]} has no benchmark cases to run.")
+                    return
+                print(
+                    f"Running {len(shard_cases)} of {len(cases)} benchmark cases in shard {shard[0]}/{shard[1]} "
+                    f"(shard plan {shard_plan_checksum})."
+                )
+                for case in shard_cases:
+                    cmd.extend(["--bench", case.selection_pattern])
+            elif bench_mode:
                 cmd.extend(["--bench", specific_benchmark_pattern])
 
+            # Adaptive sampling and latency distribution benchmarks are skipped unless enabled in the environment of
+            # the benchmark processes
+            environment = os.environ.copy()
+            if adaptive_mode:
+                environment["NWB_BENCHMARKS_ADAPTIVE_SAMPLING"] = "true"
+            if latency_mode:
+                environment["NWB_BENCHMARKS_LATENCY_DISTRIBUTION"] = "true"
+            # Each timed or tracked benchmark method appends the stacks sampled while it runs to a file in this folder
+            if profile_mode:
+                environment["NWB_BENCHMARKS_PROFILE_DIRECTORY"] = str(intermediate_profiles_folder)
+
             # Run ASV with all the desired flags and reroute the output to our main console
-            asv_process = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+            asv_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, env=environment)
             encoding = locale.getpreferredencoding()  # This is how ASV chooses to encode the output
 
             if debug_mode:
@@ -184,16 +306,70 @@ def main() -> None:
             ), f"A single intermediate result was not found in {intermediate_results_folder}. Please raise an issue."
             raw_results_file_path = globbed_json_file_paths[0]
 
-            reduce_results(
+            parsed_results_file = reduce_results(
                 machine_id=machine_id,
                 raw_results_file_path=raw_results_file_path,
                 raw_environment_info_file_path=raw_environment_info_file_path,
+                shard=shard,
+                shard_plan_checksum=shard_plan_checksum if shard_mode else None,
+                profiled=profile_mode,
             )
 
-            if not debug_mode:
+            if profile_mode and intermediate_profiles_folder.exists():
+                # Keep the profiles next to the results they were captured with
+                profiles_folder = parsed_results_file.parent / parsed_results_file.name.replace(
+                    "_results.json", "_profiles"
+                )
+                shutil.move(src=intermediate_profiles_folder, dst=profiles_folder)
+                print(f"Profiles written to:        {profiles_folder}\n")
+
+            if shard_mode:
+                print(
+                    "Partial results of this shard were not uploaded. Once all shards are complete, collect their "
+                    "results files on one machine and combine them with `nwb_benchmarks merge_results`."
+                )
+            elif profile_mode:
+                print(
+                    "Results of profiled runs include the overhead of the profiler; they were written to "
+                    f"{PROFILES_DIR} and will not be uploaded."
+                )
+            elif not debug_mode:
                 upload_results()
         finally:
             clean_cache()
+    elif command == "quick":
+        parser = argparse.ArgumentParser(
+            prog="nwb_benchmarks quick",
+            description="Run benchmarks in the current interpreter for quick iterations, without the ASV subprocesses",
+        )
+        parser.add_argument(
+            "--bench",
+            type=str,
+            help="Regular expression for the benchmark cases to run, as for `nwb_benchmarks run` (default: all)",
+        )
+        parser.add_argument(
+            "--debug", action="store_true", help="Show full tracebacks of failing benchmarks and do not write results"
+        )
+        args = parser.parse_args(sys.argv[2:])
+
+        try:
+            quick_command(args)
+        finally:
+            clean_cache()
+    elif command == "merge_results":
+        parser = argparse.ArgumentParser(
+            prog="nwb_benchmarks merge_results", description="Merge the results of the shards of a sharded run"
+        )
+        parser.add_argument(
+            "file_paths",
+            type=pathlib.Path,
+            nargs="*",
+            help=f"Results files of each shard (default: all files in {SHARDS_DIR})",
+        )
+        args = parser.parse_args(sys.argv[2:])
+
+        file_paths = args.file_paths or sorted(SHARDS_DIR.glob("*_results.json"))
+        merge_results(file_paths=file_paths)
     elif command == "upload":
         upload_results()
     elif command == "clean":
@@ -217,17 +393,69 @@ def main() -> None:
             type=str,
             help="Exclude results older than this date (format: YYYY-MM-DD, default: '2025-11-01')",
         )
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            help="Number of processes used to render figures (default: number of CPUs, use 1 to render serially)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-render all figures, even those whose inputs have not changed since the last render",
+        )
 
         args = parser.parse_args(sys.argv[2:])
         generate_figures_command(args)
+    elif command == "detect_regressions":
+        parser = argparse.ArgumentParser(
+            prog="nwb_benchmarks detect_regressions",
+            description="Detect statistically significant step changes in the benchmark results",
+        )
+        parser.add_argument(
+            "--results-dir",
+            type=str,
+            help="Path to benchmark results directory (default: ~/.cache/nwb-benchmarks/nwb-benchmarks-results or auto-clone from GitHub)",
+        )
+        parser.add_argument(
+            "--output-file",
+            type=str,
+            default="regressions.csv",
+            help="CSV file for the ranked report (default: ./regressions.csv)",
+        )
+        parser.add_argument("--machine-id", type=str, help="Only consider results from this machine (default: all)")
+        parser.add_argument(
+            "--exclude-older", type=str, help="Exclude results older than this date (format: YYYY-MM-DD)"
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.05,
+            help="Minimum relative change of the median to report (default: 0.05)",
+        )
+        parser.add_argument(
+            "--confidence", type=float, default=0.95, help="Required confidence level of a change (default: 0.95)"
+        )
+        parser.add_argument(
+            "--method",
+            choices=["mann-whitney", "bootstrap"],
+            default="mann-whitney",
+            help="Statistical test used to compare runs before and after a change (default: mann-whitney)",
+        )
+        parser.add_argument("--top", type=int, default=20, help="Number of changes to print (default: 20)")
+
+        args = parser.parse_args(sys.argv[2:])
+        detect_regressions_command(args)
     else:
         print(f"{command} is an invalid command.")
         print("\nAvailable commands:")
         print("  run                - Run benchmarks")
+        print("  quick              - Run benchmarks in the current interpreter")
+        print("  merge_results      - Merge results of a sharded run")
         print("  upload             - Upload results")
         print("  clean              - Clean results and cache")
         print("  config_set_cache   - Set cache directory")
         print("  generate_figures   - Generate manuscript figures")
+        print("  detect_regressions - Detect regressions in benchmark results")
 
 
 if __name__ == "__main__":
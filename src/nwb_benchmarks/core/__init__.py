@@ -1,51 +1,170 @@
 """Exposed imports to the `core` submodule."""
 
-from ._base_benchmark import BaseBenchmark
-from ._capture_connections import CaptureConnections
-from ._dandi import download_asset_if_not_exists, get_asset_path_from_url, get_https_url
-from ._network_profiler import NetworkProfiler
-from ._network_statistics import NetworkStatistics
-from ._network_tracker import network_activity_tracker
-from ._nwb_helpers import get_object_by_name
-from ._streaming import (
-    create_lindi_reference_file_system,
-    download_read_hdf5_pynwb_lindi,
-    read_hdf5_h5py_fsspec_https_no_cache,
-    read_hdf5_h5py_fsspec_https_with_cache,
-    read_hdf5_h5py_fsspec_s3_no_cache,
-    read_hdf5_h5py_fsspec_s3_with_cache,
-    read_hdf5_h5py_lindi,
-    read_hdf5_h5py_remfile_no_cache,
-    read_hdf5_h5py_remfile_with_cache,
-    read_hdf5_h5py_ros3,
-    read_hdf5_pynwb_fsspec_https_no_cache,
-    read_hdf5_pynwb_fsspec_https_with_cache,
-    read_hdf5_pynwb_fsspec_s3_no_cache,
-    read_hdf5_pynwb_fsspec_s3_with_cache,
-    read_hdf5_pynwb_lindi,
-    read_hdf5_pynwb_remfile_no_cache,
-    read_hdf5_pynwb_remfile_with_cache,
-    read_hdf5_pynwb_ros3,
-    read_zarr_pynwb_https,
-    read_zarr_pynwb_s3,
-    read_zarr_zarrpython_https,
-    read_zarr_zarrpython_s3,
-    robust_ros3_read,
-)
-from ._upload_and_clean_results import clean_results, upload_results
+import importlib
+
+# The streaming and network tooling import every reader library (and the DANDI client), which takes seconds;
+# submodules are therefore only imported on first access to one of their names (PEP 562)
+_SUBMODULE_NAMES = {
+    "_access_patterns": ["get_access_pattern_selections"],
+    "_adaptive_sampling": ["get_median_confidence_interval", "sample_adaptively"],
+    "_asset_conversion": [
+        "convert_zarr_to_v3",
+        "create_metadata_only_copy",
+        "get_metadata_only_copy",
+        "get_paged_hdf5_copy",
+        "get_zarr_v3_copy",
+        "repack_hdf5_with_paged_aggregation",
+    ],
+    "_async_streaming": ["open_hdf5_dataset_async", "open_zarr_array_async"],
+    "_base_benchmark": ["BaseBenchmark"],
+    "_benchmark_discovery": ["BenchmarkCase", "discover_benchmark_cases"],
+    "_capture_connections": ["CaptureConnections"],
+    "_chunk_layouts": [
+        "create_chunk_layout_copy",
+        "decode_chunks",
+        "get_chunk_codec",
+        "get_chunk_indices",
+        "get_chunk_layout_copy",
+        "get_zarr_chunk_keys",
+        "read_raw_chunks",
+    ],
+    "_dandi": ["download_asset_if_not_exists", "get_asset_path_from_url", "get_https_url"],
+    "_in_process_runner": ["run_benchmark_case", "run_benchmark_cases"],
+    "_latency_histogram": ["LatencyHistogram", "sample_latencies"],
+    "_local_file_server": ["LocalFileServer", "local_file_server"],
+    "_network_profiler": ["NetworkProfiler"],
+    "_network_statistics": ["NetworkStatistics"],
+    "_network_tracker": ["network_activity_tracker"],
+    "_nwb_helpers": [
+        "build_object_path_index",
+        "get_dataset_by_name",
+        "get_object_by_name",
+        "get_object_path_index",
+    ],
+    "_parallel_downloads": [
+        "download_byte_ranges",
+        "download_byte_ranges_fsspec",
+        "download_s3fs_multipart",
+        "download_zarr_files",
+        "fetch_byte_ranges",
+        "resolve_download_url",
+    ],
+    "_partial_downloads": ["download_hdf5_chunks_for_slices", "download_zarr_chunks_for_slices"],
+    "_prefetch": ["iterate_windows_with_prefetch"],
+    "_profiling": ["SamplingProfiler", "profile_top_functions"],
+    "_read_amplification": ["HTTPRequestCounter", "compute_read_amplification", "count_http_requests"],
+    "_sharding": [
+        "assign_cases_to_shards",
+        "get_shard",
+        "get_shard_plan_checksum",
+        "load_historical_case_costs",
+        "parse_shard",
+    ],
+    "_streaming": [
+        "create_lindi_reference_file_system",
+        "download_read_hdf5_pynwb_lindi",
+        "read_hdf5_h5py_fsspec_https_no_cache",
+        "read_hdf5_h5py_fsspec_https_with_cache",
+        "read_hdf5_h5py_fsspec_s3_no_cache",
+        "read_hdf5_h5py_fsspec_s3_with_cache",
+        "read_hdf5_h5py_lindi",
+        "read_hdf5_h5py_remfile_no_cache",
+        "read_hdf5_h5py_remfile_with_cache",
+        "read_hdf5_h5py_ros3",
+        "read_hdf5_pynwb_fsspec_https_no_cache",
+        "read_hdf5_pynwb_fsspec_https_with_cache",
+        "read_hdf5_pynwb_fsspec_s3_no_cache",
+        "read_hdf5_pynwb_fsspec_s3_with_cache",
+        "read_hdf5_pynwb_lindi",
+        "read_hdf5_pynwb_remfile_no_cache",
+        "read_hdf5_pynwb_remfile_with_cache",
+        "read_hdf5_pynwb_ros3",
+        "read_zarr_pynwb_https",
+        "read_zarr_pynwb_s3",
+        "read_zarr_zarrpython_https",
+        "read_zarr_zarrpython_s3",
+        "robust_ros3_read",
+    ],
+    "_synthetic_assets": [
+        "SyntheticDataChunkIterator",
+        "create_synthetic_nwbfile",
+        "get_synthetic_asset",
+        "write_synthetic_nwbfile",
+    ],
+    "_upload_and_clean_results": ["clean_results", "upload_results"],
+}
+_NAME_TO_SUBMODULE = {name: submodule for submodule, names in _SUBMODULE_NAMES.items() for name in names}
+
+
+def __getattr__(name: str):
+    if name not in _NAME_TO_SUBMODULE:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{_NAME_TO_SUBMODULE[name]}", __name__), name)
+    globals()[name] = value  # Cache so that later lookups bypass this function
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "BaseBenchmark",
+    "BenchmarkCase",
     "CaptureConnections",
+    "HTTPRequestCounter",
+    "LatencyHistogram",
+    "LocalFileServer",
     "NetworkProfiler",
     "NetworkStatistics",
+    "SamplingProfiler",
+    "SyntheticDataChunkIterator",
+    "assign_cases_to_shards",
+    "build_object_path_index",
     "clean_results",
+    "compute_read_amplification",
+    "convert_zarr_to_v3",
+    "count_http_requests",
+    "create_chunk_layout_copy",
     "create_lindi_reference_file_system",
+    "create_metadata_only_copy",
+    "create_synthetic_nwbfile",
+    "decode_chunks",
+    "discover_benchmark_cases",
     "download_asset_if_not_exists",
+    "download_byte_ranges",
+    "download_byte_ranges_fsspec",
+    "download_hdf5_chunks_for_slices",
+    "download_s3fs_multipart",
+    "download_zarr_chunks_for_slices",
+    "download_zarr_files",
+    "fetch_byte_ranges",
+    "get_access_pattern_selections",
+    "get_chunk_codec",
+    "get_chunk_indices",
+    "get_chunk_layout_copy",
     "get_https_url",
     "get_asset_path_from_url",
+    "get_dataset_by_name",
+    "get_median_confidence_interval",
+    "get_metadata_only_copy",
     "get_object_by_name",
+    "get_object_path_index",
+    "get_paged_hdf5_copy",
+    "get_shard",
+    "get_shard_plan_checksum",
+    "get_synthetic_asset",
+    "get_zarr_chunk_keys",
+    "get_zarr_v3_copy",
+    "iterate_windows_with_prefetch",
+    "load_historical_case_costs",
+    "local_file_server",
     "network_activity_tracker",
+    "open_hdf5_dataset_async",
+    "open_zarr_array_async",
+    "parse_shard",
+    "profile_top_functions",
     "download_read_hdf5_pynwb_lindi",
     "read_hdf5_h5py_fsspec_https_no_cache",
     "read_hdf5_h5py_fsspec_https_with_cache",
@@ -63,10 +182,18 @@ __all__ = [
     "read_hdf5_pynwb_remfile_no_cache",
     "read_hdf5_pynwb_remfile_with_cache",
     "read_hdf5_pynwb_ros3",
+    "read_raw_chunks",
     "read_zarr_pynwb_https",
     "read_zarr_pynwb_s3",
     "read_zarr_zarrpython_https",
     "read_zarr_zarrpython_s3",
+    "repack_hdf5_with_paged_aggregation",
+    "resolve_download_url",
     "robust_ros3_read",
+    "run_benchmark_case",
+    "run_benchmark_cases",
+    "sample_adaptively",
+    "sample_latencies",
     "upload_results",
+    "write_synthetic_nwbfile",
 ]
@@ -0,0 +1,94 @@
+"""
+Turn declarative access patterns, e.g., a scan of a recording in windows of 1 second, into the selections they read.
+
+An access pattern is a dictionary with a `pattern` key naming one of the patterns below and the keys that configure it:
+
+- `sequential_scan`: consecutive windows of `window_duration` seconds, for `number_of_windows` windows.
+- `sliding_window`: windows of `window_duration` seconds, each overlapping the previous one by `overlap` seconds.
+- `trial_aligned`: snippets from `time_before` seconds before to `time_after` seconds after the start of each of the
+  first `number_of_trials` trials of the trials table of the file.
+- `channel_subset`: consecutive windows of `window_duration` seconds of only the `channels` along the second axis.
+
+Times are converted to indices along the first axis from the rate or the timestamps of the time series of the dataset.
+"""
+
+from typing import List, Tuple, Union
+
+import h5py
+import numpy
+import zarr
+
+_TRIALS_START_TIME_PATH = "intervals/trials/start_time"
+
+
+class _SamplingTimes:
+    """Convert times in seconds to indices along the first axis of the data of a time series."""
+
+    def __init__(self, series_group: Union[h5py.Group, zarr.Group]):
+        if "timestamps" in series_group:
+            self.timestamps = series_group["timestamps"][:]
+            self.starting_time, self.rate = self.timestamps[0], None
+        else:
+            starting_time = series_group["starting_time"]
+            self.timestamps = None
+            # Scalars are stored as arrays of one element in Zarr NWB files
+            self.starting_time = float(numpy.ravel(starting_time[()])[0])
+            self.rate = float(starting_time.attrs["rate"])
+
+    def get_index(self, time: float) -> int:
+        if self.timestamps is not None:
+            return int(numpy.searchsorted(self.timestamps, time))
+        return max(int(round((time - self.starting_time) * self.rate)), 0)
+
+    def get_length(self, duration: float) -> int:
+        return self.get_index(time=self.starting_time + duration)
+
+
+def get_access_pattern_selections(
+    file: Union[h5py.File, zarr.Group], dataset: Union[h5py.Dataset, zarr.Array], access_pattern: dict
+) -> List[Tuple[Union[slice, List[int]], ...]]:
+    """
+    Get the selections of the data of a time series that an access pattern reads, in order.
+
+    Parameters
+    ----------
+    file : h5py.File or zarr.Group
+        The opened NWB file, in which the trials table is looked up for trial aligned patterns.
+    dataset : h5py.Dataset or zarr.Array
+        The `data` of a time series, whose group holds its rate or timestamps.
+    access_pattern : dict
+        The declarative access pattern; see the description of this module.
+
+    Returns
+    -------
+    list of tuple
+        The selection of each read, with a slice along the first axis, followed by a list of indices along the second
+        axis for the channel subsets.
+    """
+    sampling_times = _SamplingTimes(series_group=file[dataset.name.rsplit("/", maxsplit=1)[0]])
+    pattern = access_pattern["pattern"]
+
+    if pattern in ("sequential_scan", "sliding_window", "channel_subset"):
+        window_length = sampling_times.get_length(duration=access_pattern["window_duration"])
+        step_length = window_length - sampling_times.get_length(duration=access_pattern.get("overlap", 0.0))
+        starts = [step_length * window_index for window_index in range(access_pattern["number_of_windows"])]
+        window_slices = [
+            slice(start, min(start + window_length, dataset.shape[0])) for start in starts if start < dataset.shape[0]
+        ]
+    elif pattern == "trial_aligned":
+        if _TRIALS_START_TIME_PATH not in file:
+            raise ValueError("The file has no trials table to align the snippets to.")
+        trial_start_times = file[_TRIALS_START_TIME_PATH][: access_pattern["number_of_trials"]]
+        window_slices = [
+            slice(
+                sampling_times.get_index(time=trial_start_time - access_pattern["time_before"]),
+                min(sampling_times.get_index(time=trial_start_time + access_pattern["time_after"]), dataset.shape[0]),
+            )
+            for trial_start_time in trial_start_times
+        ]
+    else:
+        raise ValueError(f"Unknown access pattern '{pattern}'.")
+
+    if pattern == "channel_subset":
+        return [(window_slice, list(access_pattern["channels"])) for window_slice in window_slices]
+    return [(window_slice,) for window_slice in window_slices]
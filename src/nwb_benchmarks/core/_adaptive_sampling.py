@@ -0,0 +1,120 @@
+"""Adaptive sampling of noisy benchmarks until the median is known to a target precision."""
+
+import math
+import statistics
+import time
+from typing import Callable, List, Optional, Tuple
+
+
+def get_median_confidence_interval(samples: List[float], confidence: float = 0.95) -> Tuple[float, float]:
+    """
+    Distribution-free confidence interval of the median based on order statistics.
+
+    The ranks of the bounds follow from the normal approximation to the binomial distribution of the number of samples
+    below the median. For very few samples the interval spans the full range of the samples.
+
+    Parameters
+    ----------
+    samples : list of float
+        The measured values.
+    confidence : float, default: 0.95
+        The confidence level of the interval.
+
+    Returns
+    -------
+    tuple of float
+        The lower and upper bounds of the interval.
+    """
+    if len(samples) == 0:
+        raise ValueError("At least one sample is required to compute a confidence interval of the median.")
+
+    sorted_samples = sorted(samples)
+    number_of_samples = len(sorted_samples)
+    z_score = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_width = z_score * math.sqrt(number_of_samples) / 2
+
+    # One-based ranks of the order statistics, clipped to the available samples
+    lower_rank = max(1, math.floor(number_of_samples / 2 - half_width))
+    upper_rank = min(number_of_samples, math.ceil(number_of_samples / 2 + 1 + half_width))
+    return sorted_samples[lower_rank - 1], sorted_samples[upper_rank - 1]
+
+
+def sample_adaptively(
+    function: Callable[[], object],
+    setup: Optional[Callable[[], object]] = None,
+    teardown: Optional[Callable[[], object]] = None,
+    target_relative_width: float = 0.1,
+    time_budget: float = 300.0,
+    minimum_number_of_samples: int = 5,
+    maximum_number_of_samples: int = 100,
+    confidence: float = 0.95,
+) -> dict:
+    """
+    Time a function repeatedly until the confidence interval of the median is narrow enough or the budget runs out.
+
+    The first sample uses whatever state is already prepared (typically by the ASV `setup` of the benchmark).
+    Before each following sample, `teardown` and `setup` are called so that every sample starts from the same state;
+    the state of the last sample is left in place for the final ASV `teardown`.
+
+    Parameters
+    ----------
+    function : callable
+        The operation to time.
+    setup : callable, optional
+        Prepares the state for a sample; it is not included in the timing.
+    teardown : callable, optional
+        Cleans up the state of a sample; it is not included in the timing.
+    target_relative_width : float, default: 0.1
+        Stop once the width of the confidence interval relative to the median drops below this value.
+    time_budget : float, default: 300.0
+        Stop once this many seconds have elapsed, including the time spent in `setup` and `teardown`.
+    minimum_number_of_samples : int, default: 5
+        Always take at least this many samples, even if the budget is exceeded.
+    maximum_number_of_samples : int, default: 100
+        Never take more than this many samples.
+    confidence : float, default: 0.95
+        The confidence level of the interval of the median.
+
+    Returns
+    -------
+    dict
+        The timing samples along with the achieved confidence interval of the median, wrapped for compliance with the
+        `track_` benchmarks of ASV. The relative width of the interval is left out if the median is zero, e.g., below
+        the resolution of the timer, as it is undefined.
+    """
+    start_time = time.perf_counter()
+    samples = []
+    relative_width = None
+    lower_bound = upper_bound = None
+    while len(samples) < maximum_number_of_samples:
+        if len(samples) > 0:
+            if teardown is not None:
+                teardown()
+            if setup is not None:
+                setup()
+
+        sample_start_time = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - sample_start_time)
+
+        lower_bound, upper_bound = get_median_confidence_interval(samples=samples, confidence=confidence)
+        median = statistics.median(samples)
+        relative_width = (upper_bound - lower_bound) / median if median > 0 else None
+
+        if len(samples) < minimum_number_of_samples:
+            continue
+        if relative_width is not None and relative_width <= target_relative_width:
+            break
+        if time.perf_counter() - start_time >= time_budget:
+            break
+
+    adaptive_sampling_results = dict(
+        time=samples,
+        median_confidence_interval_lower=lower_bound,
+        median_confidence_interval_upper=upper_bound,
+        median_confidence_interval_relative_width=relative_width,
+        number_of_samples=len(samples),
+    )
+    # Undefined statistics are left out rather than written to the results as non-numeric values
+    adaptive_sampling_results = {key: value for key, value in adaptive_sampling_results.items() if value is not None}
+    return dict(samples=adaptive_sampling_results, number=None)
@@ -0,0 +1,454 @@
+"""Derive local variants of the benchmarked assets, e.g., to replay their metadata without any remote access."""
+
+import json
+import math
+import pathlib
+import posixpath
+import shutil
+import subprocess
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+import h5py
+import numpy
+import remfile
+import zarr
+
+from ..setup import get_persistent_download_directory
+
+
+def _is_object_reference_dtype(dtype: numpy.dtype) -> bool:
+    """Check if a dtype is, or is a compound type containing, an HDF5 object reference."""
+    if dtype.fields is not None:
+        return any(_is_object_reference_dtype(dtype=field_dtype) for field_dtype, *_ in dtype.fields.values())
+    return h5py.check_dtype(ref=dtype) is h5py.Reference
+
+
+def _remap_references(value: object, source_file: h5py.File, target_file: h5py.File) -> object:
+    """Replace the object references into the source file within a value by the same references into the target file."""
+
+    def remap_reference(reference: h5py.Reference) -> h5py.Reference:
+        if not reference:
+            return reference
+        return target_file[source_file[reference].name].ref
+
+    if isinstance(value, h5py.Reference):
+        return remap_reference(reference=value)
+    if not isinstance(value, numpy.ndarray):
+        return value
+
+    remapped_value = value.copy()
+    if value.dtype.fields is not None:
+        for field_name, (field_dtype, *_) in value.dtype.fields.items():
+            if _is_object_reference_dtype(dtype=field_dtype):
+                remapped_value[field_name] = _remap_references(
+                    value=value[field_name], source_file=source_file, target_file=target_file
+                )
+        return remapped_value
+
+    for index in numpy.ndindex(value.shape):
+        remapped_value[index] = remap_reference(reference=value[index])
+    return remapped_value
+
+
+def _copy_attributes(
+    source_object: Union[h5py.Group, h5py.Dataset],
+    target_object: Union[h5py.Group, h5py.Dataset],
+    deferred_references: List[Tuple],
+) -> None:
+    for attribute_name in source_object.attrs:
+        attribute_id = source_object.attrs.get_id(attribute_name)
+        value = source_object.attrs[attribute_name]
+        if _is_object_reference_dtype(dtype=attribute_id.dtype):
+            # References can only be remapped once every object exists in the target file
+            deferred_references.append((target_object, attribute_name, value))
+            continue
+        target_object.attrs.create(name=attribute_name, data=value, dtype=attribute_id.dtype)
+
+
+def _copy_group(
+    source_group: h5py.Group,
+    target_group: h5py.Group,
+    maximum_dataset_size: int,
+    copied_objects: Dict[h5py.h5g.GroupID | h5py.h5d.DatasetID, str],
+    deferred_references: List[Tuple],
+) -> None:
+    _copy_attributes(source_object=source_group, target_object=target_group, deferred_references=deferred_references)
+
+    for name in source_group:
+        link = source_group.get(name, getlink=True)
+        if isinstance(link, (h5py.SoftLink, h5py.ExternalLink)):
+            target_group[name] = link
+            continue
+
+        source_object = source_group[name]
+        if source_object.id in copied_objects:
+            # Additional hard link to an object that was already copied
+            target_group[name] = target_group.file[copied_objects[source_object.id]]
+            continue
+        copied_objects[source_object.id] = posixpath.join(target_group.name, name)
+
+        if isinstance(source_object, h5py.Group):
+            _copy_group(
+                source_group=source_object,
+                target_group=target_group.create_group(name=name),
+                maximum_dataset_size=maximum_dataset_size,
+                copied_objects=copied_objects,
+                deferred_references=deferred_references,
+            )
+            continue
+
+        # Keep the type, shape, chunking, and filters of every dataset by reusing its creation property list
+        dataset_creation_properties = source_object.id.get_create_plist()
+        # Large datasets are left unallocated; these are not read when constructing the NWB objects
+        copy_contents = (
+            source_object.shape is not None
+            and source_object.size * source_object.dtype.itemsize <= maximum_dataset_size
+        )
+        if not copy_contents and dataset_creation_properties.get_layout() != h5py.h5d.COMPACT:
+            dataset_creation_properties.set_alloc_time(h5py.h5d.ALLOC_TIME_LATE)
+
+        dataset_id = h5py.h5d.create(
+            target_group.id,
+            name.encode("utf-8"),
+            source_object.id.get_type(),
+            source_object.id.get_space(),
+            dcpl=dataset_creation_properties,
+        )
+        target_dataset = h5py.Dataset(dataset_id)
+        _copy_attributes(
+            source_object=source_object, target_object=target_dataset, deferred_references=deferred_references
+        )
+
+        if not copy_contents:
+            continue
+        if _is_object_reference_dtype(dtype=source_object.dtype):
+            deferred_references.append((target_dataset, None, source_object[()]))
+            continue
+        if source_object.size > 0:
+            _copy_dataset_contents(source_dataset=source_object, target_dataset=target_dataset)
+
+
+def _copy_dataset_contents(source_dataset: h5py.Dataset, target_dataset: h5py.Dataset, block_size: int = 2**27) -> None:
+    """Copy the contents of a dataset in blocks of whole rows of chunks of about `block_size` bytes."""
+    if source_dataset.ndim == 0 or source_dataset.size * source_dataset.dtype.itemsize <= block_size:
+        target_dataset[()] = source_dataset[()]
+        return
+
+    row_size = source_dataset.dtype.itemsize * math.prod(source_dataset.shape[1:])
+    chunk_length = source_dataset.chunks[0] if source_dataset.chunks is not None else 1
+    block_length = max(1, block_size // max(row_size, 1) // chunk_length) * chunk_length
+    for start in range(0, source_dataset.shape[0], block_length):
+        stop = min(start + block_length, source_dataset.shape[0])
+        target_dataset[start:stop] = source_dataset[start:stop]
+
+
+def create_metadata_only_copy(
+    source: Union[str, pathlib.Path, BinaryIO],
+    target_file_path: Union[str, pathlib.Path],
+    maximum_dataset_size: int = 2**20,
+) -> pathlib.Path:
+    """
+    Copy the structure and metadata of an HDF5 file without the contents of its large datasets.
+
+    All groups, attributes, and links are copied, as are the contents of datasets of up to `maximum_dataset_size`
+    bytes. Larger datasets are created with the same type, shape, chunking, and filters, but none of their chunks are
+    written, so that the copy has the metadata of the original at a fraction of the size. Object references
+    (including those in compound types) are remapped to the copied objects; region references are not supported.
+
+    Parameters
+    ----------
+    source : str, pathlib.Path, or file-like object
+        The HDF5 file to copy, e.g., a `remfile.File` to copy a remote file without downloading its data.
+    target_file_path : str or pathlib.Path
+        The path of the copy to write.
+    maximum_dataset_size : int, default: 1 MiB
+        The size in bytes above which the contents of a dataset are not copied.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the copy.
+    """
+    target_file_path = pathlib.Path(target_file_path)
+    with h5py.File(name=source, mode="r") as source_file, h5py.File(name=target_file_path, mode="w") as target_file:
+        _copy_file(source_file=source_file, target_file=target_file, maximum_dataset_size=maximum_dataset_size)
+
+    return target_file_path
+
+
+def _copy_file(source_file: h5py.File, target_file: h5py.File, maximum_dataset_size: float) -> None:
+    deferred_references = []
+    _copy_group(
+        source_group=source_file,
+        target_group=target_file,
+        maximum_dataset_size=maximum_dataset_size,
+        copied_objects={source_file.id: "/"},
+        deferred_references=deferred_references,
+    )
+
+    for target_object, attribute_name, value in deferred_references:
+        remapped_value = _remap_references(value=value, source_file=source_file, target_file=target_file)
+        if attribute_name is None:
+            target_object[()] = remapped_value
+        else:
+            dtype = source_file[target_object.name].attrs.get_id(attribute_name).dtype
+            target_object.attrs.create(name=attribute_name, data=remapped_value, dtype=dtype)
+
+
+def get_metadata_only_copy(https_url: str) -> pathlib.Path:
+    """
+    Get a local metadata-only copy of a remote HDF5 file, creating it in the persistent download directory if needed.
+
+    NOTE: Creating the copy reads all of the metadata of the remote file, which can take a while, so this function
+    should not be included in the timing or network tracking of benchmarks.
+    """
+    copies_directory = get_persistent_download_directory() / "metadata_only_copies"
+    copies_directory.mkdir(exist_ok=True)
+
+    # The last part of the S3 URL is the unique identifier of the blob
+    file_path = copies_directory / f"{posixpath.basename(https_url.rstrip('/'))}.nwb"
+    if file_path.exists():
+        return file_path
+
+    # Write to a partial file first so that an interrupted copy is not mistaken for a complete one
+    partial_file_path = file_path.with_name(f"{file_path.stem}.partial{file_path.suffix}")
+    create_metadata_only_copy(source=remfile.File(url=https_url), target_file_path=partial_file_path)
+    partial_file_path.rename(file_path)
+
+    return file_path
+
+
+def repack_hdf5_with_paged_aggregation(
+    source_file_path: Union[str, pathlib.Path],
+    target_file_path: Union[str, pathlib.Path],
+    page_size: int,
+) -> pathlib.Path:
+    """
+    Repack an HDF5 file with the paged aggregation file space strategy, which gathers its metadata into pages.
+
+    Uses `h5repack -S PAGE -G <page_size>` if it is on the PATH. Otherwise, all objects are copied with h5py into a new
+    file created with the same strategy, keeping the chunking and filters of every dataset and remapping object
+    references (but not region references).
+
+    Parameters
+    ----------
+    source_file_path : str or pathlib.Path
+        The HDF5 file to repack.
+    target_file_path : str or pathlib.Path
+        The path of the repacked file to write.
+    page_size : int
+        The size in bytes of the file space pages, e.g., as large as the reads of a streaming method.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the repacked file.
+    """
+    target_file_path = pathlib.Path(target_file_path)
+    h5repack = shutil.which("h5repack")
+    if h5repack is not None:
+        subprocess.run(
+            [h5repack, "-S", "PAGE", "-G", str(page_size), str(source_file_path), str(target_file_path)], check=True
+        )
+        return target_file_path
+
+    with h5py.File(name=source_file_path, mode="r") as source_file, h5py.File(
+        name=target_file_path, mode="w", fs_strategy="page", fs_persist=True, fs_page_size=page_size
+    ) as target_file:
+        _copy_file(source_file=source_file, target_file=target_file, maximum_dataset_size=math.inf)
+
+    return target_file_path
+
+
+def get_paged_hdf5_copy(source_file_path: Union[str, pathlib.Path], page_size: int) -> pathlib.Path:
+    """
+    Get a copy of a local HDF5 file repacked with paged aggregation, creating it in the persistent download directory if
+    needed.
+
+    NOTE: Repacking reads and writes all of the data of the file, which can take a long time for large files, so this
+    function should not be included in the timing or network tracking of benchmarks.
+    """
+    source_file_path = pathlib.Path(source_file_path)
+    copies_directory = get_persistent_download_directory() / "paged_copies"
+    copies_directory.mkdir(exist_ok=True)
+
+    file_path = copies_directory / f"{source_file_path.stem}_paged-{page_size}{source_file_path.suffix}"
+    if file_path.exists():
+        return file_path
+
+    # Write to a partial file first so that an interrupted repack is not mistaken for a complete one
+    partial_file_path = file_path.with_name(f"{file_path.stem}.partial{file_path.suffix}")
+    repack_hdf5_with_paged_aggregation(
+        source_file_path=source_file_path, target_file_path=partial_file_path, page_size=page_size
+    )
+    partial_file_path.rename(file_path)
+
+    return file_path
+
+
+def _iterate_zarr_v2_nodes(
+    store_path: pathlib.Path, path: str = ""
+) -> Iterator[Tuple[str, Union[Dict[str, Any], None], Dict[str, Any]]]:
+    """Iterate over the path, array metadata (`None` for groups), and attributes of all nodes of a Zarr v2 store."""
+    for child_path in sorted(store_path.joinpath(path).iterdir()):
+        if not child_path.is_dir():
+            continue
+
+        node_path = posixpath.join(path, child_path.name)
+        attributes_file_path = child_path / ".zattrs"
+        attributes = json.loads(attributes_file_path.read_text()) if attributes_file_path.exists() else dict()
+        if (child_path / ".zarray").exists():
+            yield node_path, json.loads((child_path / ".zarray").read_text()), attributes
+        elif (child_path / ".zgroup").exists():
+            yield node_path, None, attributes
+            yield from _iterate_zarr_v2_nodes(store_path=store_path, path=node_path)
+
+
+def _copy_zarr_array(source_array: zarr.Array, target_array: zarr.Array, block_length: int) -> None:
+    """Copy an array in blocks along its first axis, each spanning all of its other axes."""
+    if source_array.ndim == 0:
+        target_array[()] = source_array[()]
+        return
+
+    for start in range(0, source_array.shape[0], block_length):
+        stop = min(start + block_length, source_array.shape[0])
+        target_array[start:stop] = source_array[start:stop]
+
+
+def convert_zarr_to_v3(
+    source_path: Union[str, pathlib.Path],
+    target_path: Union[str, pathlib.Path],
+    array_path: str,
+    chunk_shape: Tuple[int, ...],
+    shard_shape: Optional[Tuple[int, ...]] = None,
+) -> pathlib.Path:
+    """
+    Convert a local Zarr v2 NWB file to Zarr v3, with the given chunk and shard layout for one of its arrays.
+
+    All groups and attributes are converted, as are the numeric arrays, which keep their original chunk shape except
+    for the array at `array_path`. Arrays of Python objects or compound types (e.g., the strings and object references
+    written by hdmf-zarr) cannot be read by Zarr-Python 3 and are left out, so the converted file can be read with
+    Zarr-Python but not with PyNWB.
+
+    Parameters
+    ----------
+    source_path : str or pathlib.Path
+        The Zarr v2 directory store to convert.
+    target_path : str or pathlib.Path
+        The path of the Zarr v3 directory store to write.
+    array_path : str
+        The path of the array within the store to rechunk, e.g., "acquisition/ElectricalSeries/data".
+    chunk_shape : tuple of int
+        The shape of the chunks of the array. With sharding, these are the inner chunks of each shard.
+    shard_shape : tuple of int, optional
+        The shape of the shards of the array, which must be a multiple of the chunk shape.
+        If not specified, the array is not sharded and every chunk is stored as a separate object.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the converted store.
+    """
+    if int(zarr.__version__.split(".")[0]) < 3:
+        raise ImportError(f"Converting to Zarr v3 requires Zarr-Python 3 or above (found {zarr.__version__}).")
+
+    source_path = pathlib.Path(source_path)
+    target_path = pathlib.Path(target_path)
+    root_attributes_file_path = source_path / ".zattrs"
+    target_group = zarr.open_group(
+        store=str(target_path),
+        mode="w",
+        zarr_format=3,
+        attributes=json.loads(root_attributes_file_path.read_text()) if root_attributes_file_path.exists() else None,
+    )
+
+    for node_path, array_metadata, attributes in _iterate_zarr_v2_nodes(store_path=source_path):
+        if array_metadata is None:
+            target_group.create_group(name=node_path, attributes=attributes)
+            continue
+        # Object and compound types are only readable through the object codecs of Zarr-Python 2
+        if not isinstance(array_metadata["dtype"], str) or "O" in array_metadata["dtype"]:
+            continue
+
+        source_array = zarr.open_array(store=str(source_path), path=node_path, mode="r", zarr_format=2)
+        if node_path == array_path:
+            if len(chunk_shape) != source_array.ndim:
+                raise ValueError(
+                    f"The chunk shape {chunk_shape} does not match the shape {source_array.shape} of '{array_path}'."
+                )
+            chunks, shards = tuple(chunk_shape), None if shard_shape is None else tuple(shard_shape)
+        else:
+            chunks, shards = source_array.chunks, None
+
+        target_array = target_group.create_array(
+            name=node_path,
+            shape=source_array.shape,
+            dtype=source_array.dtype,
+            chunks=chunks,
+            shards=shards,
+            fill_value=source_array.fill_value,
+            attributes=attributes,
+        )
+        # Write whole shards at a time, as writing part of a shard rewrites all of it
+        _copy_zarr_array(source_array=source_array, target_array=target_array, block_length=(shards or chunks)[0])
+
+    return target_path
+
+
+def get_zarr_v3_copy(
+    source_path: Union[str, pathlib.Path],
+    object_name: str,
+    chunk_shape: Tuple[int, ...],
+    shard_shape: Optional[Tuple[int, ...]] = None,
+) -> Tuple[pathlib.Path, str]:
+    """
+    Get a Zarr v3 copy of a local Zarr v2 NWB file with the given layout for the data of one of its objects.
+
+    The copies are created with `convert_zarr_to_v3` in the persistent download directory as needed, one per layout.
+
+    NOTE: Creating a copy reads and rewrites all of the numeric data of the file, which can take a while, so this
+    function should not be included in the timing of benchmarks.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the converted store.
+    str
+        The path of the data of the object within the store.
+    """
+    source_path = pathlib.Path(source_path)
+    matching_paths = [
+        node_path
+        for node_path, _, attributes in _iterate_zarr_v2_nodes(store_path=source_path)
+        if posixpath.basename(node_path) == object_name and "neurodata_type" in attributes
+    ]
+    if len(matching_paths) != 1:
+        raise ValueError(
+            f"The specified object name ({object_name}) was found {len(matching_paths)} times in {source_path}."
+        )
+    array_path = matching_paths[0]
+    if (source_path / array_path / ".zgroup").exists():
+        array_path = posixpath.join(array_path, "data")
+
+    copies_directory = get_persistent_download_directory() / "zarr_v3_copies"
+    copies_directory.mkdir(exist_ok=True)
+
+    layout = "chunks-" + "x".join(str(length) for length in chunk_shape)
+    if shard_shape is not None:
+        layout += "_shards-" + "x".join(str(length) for length in shard_shape)
+    target_path = copies_directory / f"{source_path.name.removesuffix('.nwb.zarr')}_{object_name}_{layout}.nwb.zarr"
+    if target_path.exists():
+        return target_path, array_path
+
+    # Write to a partial store first so that an interrupted conversion is not mistaken for a complete one
+    partial_target_path = target_path.with_name(f"{target_path.name}.partial")
+    convert_zarr_to_v3(
+        source_path=source_path,
+        target_path=partial_target_path,
+        array_path=array_path,
+        chunk_shape=chunk_shape,
+        shard_shape=shard_shape,
+    )
+    partial_target_path.rename(target_path)
+
+    return target_path, array_path
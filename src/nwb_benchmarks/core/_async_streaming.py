@@ -0,0 +1,197 @@
+"""
+Helpers for reading slices of remote datasets from asyncio code, fetching their chunks concurrently with the async
+HTTPS filesystem of fsspec.
+
+Neither h5py nor Zarr-Python 2 can be awaited, so the chunks that a slice touches are fetched asynchronously and the
+slice is then read by the library from those chunks in memory, without blocking the event loop on the network. With
+Zarr-Python 3 or above, the native asynchronous arrays of Zarr are used instead.
+"""
+
+import asyncio
+import bisect
+import io
+from typing import Dict, Tuple, Union
+
+import h5py
+import numpy
+import remfile
+import zarr
+from fsspec.implementations.http import HTTPFileSystem
+
+from ._chunk_layouts import get_chunk_indices, get_zarr_chunk_keys
+from ._nwb_helpers import build_object_path_index, get_dataset_by_name
+from ._partial_downloads import _get_hdf5_byte_ranges
+
+ZARR_V3_AVAILABLE = int(zarr.__version__.split(".")[0]) >= 3
+
+
+class _FetchedRangesFile(io.RawIOBase):
+    """
+    A read-only file-like object that serves reads from byte ranges fetched in advance, and from the remote file it
+    wraps otherwise (e.g., for the metadata).
+    """
+
+    def __init__(self, file: remfile.File):
+        self._file = file
+        self._starts = []
+        self._ranges = dict()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._file.seek(offset, whence)
+        return self._file.tell()
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def add_range(self, start: int, data: bytes):
+        if start not in self._ranges:
+            bisect.insort(self._starts, start)
+        self._ranges[start] = data
+
+    def remove_range(self, start: int):
+        if self._ranges.pop(start, None) is not None:
+            self._starts.remove(start)
+
+    def readinto(self, buffer) -> int:
+        position = self._file.tell()
+        index = bisect.bisect_right(self._starts, position) - 1
+        if index >= 0:
+            data = self._ranges[self._starts[index]]
+            offset = position - self._starts[index]
+            if offset + len(buffer) <= len(data):
+                buffer[:] = data[offset : offset + len(buffer)]
+                self._file.seek(position + len(buffer))
+                return len(buffer)
+
+        data = self._file.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+class _AsyncHDF5Dataset:
+    """A dataset of a remote HDF5 file whose slices are read by fetching their chunks asynchronously."""
+
+    def __init__(self, https_url: str, object_name: str, filesystem: HTTPFileSystem):
+        self._https_url = https_url
+        self._filesystem = filesystem
+        self._file = _FetchedRangesFile(file=remfile.File(url=https_url))
+        self._h5py_file = h5py.File(name=self._file, mode="r")
+        object_path_index = build_object_path_index(file=self._h5py_file)
+        self.dataset = get_dataset_by_name(
+            file=self._h5py_file, object_name=object_name, object_path_index=object_path_index
+        )
+
+    async def getitem(self, selection: Tuple[slice, ...]) -> numpy.ndarray:
+        # Locating the chunks only reads metadata, which is cached by HDF5 after the first slices
+        byte_ranges = _get_hdf5_byte_ranges(dataset=self.dataset, slice_range=selection)
+        parts = await asyncio.gather(
+            *(self._filesystem._cat_file(self._https_url, start=start, end=stop) for start, stop in byte_ranges)
+        )
+
+        # Nothing is awaited from here, so the ranges of other slices read concurrently cannot be removed in between
+        for (start, _), part in zip(byte_ranges, parts):
+            self._file.add_range(start=start, data=part)
+        try:
+            return self.dataset[selection]
+        finally:
+            for start, _ in byte_ranges:
+                self._file.remove_range(start=start)
+
+    def close(self):
+        self._h5py_file.close()
+        self._file.close()
+
+
+class _AsyncZarrV2Array:
+    """An array of a remote Zarr v2 store whose slices are read by fetching their chunks asynchronously."""
+
+    def __init__(self, https_url: str, object_name: str, filesystem: HTTPFileSystem):
+        self._https_url = https_url.rstrip("/")
+        self._filesystem = filesystem
+        zarr_file = zarr.open_consolidated(store=https_url, mode="r")
+        object_path_index = build_object_path_index(file=zarr_file)
+        self.remote_array = get_dataset_by_name(
+            file=zarr_file, object_name=object_name, object_path_index=object_path_index
+        )
+
+        # The metadata is served by the consolidated metadata, and the chunks from those fetched for each slice
+        self._chunks: Dict[str, bytes] = dict()
+        self._array = zarr.Array(
+            store=self.remote_array.store, path=self.remote_array.path, read_only=True, chunk_store=self._chunks
+        )
+
+    async def _fetch_chunk(self, chunk_key: str) -> Union[bytes, None]:
+        try:
+            return await self._filesystem._cat_file(f"{self._https_url}/{chunk_key}")
+        except FileNotFoundError:
+            # Chunks that were never written are filled in with the fill value when read
+            return None
+
+    async def getitem(self, selection: Tuple[slice, ...]) -> numpy.ndarray:
+        chunk_keys = get_zarr_chunk_keys(
+            array=self.remote_array,
+            chunk_indices=get_chunk_indices(dataset=self.remote_array, slice_range=selection),
+        )
+        chunks = await asyncio.gather(*(self._fetch_chunk(chunk_key=chunk_key) for chunk_key in chunk_keys))
+
+        # Nothing is awaited from here, so the chunks of other slices read concurrently cannot be removed in between
+        self._chunks.update({key: chunk for key, chunk in zip(chunk_keys, chunks) if chunk is not None})
+        try:
+            return self._array[selection]
+        finally:
+            for chunk_key in chunk_keys:
+                self._chunks.pop(chunk_key, None)
+
+
+async def open_hdf5_dataset_async(https_url: str, object_name: str, filesystem: HTTPFileSystem) -> _AsyncHDF5Dataset:
+    """
+    Open a dataset of a remote HDF5 file for reading slices with `await dataset.getitem(selection)`.
+
+    The chunks of each slice are fetched concurrently with the async HTTPS filesystem, so that many slices can be read
+    concurrently with `asyncio.gather`; the metadata of the file is still read synchronously, mostly when opening it.
+
+    Parameters
+    ----------
+    https_url : str
+        The URL of the HDF5 file, which must support range requests.
+    object_name : str
+        The name of the dataset, as found by `get_dataset_by_name`.
+    filesystem : fsspec.implementations.http.HTTPFileSystem
+        An HTTPS filesystem created with `asynchronous=True` within the running event loop.
+    """
+    return _AsyncHDF5Dataset(https_url=https_url, object_name=object_name, filesystem=filesystem)
+
+
+async def open_zarr_array_async(
+    https_url: str, object_name: str, filesystem: HTTPFileSystem
+) -> Union[_AsyncZarrV2Array, "zarr.AsyncArray"]:
+    """
+    Open an array of a remote Zarr store for reading slices with `await array.getitem(selection)`.
+
+    With Zarr-Python 3 or above, this is a native `zarr.AsyncArray` over the given filesystem. Otherwise, the chunks of
+    each slice are fetched concurrently with the filesystem, so that many slices can be read concurrently with
+    `asyncio.gather`; this requires the store to have consolidated metadata.
+
+    Parameters
+    ----------
+    https_url : str
+        The URL of the Zarr store.
+    object_name : str
+        The name of the array, as found by `get_dataset_by_name`.
+    filesystem : fsspec.implementations.http.HTTPFileSystem
+        An HTTPS filesystem created with `asynchronous=True` within the running event loop.
+    """
+    if not ZARR_V3_AVAILABLE:
+        return _AsyncZarrV2Array(https_url=https_url, object_name=object_name, filesystem=filesystem)
+
+    zarr_file = zarr.open_group(store=https_url, mode="r")
+    object_path_index = build_object_path_index(file=zarr_file)
+    array = get_dataset_by_name(file=zarr_file, object_name=object_name, object_path_index=object_path_index)
+    store = zarr.storage.FsspecStore(fs=filesystem, path=https_url.rstrip("/"), read_only=True)
+    return await zarr.api.asynchronous.open_array(store=store, path=array.path, mode="r")
@@ -1,6 +1,60 @@
+import functools
+import os
+import pathlib
+import re
+from typing import Callable
+
+from ._profiling import SamplingProfiler
+
+# Set by `nwb_benchmarks run --profile` in the environment of the benchmark processes
+PROFILE_DIRECTORY_ENVIRONMENT_VARIABLE = "NWB_BENCHMARKS_PROFILE_DIRECTORY"
+
+
+def _get_profile_file_path(benchmark: object, method_name: str, args: tuple) -> pathlib.Path:
+    """Get the file for the profile of a benchmark case, keyed by the benchmark name and the parameter case."""
+    benchmark_class = type(benchmark)
+    benchmark_name = (
+        f"{benchmark_class.__module__.rsplit('.', maxsplit=1)[-1]}.{benchmark_class.__name__}.{method_name}"
+    )
+
+    first_param = args[0] if len(args) > 0 else None
+    parameter_case_name = first_param.get("name") if isinstance(first_param, dict) else None
+    if parameter_case_name is None:
+        parameter_case_name = ", ".join(repr(arg) for arg in args) if len(args) > 0 else "default"
+    parameter_case_name = re.sub(pattern=r"[^\w.-]+", repl="_", string=parameter_case_name)
+
+    return (
+        pathlib.Path(os.environ[PROFILE_DIRECTORY_ENVIRONMENT_VARIABLE]) / benchmark_name / f"{parameter_case_name}.txt"
+    )
+
+
+def _wrap_with_sampling_profiler(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def profiled_method(self, *args):
+        with SamplingProfiler() as profiler:
+            result = method(self, *args)
+        profiler.write_collapsed_stacks(
+            file_path=_get_profile_file_path(benchmark=self, method_name=method.__name__, args=args)
+        )
+        return result
+
+    return profiled_method
+
+
 class BaseBenchmark:
     """Base class for NWB benchmarks."""
 
     rounds = 1
     repeat = 1
     warmup_time = 0.0
+
+    def __init_subclass__(cls, **kwargs):
+        """When profiling, wrap the timed and tracked methods of each benchmark in a sampling profiler."""
+        super().__init_subclass__(**kwargs)
+        if os.environ.get(PROFILE_DIRECTORY_ENVIRONMENT_VARIABLE) is None:
+            return
+
+        # Raw timing benchmarks are run in a separate interpreter and so cannot be profiled from here
+        for attribute_name, attribute in list(vars(cls).items()):
+            if callable(attribute) and attribute_name.startswith(("time_", "track_")):
+                setattr(cls, attribute_name, _wrap_with_sampling_profiler(method=attribute))
@@ -0,0 +1,105 @@
+"""Discover benchmark cases in the same way as ASV, without running them."""
+
+import dataclasses
+import importlib
+import inspect
+import itertools
+import pkgutil
+import re
+from typing import List, Optional
+
+# The benchmark types recognized by ASV, by method name prefix
+BENCHMARK_PREFIXES = ("time_", "timeraw_", "track_", "mem_", "peakmem_")
+
+
+def _repr_no_address(obj: object) -> str:
+    """Mimic the parameter representation used by ASV, which strips memory addresses from default reprs."""
+    result = repr(obj)
+    match = re.match(pattern=r"^(<.*) at (0x[\da-fA-F]*)(>)$", string=result)
+    if match is not None:
+        result = match.group(1) + match.group(3)
+    return result
+
+
+@dataclasses.dataclass
+class BenchmarkCase:
+    """A single combination of benchmark method and parameters, as scheduled by ASV."""
+
+    name: str
+    benchmark_class: type
+    method_name: str
+    params: tuple
+    params_repr: str
+
+    @property
+    def full_name(self) -> str:
+        """The name of the case as matched by `asv run --bench`."""
+        return f"{self.name}({self.params_repr})" if self.params_repr else self.name
+
+    @property
+    def selection_pattern(self) -> str:
+        """A regular expression for `asv run --bench` that selects only this case."""
+        return f"^{re.escape(self.full_name)}$"
+
+    @property
+    def is_skipped(self) -> bool:
+        """Whether the method was marked to be skipped using the decorators from `asv_runner.benchmarks.mark`."""
+        method = getattr(self.benchmark_class, self.method_name)
+        return getattr(method, "skip_benchmark", False) or self.params in getattr(method, "skip_params", [])
+
+
+def get_benchmark_parameters(benchmark_class: type, method_name: str) -> List[list]:
+    """Get the parameter axes of a benchmark method, normalized to a list of lists as in ASV."""
+    method = getattr(benchmark_class, method_name)
+    params = getattr(method, "params", getattr(benchmark_class, "params", []))
+    if len(params) > 0 and not isinstance(params[0], (tuple, list)):
+        params = [params]
+    return [list(axis) for axis in params]
+
+
+def discover_benchmark_cases(
+    pattern: Optional[str] = None, package_name: str = "nwb_benchmarks.benchmarks"
+) -> List[BenchmarkCase]:
+    """
+    Enumerate every benchmark method and parameter combination in the benchmarks package.
+
+    Parameters
+    ----------
+    pattern : str, optional
+        Only keep cases whose name (or name with parameters) matches this regular expression, following the same
+        rules as the `--bench` flag of `asv run`.
+    package_name : str, default: "nwb_benchmarks.benchmarks"
+        The package containing the benchmark modules.
+
+    Returns
+    -------
+    list of BenchmarkCase
+        The discovered cases in a deterministic order.
+    """
+    package = importlib.import_module(name=package_name)
+
+    cases = []
+    for module_info in sorted(pkgutil.iter_modules(path=package.__path__), key=lambda info: info.name):
+        module = importlib.import_module(name=f"{package_name}.{module_info.name}")
+        for class_name, benchmark_class in inspect.getmembers(module, predicate=inspect.isclass):
+            if class_name.startswith("_") or inspect.isabstract(benchmark_class):
+                continue
+
+            for method_name, method in inspect.getmembers(benchmark_class, predicate=callable):
+                if not method_name.startswith(BENCHMARK_PREFIXES):
+                    continue
+
+                name = f"{module_info.name}.{class_name}.{method_name}"
+                params = get_benchmark_parameters(benchmark_class=benchmark_class, method_name=method_name)
+                for param_combination in itertools.product(*params):
+                    case = BenchmarkCase(
+                        name=name,
+                        benchmark_class=benchmark_class,
+                        method_name=method_name,
+                        params=param_combination,
+                        params_repr=", ".join(_repr_no_address(obj=param) for param in param_combination),
+                    )
+                    if pattern is None or re.search(pattern, name) or re.search(pattern, case.full_name):
+                        cases.append(case)
+
+    return cases
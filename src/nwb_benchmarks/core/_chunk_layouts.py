@@ -0,0 +1,256 @@
+"""Rewrite the data of the benchmarked assets with other chunk shapes and codecs, and access their raw chunks."""
+
+import concurrent.futures
+import itertools
+import json
+import math
+import pathlib
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import h5py
+import numcodecs
+import zarr
+
+from ._dandi import get_asset_path_from_url
+from ._nwb_helpers import build_object_path_index, get_dataset_by_name
+from ..setup import get_persistent_download_directory
+
+# The codecs of the layout grid; gzip is built into HDF5, while Blosc requires the filters of `hdf5plugin`
+CHUNK_LAYOUT_CODECS = ("none", "gzip-1", "gzip-4", "gzip-9", "blosc-lz4", "blosc-zstd")
+
+
+def _get_hdf5_compression_options(codec: str) -> Dict[str, Any]:
+    """Get the keyword arguments of `h5py.Group.create_dataset` to compress a dataset with a codec of the grid."""
+    if codec == "none":
+        return dict()
+    if codec.startswith("gzip-"):
+        return dict(compression="gzip", compression_opts=int(codec.removeprefix("gzip-")))
+    if codec.startswith("blosc-"):
+        try:
+            # Importing hdf5plugin also registers its filters, which are needed to read the data as well
+            import hdf5plugin
+        except ImportError:
+            raise ImportError(f"Writing or reading HDF5 data with the '{codec}' codec requires hdf5plugin.")
+        return dict(hdf5plugin.Blosc(cname=codec.removeprefix("blosc-"), clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE))
+    raise ValueError(f"Unknown codec '{codec}'; expected one of {CHUNK_LAYOUT_CODECS}.")
+
+
+def get_chunk_codec(codec: str) -> Optional[numcodecs.abc.Codec]:
+    """
+    Get the numcodecs codec that compresses the chunks of the Zarr rewrites with a codec of the grid.
+
+    The raw chunks of the HDF5 rewrites use the same formats (a zlib stream for gzip, and a Blosc buffer), so that these
+    codecs also decode those outside of the HDF5 filter pipeline. Returns `None` for uncompressed chunks.
+    """
+    if codec == "none":
+        return None
+    if codec.startswith("gzip-"):
+        return numcodecs.Zlib(level=int(codec.removeprefix("gzip-")))
+    if codec.startswith("blosc-"):
+        return numcodecs.Blosc(cname=codec.removeprefix("blosc-"), clevel=5, shuffle=numcodecs.Blosc.SHUFFLE)
+    raise ValueError(f"Unknown codec '{codec}'; expected one of {CHUNK_LAYOUT_CODECS}.")
+
+
+def create_chunk_layout_copy(
+    source_dataset: Union[h5py.Dataset, zarr.Array],
+    target_path: Union[str, pathlib.Path],
+    backend: str,
+    chunk_shape: Tuple[int, ...],
+    codec: str,
+    number_of_rows: Optional[int] = None,
+) -> pathlib.Path:
+    """
+    Rewrite a dataset into a new HDF5 file or Zarr store with the given chunk shape and codec.
+
+    The data is written to the `data` dataset at the root of the new file, which holds none of the other contents of
+    the NWB file it came from.
+
+    Parameters
+    ----------
+    source_dataset : h5py.Dataset or zarr.Array
+        The dataset to rewrite.
+    target_path : str or pathlib.Path
+        The path of the HDF5 file or Zarr directory store to write.
+    backend : "hdf5" or "zarr"
+        The format to write.
+    chunk_shape : tuple of int
+        The shape of the chunks of the rewritten data.
+    codec : str
+        The codec to compress each chunk with; one of "none", "gzip-<level>", "blosc-lz4", or "blosc-zstd".
+        Blosc is applied with byte shuffling and compression level 5.
+    number_of_rows : int, optional
+        The number of rows along the first axis to rewrite, e.g., to only cover the benchmarked slices of large
+        datasets. By default, all of the data is rewritten.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the rewritten file.
+    """
+    target_path = pathlib.Path(target_path)
+    shape = source_dataset.shape
+    if number_of_rows is not None:
+        shape = (min(number_of_rows, shape[0]), *shape[1:])
+    if len(chunk_shape) != len(shape):
+        raise ValueError(f"The chunk shape {chunk_shape} does not match the shape {shape} of the dataset.")
+    # HDF5 does not allow chunks larger than a fixed-size dataset
+    chunk_shape = tuple(min(chunk_length, max(length, 1)) for chunk_length, length in zip(chunk_shape, shape))
+
+    if backend == "hdf5":
+        target_file = h5py.File(name=target_path, mode="w")
+        target_dataset = target_file.create_dataset(
+            name="data",
+            shape=shape,
+            dtype=source_dataset.dtype,
+            chunks=chunk_shape,
+            **_get_hdf5_compression_options(codec=codec),
+        )
+    elif backend == "zarr":
+        target_file = None
+        target_dataset = zarr.open_array(
+            store=str(target_path),
+            mode="w",
+            path="data",
+            shape=shape,
+            dtype=source_dataset.dtype,
+            chunks=chunk_shape,
+            compressor=get_chunk_codec(codec=codec),
+        )
+    else:
+        raise ValueError(f"Unknown backend '{backend}'; expected 'hdf5' or 'zarr'.")
+
+    # Write whole rows of chunks at a time, so that each chunk is compressed once
+    for start in range(0, shape[0], chunk_shape[0]):
+        stop = min(start + chunk_shape[0], shape[0])
+        target_dataset[start:stop] = source_dataset[start:stop]
+
+    if target_file is not None:
+        target_file.close()
+    return target_path
+
+
+def get_chunk_layout_copy(
+    https_url: str,
+    object_name: str,
+    backend: str,
+    chunk_shape: Tuple[int, ...],
+    codec: str,
+    number_of_rows: Optional[int] = None,
+) -> pathlib.Path:
+    """
+    Get a rewrite of the data of an object of a downloaded asset with the given chunk shape and codec.
+
+    The rewrites are created with `create_chunk_layout_copy` from the asset in the persistent download directory as
+    needed, one per layout. Raises a `FileNotFoundError` if the asset was not downloaded, and an `ImportError` if the
+    codec is not available for the backend.
+
+    NOTE: Creating a rewrite reads and compresses all of the data to rewrite, which can take a while, so this function
+    should not be included in the timing of benchmarks.
+    """
+    # Check the codec before any cached rewrite is returned, as this also registers the HDF5 filters it needs
+    if backend == "hdf5":
+        _get_hdf5_compression_options(codec=codec)
+
+    source_path = get_persistent_download_directory() / get_asset_path_from_url(https_url=https_url)
+    if not source_path.exists():
+        raise FileNotFoundError(f"Expected the asset {source_path} to be downloaded to rewrite its data.")
+
+    rewrites_directory = get_persistent_download_directory() / "chunk_layouts"
+    rewrites_directory.mkdir(exist_ok=True)
+
+    rows = "all-rows" if number_of_rows is None else f"{number_of_rows}-rows"
+    chunks = "x".join(str(length) for length in chunk_shape)
+    suffix = ".h5" if backend == "hdf5" else ".zarr"
+    target_path = rewrites_directory / f"{source_path.name}_{object_name}_{rows}_chunks-{chunks}_{codec}{suffix}"
+    if target_path.exists():
+        return target_path
+
+    source_file = (
+        h5py.File(name=source_path, mode="r") if source_path.is_file() else zarr.open(str(source_path), mode="r")
+    )
+    try:
+        source_dataset = get_dataset_by_name(
+            file=source_file, object_name=object_name, object_path_index=build_object_path_index(file=source_file)
+        )
+
+        # Write to a partial file first so that an interrupted rewrite is not mistaken for a complete one
+        # The suffix is appended rather than replaced, as the names of layouts can contain dots (e.g., of the asset)
+        partial_target_path = target_path.with_name(f"{target_path.name}.partial")
+        create_chunk_layout_copy(
+            source_dataset=source_dataset,
+            target_path=partial_target_path,
+            backend=backend,
+            chunk_shape=chunk_shape,
+            codec=codec,
+            number_of_rows=number_of_rows,
+        )
+        partial_target_path.rename(target_path)
+    finally:
+        if isinstance(source_file, h5py.File):
+            source_file.close()
+
+    return target_path
+
+
+def get_chunk_indices(
+    dataset: Union[h5py.Dataset, zarr.Array], slice_range: Tuple[slice, ...]
+) -> List[Tuple[int, ...]]:
+    """Get the indices in the chunk grid of a dataset of all chunks that intersect a slice."""
+    index_ranges = []
+    for axis, (length, chunk_length) in enumerate(zip(dataset.shape, dataset.chunks)):
+        start, stop, _ = (slice_range[axis] if axis < len(slice_range) else slice(None)).indices(length)
+        index_ranges.append(range(start // chunk_length, math.ceil(stop / chunk_length)))
+    return list(itertools.product(*index_ranges))
+
+
+def get_zarr_chunk_keys(array: zarr.Array, chunk_indices: List[Tuple[int, ...]]) -> List[str]:
+    """Get the keys in the store of a Zarr array of the chunks at indices of its chunk grid."""
+    array_metadata_key = f"{array.path}/.zarray" if array.path else ".zarray"
+    array_metadata = array.store[array_metadata_key]
+    # The store of a consolidated group serves the metadata already parsed
+    if not isinstance(array_metadata, dict):
+        array_metadata = json.loads(array_metadata)
+    # Arrays written without a dimension separator in their metadata use the default of Zarr v2
+    dimension_separator = array_metadata.get("dimension_separator") or "."
+    key_prefix = f"{array.path}/" if array.path else ""
+    return [key_prefix + dimension_separator.join(str(index) for index in chunk_index) for chunk_index in chunk_indices]
+
+
+def read_raw_chunks(dataset: Union[h5py.Dataset, zarr.Array], chunk_indices: List[Tuple[int, ...]]) -> List[bytes]:
+    """
+    Read the stored (i.e., still compressed) bytes of chunks of a dataset, without passing them through any filters.
+
+    Chunks that were never written are skipped.
+    """
+    raw_chunks = []
+    if isinstance(dataset, h5py.Dataset):
+        for chunk_index in chunk_indices:
+            offset = tuple(index * chunk_length for index, chunk_length in zip(chunk_index, dataset.chunks))
+            if dataset.id.get_chunk_info_by_coord(offset).byte_offset is None:
+                continue
+            _, raw_chunk = dataset.id.read_direct_chunk(offset)
+            raw_chunks.append(bytes(raw_chunk))
+    else:
+        for chunk_key in get_zarr_chunk_keys(array=dataset, chunk_indices=chunk_indices):
+            raw_chunk = dataset.chunk_store.get(chunk_key)
+            if raw_chunk is None:
+                continue
+            raw_chunks.append(bytes(raw_chunk))
+    return raw_chunks
+
+
+def decode_chunks(
+    raw_chunks: List[bytes],
+    codec: Optional[numcodecs.abc.Codec],
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> List[bytes]:
+    """
+    Decode raw chunks with a numcodecs codec, optionally spreading the chunks over the workers of an executor.
+
+    The codecs release the GIL while decoding, so that a thread pool decodes several chunks in parallel.
+    """
+    if codec is None:
+        return raw_chunks
+    if executor is None:
+        return [codec.decode(raw_chunk) for raw_chunk in raw_chunks]
+    return list(executor.map(codec.decode, raw_chunks))
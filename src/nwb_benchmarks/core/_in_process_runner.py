@@ -0,0 +1,123 @@
+"""Run benchmark cases in the current interpreter, without the per-benchmark subprocesses of ASV."""
+
+import subprocess
+import sys
+import time
+import traceback
+from typing import Dict, List, Optional
+
+from asv_runner.benchmarks.mark import SkipNotImplemented
+
+from ._benchmark_discovery import BenchmarkCase
+
+# Placeholder used by ASV for benchmarks that were skipped
+SKIPPED = None
+
+
+def _get_number_of_repeats(benchmark: object) -> int:
+    """Follow the ASV convention where `repeat` is either a count or a (minimum, maximum, time) tuple."""
+    repeat = getattr(benchmark, "repeat", 1)
+    if isinstance(repeat, (tuple, list)):
+        return max(1, int(repeat[0]))
+    return max(1, int(repeat))
+
+
+def _run_once(benchmark: object, case: BenchmarkCase) -> object:
+    """Take a single sample of a benchmark method whose setup has already been run."""
+    method = getattr(benchmark, case.method_name)
+
+    if case.method_name.startswith("timeraw_"):
+        # Raw timing benchmarks return code that ASV times in a fresh interpreter, excluding its startup
+        code = method(*case.params)
+        timing_code = (
+            f"import time\n_start_time = time.perf_counter()\nexec({code!r})\nprint(time.perf_counter() - _start_time)"
+        )
+        process = subprocess.run(args=[sys.executable, "-c", timing_code], check=True, capture_output=True, text=True)
+        return float(process.stdout.strip().splitlines()[-1])
+
+    if case.method_name.startswith("track_"):
+        result = method(*case.params)
+        # Tracking benchmarks may wrap their result for compliance with ASV
+        return result["samples"] if isinstance(result, dict) and "samples" in result else result
+
+    start_time = time.perf_counter()
+    method(*case.params)
+    return time.perf_counter() - start_time
+
+
+def run_benchmark_case(case: BenchmarkCase, show_traceback: bool = False) -> Optional[object]:
+    """
+    Run a single benchmark case in the current interpreter.
+
+    As in ASV, `setup` is run once per round, followed by `repeat` samples and then `teardown`. Benchmarks marked to be
+    skipped, or that raise `SkipNotImplemented` in their setup or body, are skipped.
+
+    Parameters
+    ----------
+    case : BenchmarkCase
+        The benchmark method and parameter combination to run.
+    show_traceback : bool, default: False
+        Whether to print the full traceback when the case fails.
+
+    Returns
+    -------
+    object or None
+        The timing samples of `time_` and `timeraw_` benchmarks, or the result of `track_` benchmarks.
+        None if the case was skipped or failed.
+    """
+    if case.is_skipped:
+        return SKIPPED
+
+    samples = []
+    for _ in range(getattr(case.benchmark_class, "rounds", 1)):
+        benchmark = case.benchmark_class()
+        setup_completed = False
+        try:
+            if hasattr(benchmark, "setup"):
+                benchmark.setup(*case.params)
+            setup_completed = True
+
+            for _ in range(_get_number_of_repeats(benchmark=benchmark)):
+                sample = _run_once(benchmark=benchmark, case=case)
+                if case.method_name.startswith("track_"):
+                    # Tracked values are recorded once, like ASV
+                    return sample
+                samples.append(sample)
+        except SkipNotImplemented:
+            return SKIPPED
+        except Exception:
+            print(f"Failed: {case.full_name}", flush=True)
+            if show_traceback:
+                traceback.print_exc()
+            return SKIPPED
+        finally:
+            if setup_completed and hasattr(benchmark, "teardown"):
+                benchmark.teardown(*case.params)
+
+    return samples
+
+
+def run_benchmark_cases(cases: List[BenchmarkCase], show_traceback: bool = False) -> Dict[str, Dict[str, object]]:
+    """
+    Run benchmark cases in the current interpreter, one after the other.
+
+    Returns
+    -------
+    dict
+        The results of all cases that were not skipped, keyed by benchmark name and then by parameter representation,
+        as in the reduced results files.
+    """
+    results = dict()
+    for case_index, case in enumerate(cases, start=1):
+        print(f"[{case_index}/{len(cases)}] {case.full_name}", flush=True)
+
+        case_start_time = time.perf_counter()
+        result = run_benchmark_case(case=case, show_traceback=show_traceback)
+        if result is SKIPPED:
+            print("\tskipped", flush=True)
+            continue
+
+        results.setdefault(case.name, dict())[case.params_repr] = result
+        print(f"\tcompleted in {time.perf_counter() - case_start_time:.2f} seconds", flush=True)
+
+    return results
@@ -0,0 +1,138 @@
+"""Record the latencies of many repeated operations in a compact histogram and summarize them by their percentiles."""
+
+import math
+import time
+from typing import Callable, Dict, Iterable, Tuple
+
+DEFAULT_LATENCY_PERCENTILES = (50.0, 90.0, 99.0)
+
+
+class LatencyHistogram:
+    """
+    A histogram of latencies with buckets of bounded relative width, in the style of HdrHistogram.
+
+    Latencies are counted in integer multiples of the `resolution`. Below `2 * 10**significant_figures` multiples, each
+    value has its own bucket; above, each power of two is split into the same number of equally wide buckets, so that
+    any recorded latency is known to `significant_figures` decimal digits regardless of its magnitude. Only the buckets
+    that were recorded into are stored.
+
+    :ivar number_of_values: The number of latencies recorded
+    :ivar minimum: The smallest latency recorded, in seconds
+    :ivar maximum: The largest latency recorded, in seconds
+    """
+
+    def __init__(self, resolution: float = 1e-6, significant_figures: int = 2):
+        self.resolution = resolution
+        self._sub_bucket_count = 2 ** math.ceil(math.log2(2 * 10**significant_figures))
+        self._sub_bucket_half_count = self._sub_bucket_count // 2
+        self._sub_bucket_bits = self._sub_bucket_count.bit_length() - 1
+        self._counts: Dict[int, int] = dict()
+        self._total = 0.0
+
+        self.number_of_values = 0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+
+    def _get_bucket_index(self, units: int) -> int:
+        if units < self._sub_bucket_count:
+            return units
+
+        # Above the linear range, the `sub_bucket` is always within the upper half of the sub buckets
+        magnitude = units.bit_length() - self._sub_bucket_bits
+        sub_bucket = units >> magnitude
+        return (
+            self._sub_bucket_count
+            + (magnitude - 1) * self._sub_bucket_half_count
+            + (sub_bucket - self._sub_bucket_half_count)
+        )
+
+    def _get_bucket_range(self, index: int) -> Tuple[int, int]:
+        """Get the smallest and largest number of units counted in a bucket."""
+        if index < self._sub_bucket_count:
+            return index, index
+
+        magnitude, sub_bucket = divmod(index - self._sub_bucket_count, self._sub_bucket_half_count)
+        magnitude += 1
+        lowest_units = (sub_bucket + self._sub_bucket_half_count) << magnitude
+        return lowest_units, lowest_units + (1 << magnitude) - 1
+
+    def record(self, latency: float):
+        """Record a latency in seconds."""
+        units = max(int(latency / self.resolution), 0)
+        index = self._get_bucket_index(units=units)
+        self._counts[index] = self._counts.get(index, 0) + 1
+
+        self._total += latency
+        self.number_of_values += 1
+        self.minimum = min(self.minimum, latency)
+        self.maximum = max(self.maximum, latency)
+
+    @property
+    def mean(self) -> float:
+        return self._total / self.number_of_values if self.number_of_values != 0 else float("nan")
+
+    def get_value_at_percentile(self, percentile: float) -> float:
+        """
+        Get the latency in seconds below or at which the given percentage of the recorded latencies fall.
+
+        The largest latency counted in the bucket of the percentile is returned, bounded by the recorded extremes.
+        """
+        if self.number_of_values == 0:
+            return float("nan")
+
+        rank = max(math.ceil(percentile / 100 * self.number_of_values), 1)
+        cumulative_count = 0
+        for index in sorted(self._counts):
+            cumulative_count += self._counts[index]
+            if cumulative_count >= rank:
+                _, highest_units = self._get_bucket_range(index=index)
+                return min(max((highest_units + 1) * self.resolution, self.minimum), self.maximum)
+        return self.maximum
+
+
+def sample_latencies(
+    function: Callable[[int], object],
+    number_of_samples: int,
+    time_budget: float = 300.0,
+    percentiles: Iterable[float] = DEFAULT_LATENCY_PERCENTILES,
+) -> dict:
+    """
+    Time many repetitions of an operation, recording each latency in a `LatencyHistogram`.
+
+    Parameters
+    ----------
+    function : callable
+        The operation to time, called with the index of each repetition, e.g., to read a different slice each time.
+    number_of_samples : int
+        The number of repetitions.
+    time_budget : float, default: 300.0
+        Stop early once this many seconds have elapsed.
+    percentiles : iterable of float, default: (50, 90, 99)
+        The percentiles of the latencies to report.
+
+    Returns
+    -------
+    dict
+        The percentiles of the latencies (e.g., `latency_p99`), their mean and maximum, and the number of samples,
+        wrapped for compliance with the `track_` benchmarks of ASV.
+    """
+    histogram = LatencyHistogram()
+    start_time = time.perf_counter()
+    for sample_index in range(number_of_samples):
+        sample_start_time = time.perf_counter()
+        function(sample_index)
+        histogram.record(latency=time.perf_counter() - sample_start_time)
+
+        if time.perf_counter() - start_time >= time_budget:
+            break
+
+    latency_results = {
+        f"latency_p{percentile:g}": histogram.get_value_at_percentile(percentile=percentile)
+        for percentile in percentiles
+    }
+    latency_results.update(
+        latency_mean=histogram.mean,
+        latency_max=histogram.maximum,
+        number_of_samples=histogram.number_of_values,
+    )
+    return dict(samples=latency_results, number=None)
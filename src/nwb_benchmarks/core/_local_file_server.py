@@ -0,0 +1,193 @@
+"""Serve local files over HTTP with range requests, so that generated files can be read by the streaming methods."""
+
+import contextlib
+import functools
+import http.server
+import multiprocessing
+import multiprocessing.connection
+import os
+import pathlib
+import re
+import sys
+import urllib.parse
+from typing import Iterator, Union
+
+_RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)$")
+
+
+class _RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Handle GET and HEAD requests for files, and ranges of them, counting each request on the server."""
+
+    server: "_CountingHTTPServer"
+
+    def send_head(self):
+        self.server.count_request()
+        path = pathlib.Path(self.translate_path(self.path))
+        range_header = self.headers.get("Range")
+        if not path.is_file() or range_header is None:
+            # Whole files, directory listings (which fsspec uses to list Zarr stores), and missing files
+            return super().send_head()
+
+        file_size = path.stat().st_size
+        match = _RANGE_PATTERN.match(range_header.strip())
+        if match is None or match.groups() == ("", ""):
+            self.send_error(http.HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            return None
+        start, stop = match.groups()
+        if start == "":
+            # A suffix range of the last bytes of the file
+            start, stop = max(file_size - int(stop), 0), file_size - 1
+        else:
+            start, stop = int(start), min(int(stop or file_size - 1), file_size - 1)
+        if start >= file_size or start > stop:
+            self.send_error(http.HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            return None
+
+        file = open(path, mode="rb")
+        file.seek(start)
+        self._range_length = stop - start + 1
+        self.send_response(http.HTTPStatus.PARTIAL_CONTENT)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Range", f"bytes {start}-{stop}/{file_size}")
+        self.send_header("Content-Length", str(self._range_length))
+        self.end_headers()
+        return file
+
+    def end_headers(self):
+        self.send_header("Accept-Ranges", "bytes")
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        remaining = self.__dict__.pop("_range_length", None)
+        while remaining is None or remaining > 0:
+            data = source.read(2**20 if remaining is None else min(2**20, remaining))
+            if not data:
+                break
+            outputfile.write(data)
+            self.server.count_bytes(len(data))
+            if remaining is not None:
+                remaining -= len(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _CountingHTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, number_of_requests: multiprocessing.Value, bytes_sent: multiprocessing.Value, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.number_of_requests = number_of_requests
+        self.bytes_sent = bytes_sent
+
+    def count_request(self):
+        with self.number_of_requests.get_lock():
+            self.number_of_requests.value += 1
+
+    def count_bytes(self, number_of_bytes: int):
+        with self.bytes_sent.get_lock():
+            self.bytes_sent.value += number_of_bytes
+
+    def handle_error(self, request, client_address):
+        # Clients may close a connection before reading all of a response, e.g., when fsspec cancels a read ahead
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def _serve_directory(
+    directory: str,
+    port_connection: multiprocessing.connection.Connection,
+    number_of_requests: multiprocessing.Value,
+    bytes_sent: multiprocessing.Value,
+):
+    handler = functools.partial(_RangeRequestHandler, directory=directory)
+    server = _CountingHTTPServer(
+        ("127.0.0.1", 0), handler, number_of_requests=number_of_requests, bytes_sent=bytes_sent
+    )
+    port_connection.send(server.server_address[1])
+    server.serve_forever()
+
+
+class LocalFileServer:
+    """
+    Serve the files of a local directory over HTTP on the loopback interface, supporting the single byte ranges that
+    fsspec, remfile, and ROS3 request, and counting the requests and bytes it serves.
+
+    The loopback interface has next to no latency, so that reads through the server isolate the number of requests and
+    the overhead of each streaming method from the network; the number of requests is what scales with the latency to
+    real remote storage.
+
+    The server runs in a separate process, as h5py holds a global lock while reading through a file-like object, which
+    a server thread in the same process would need whenever it garbage collects h5py objects.
+
+    :ivar directory: The directory that is served.
+    :ivar base_url: The URL of the directory, once the server is started.
+    """
+
+    def __init__(self, directory: Union[str, pathlib.Path]):
+        self.directory = pathlib.Path(directory).absolute()
+        self.base_url = None
+        self._process = None
+        self._number_of_requests = multiprocessing.Value("q", 0)
+        self._bytes_sent = multiprocessing.Value("q", 0)
+
+    def start(self) -> str:
+        """Start serving the directory from a background process on a free port, and return its URL."""
+        receiving_connection, sending_connection = multiprocessing.Pipe(duplex=False)
+        self._process = multiprocessing.Process(
+            target=_serve_directory,
+            kwargs=dict(
+                directory=os.fspath(self.directory),
+                port_connection=sending_connection,
+                number_of_requests=self._number_of_requests,
+                bytes_sent=self._bytes_sent,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+        self.base_url = f"http://127.0.0.1:{receiving_connection.recv()}"
+        return self.base_url
+
+    def stop(self):
+        """Stop serving the directory."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+        self._process = None
+
+    def get_url(self, file_path: Union[str, pathlib.Path]) -> str:
+        """Get the URL of a file (or Zarr directory store) in the served directory."""
+        relative_path = pathlib.Path(file_path).absolute().relative_to(self.directory)
+        return f"{self.base_url}/{urllib.parse.quote(relative_path.as_posix())}"
+
+    @property
+    def number_of_requests(self) -> int:
+        """The number of requests received since the server was created or `reset_statistics` was last called."""
+        return self._number_of_requests.value
+
+    @property
+    def bytes_sent(self) -> int:
+        """The number of bytes of file contents sent, counted from the same point as `number_of_requests`."""
+        return self._bytes_sent.value
+
+    def reset_statistics(self):
+        """Reset the number of requests and bytes sent."""
+        with self._number_of_requests.get_lock():
+            self._number_of_requests.value = 0
+        with self._bytes_sent.get_lock():
+            self._bytes_sent.value = 0
+
+
+@contextlib.contextmanager
+def local_file_server(directory: Union[str, pathlib.Path]) -> Iterator[LocalFileServer]:
+    """
+    Context manager for serving the files of a local directory over HTTP while in the context.
+
+    :param directory: The directory to serve.
+    """
+    server = LocalFileServer(directory=directory)
+    try:
+        server.start()
+        yield server
+    finally:
+        server.stop()
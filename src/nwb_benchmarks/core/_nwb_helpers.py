@@ -1,25 +1,125 @@
-from typing import Any
+import json
+import posixpath
+import weakref
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
+import h5py
 import pynwb
+import zarr
+
+from ..setup import get_persistent_download_directory
+
+# The name to object index of each NWBFile, along with the number of objects it was built from
+_object_name_indexes = weakref.WeakKeyDictionary()
+
+# Placeholder in the index for names shared by multiple objects
+_DUPLICATED_NAME = object()
+
+
+def _get_object_name_index(nwbfile: pynwb.NWBFile) -> Dict[str, Any]:
+    """Get the index from names to neurodata objects of an NWBFile, rebuilding it if objects were added since."""
+    number_of_objects = len(nwbfile.objects)
+    cached_number_of_objects, object_name_index = _object_name_indexes.get(nwbfile, (None, None))
+    if cached_number_of_objects == number_of_objects:
+        return object_name_index
+
+    # Mapping directly to the objects rather than to lists of them avoids an allocation per object, which for files
+    # with many objects otherwise triggers repeated garbage collection while the index is built
+    object_name_index = dict()
+    for neurodata_object in nwbfile.objects.values():
+        if object_name_index.setdefault(neurodata_object.name, neurodata_object) is not neurodata_object:
+            object_name_index[neurodata_object.name] = _DUPLICATED_NAME
+    _object_name_indexes[nwbfile] = (number_of_objects, object_name_index)
+    return object_name_index
 
 
 def get_object_by_name(nwbfile: pynwb.NWBFile, object_name: str) -> Any:
     """
     Simple helper function to retrieve a neurodata object by its name, if it is unique.
 
+    The objects are indexed by name on the first lookup in each NWBFile, so that later lookups do not scan all objects.
+
     This method should only be used in the `setup` method of a benchmark class.
     """
-    # Find all objects that are matching the given name
-    matching_objects = [
-        (neurodata_object.name, neurodata_object)
-        for neurodata_object in nwbfile.objects.values()
-        if neurodata_object.name == object_name
-    ]
+    # Find the object matching the given name
+    matching_object = _get_object_name_index(nwbfile=nwbfile).get(object_name, None)
     # Raise an error if the object wasn't found
-    if len(matching_objects) == 0:
+    if matching_object is None:
         raise ValueError(f"The specified object name ({object_name}) is not in the NWBFile.")
     # Make sure that the object we are looking for is unique
-    elif len(matching_objects) > 1:
+    elif matching_object is _DUPLICATED_NAME:
         raise ValueError(f"The specified object name ({object_name}) was found multiple times in the NWBFile.")
     # Return the matching object
-    return matching_objects[0][1]
+    return matching_object
+
+
+def _iterate_neurodata_objects(
+    group: Union[h5py.Group, zarr.Group], path: str = "/"
+) -> Iterator[Tuple[str, Union[h5py.Group, h5py.Dataset, zarr.Group, zarr.Array]]]:
+    """Iterate over the paths and objects of all groups and datasets with a neurodata type, skipping links."""
+    if isinstance(group, h5py.Group):
+        items = ((name, group[name]) for name in group if isinstance(group.get(name, getlink=True), h5py.HardLink))
+    else:
+        items = group.items()
+
+    for name, child in items:
+        child_path = posixpath.join(path, name)
+        if "neurodata_type" in child.attrs:
+            yield child_path, child
+        if isinstance(child, (h5py.Group, zarr.Group)):
+            yield from _iterate_neurodata_objects(group=child, path=child_path)
+
+
+def build_object_path_index(file: Union[h5py.File, zarr.Group]) -> Dict[str, List[str]]:
+    """
+    Map the name of every neurodata object in an HDF5 or Zarr NWB file to the paths of the objects with that name.
+
+    Unlike `io.read()`, this only walks the hierarchy of the file without constructing any of the NWB objects.
+    """
+    object_path_index = dict()
+    for path, _ in _iterate_neurodata_objects(group=file):
+        object_path_index.setdefault(posixpath.basename(path), []).append(path)
+    return object_path_index
+
+
+def get_object_path_index(file: Union[h5py.File, zarr.Group], https_url: str) -> Dict[str, List[str]]:
+    """
+    Get the name to path index of the objects in a remote NWB file, cached per asset in the persistent download directory.
+
+    NOTE: Building the index walks the whole hierarchy of the remote file, so when it is not cached yet, this function
+    should not be included in the timing or network tracking of benchmarks.
+    """
+    index_directory = get_persistent_download_directory() / "object_path_indexes"
+    index_directory.mkdir(exist_ok=True)
+
+    # The last part of the S3 URL is the unique identifier of the blob or Zarr asset
+    index_file_path = index_directory / f"{posixpath.basename(https_url.rstrip('/'))}.json"
+    if index_file_path.exists():
+        with index_file_path.open(mode="r") as file_stream:
+            return json.load(fp=file_stream)
+
+    object_path_index = build_object_path_index(file=file)
+    with index_file_path.open(mode="w") as file_stream:
+        json.dump(obj=object_path_index, fp=file_stream, indent=1)
+    return object_path_index
+
+
+def get_dataset_by_name(
+    file: Union[h5py.File, zarr.Group], object_name: str, object_path_index: Dict[str, List[str]]
+) -> Union[h5py.Dataset, zarr.Array]:
+    """
+    Retrieve the data of a neurodata object by its name, if it is unique, directly from the HDF5 or Zarr file.
+
+    For groups (e.g., a `TimeSeries`) this is their `data` dataset. As for `get_object_by_name`, this method should only
+    be used in the `setup` method of a benchmark class.
+    """
+    matching_paths = object_path_index.get(object_name, [])
+    if len(matching_paths) == 0:
+        raise ValueError(f"The specified object name ({object_name}) is not in the NWBFile.")
+    elif len(matching_paths) > 1:
+        raise ValueError(f"The specified object name ({object_name}) was found multiple times in the NWBFile.")
+
+    neurodata_object = file[matching_paths[0]]
+    if isinstance(neurodata_object, (h5py.Group, zarr.Group)):
+        return neurodata_object["data"]
+    return neurodata_object
@@ -0,0 +1,225 @@
+"""Download remote files with several concurrent byte ranges or files, to compare with the download of the DANDI API."""
+
+import concurrent.futures
+import pathlib
+import threading
+from typing import List, Set, Tuple, Union
+
+import fsspec
+import requests
+import s3fs
+
+_DANDI_S3_HTTPS_PREFIX = "https://dandiarchive.s3.amazonaws.com/"
+
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    # Sessions are not thread-safe, so each worker thread keeps its own (and its pool of connections)
+    if not hasattr(_thread_local, "session"):
+        _thread_local.session = requests.Session()
+    return _thread_local.session
+
+
+def _fetch_byte_range(https_url: str, start: int, stop: int) -> bytes:
+    response = _get_session().get(https_url, headers=dict(Range=f"bytes={start}-{stop - 1}"))
+    response.raise_for_status()
+    # A server that ignores the range answers 200 with the entire file, which would be written in place of the part
+    if response.status_code != 206:
+        raise ValueError(f"Expected a partial response (206) to the range request for {https_url}.")
+    if len(response.content) != stop - start:
+        raise ValueError(
+            f"Expected {stop - start} bytes from the range request for {https_url}, "
+            f"but received {len(response.content)}."
+        )
+    return response.content
+
+
+def resolve_download_url(https_url: str) -> Tuple[str, int]:
+    """
+    Follow the redirects of a URL, e.g., from the DANDI API to S3, and get the final URL and the size of its content.
+
+    NOTE: This makes requests, so it should not be included in the timing of benchmarks.
+    """
+    response = requests.head(https_url, allow_redirects=True)
+    response.raise_for_status()
+    return response.url, int(response.headers["Content-Length"])
+
+
+def _get_part_ranges(file_size: int, part_size: int) -> List[Tuple[int, int]]:
+    """Get the (start, stop) byte ranges that split a file into parts."""
+    return [(start, min(start + part_size, file_size)) for start in range(0, file_size, part_size)]
+
+
+def _read_completed_parts(progress_file_path: pathlib.Path) -> Set[int]:
+    if not progress_file_path.exists():
+        return set()
+    return {int(line) for line in progress_file_path.read_text().split()}
+
+
+def download_byte_ranges(
+    https_url: str,
+    file_path: Union[str, pathlib.Path],
+    file_size: int,
+    number_of_workers: int,
+    part_size: int = 2**24,
+) -> int:
+    """
+    Download a file as byte ranges fetched by a pool of threads, each written in place into a preallocated file.
+
+    The download is resumable: the index of each part is recorded in a `<file name>.parts` file next to the file once
+    it is written, so that a download that was interrupted only fetches the remaining parts when run again. The
+    progress file is removed once all parts are written.
+
+    Parameters
+    ----------
+    https_url : str
+        The URL of the file, which must support range requests; see `resolve_download_url` to follow redirects first.
+    file_path : str or pathlib.Path
+        The path to download the file to.
+    file_size : int
+        The size of the file in bytes.
+    number_of_workers : int
+        The number of parts to download concurrently.
+    part_size : int, default: 16 MiB
+        The size in bytes of each byte range.
+
+    Returns
+    -------
+    int
+        The number of bytes downloaded.
+    """
+    file_path = pathlib.Path(file_path)
+    progress_file_path = file_path.with_name(f"{file_path.name}.parts")
+    completed_parts = _read_completed_parts(progress_file_path=progress_file_path)
+    if not completed_parts:
+        with open(file_path, mode="wb") as file:
+            file.truncate(file_size)
+
+    progress_lock = threading.Lock()
+
+    def download_part(part_index: int, start: int, stop: int) -> int:
+        part = _fetch_byte_range(https_url=https_url, start=start, stop=stop)
+        with open(file_path, mode="r+b") as file:
+            file.seek(start)
+            file.write(part)
+        with progress_lock, open(progress_file_path, mode="a") as progress_file:
+            progress_file.write(f"{part_index}\n")
+        return stop - start
+
+    part_ranges = _get_part_ranges(file_size=file_size, part_size=part_size)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+        futures = [
+            executor.submit(download_part, part_index, start, stop)
+            for part_index, (start, stop) in enumerate(part_ranges)
+            if part_index not in completed_parts
+        ]
+        number_of_bytes = sum(future.result() for future in futures)
+
+    progress_file_path.unlink(missing_ok=True)
+    return number_of_bytes
+
+
+def fetch_byte_ranges(https_url: str, byte_ranges: List[Tuple[int, int]], number_of_workers: int) -> List[bytes]:
+    """Fetch (start, stop) byte ranges of a file into memory, using a pool of threads to fetch them concurrently."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+        futures = [
+            executor.submit(_fetch_byte_range, https_url=https_url, start=start, stop=stop)
+            for start, stop in byte_ranges
+        ]
+        return [future.result() for future in futures]
+
+
+def download_byte_ranges_fsspec(
+    https_url: str,
+    file_path: Union[str, pathlib.Path],
+    file_size: int,
+    number_of_workers: int,
+    part_size: int = 2**24,
+) -> int:
+    """
+    Download a file as byte ranges fetched concurrently by the asynchronous HTTPS filesystem of fsspec.
+
+    The ranges are fetched with `cat_ranges` in batches of `number_of_workers` parts, each written before the next.
+
+    Returns
+    -------
+    int
+        The number of bytes downloaded.
+    """
+    fsspec.get_filesystem_class("https").clear_instance_cache()
+    filesystem = fsspec.filesystem("https")
+
+    part_ranges = _get_part_ranges(file_size=file_size, part_size=part_size)
+    number_of_bytes = 0
+    with open(file_path, mode="wb") as file:
+        for batch_start in range(0, len(part_ranges), number_of_workers):
+            batch_ranges = part_ranges[batch_start : batch_start + number_of_workers]
+            parts = filesystem.cat_ranges(
+                paths=[https_url] * len(batch_ranges),
+                starts=[start for start, _ in batch_ranges],
+                ends=[stop for _, stop in batch_ranges],
+                batch_size=number_of_workers,
+                on_error="raise",
+            )
+            for part in parts:
+                file.write(part)
+                number_of_bytes += len(part)
+    return number_of_bytes
+
+
+def download_s3fs_multipart(
+    https_url: str,
+    file_path: Union[str, pathlib.Path],
+    number_of_workers: int,
+    part_size: int = 2**24,
+) -> int:
+    """
+    Download a file from the DANDI S3 bucket with s3fs, which fetches parts of the file concurrently.
+
+    Returns
+    -------
+    int
+        The number of bytes downloaded.
+    """
+    s3_path = https_url.replace(_DANDI_S3_HTTPS_PREFIX, "dandiarchive/")
+    filesystem = s3fs.S3FileSystem(anon=True, skip_instance_cache=True, max_concurrency=number_of_workers)
+    filesystem.get_file(rpath=s3_path, lpath=str(file_path), chunksize=part_size, max_concurrency=number_of_workers)
+    return pathlib.Path(file_path).stat().st_size
+
+
+def download_zarr_files(https_url: str, directory: Union[str, pathlib.Path], number_of_workers: int) -> int:
+    """
+    Download all files of a Zarr store in the DANDI S3 bucket, fetching several files concurrently.
+
+    The files are listed through S3 before being fetched over HTTPS by a pool of threads.
+
+    Parameters
+    ----------
+    https_url : str
+        The direct HTTPS URL of the Zarr store in the S3 bucket.
+    directory : str or pathlib.Path
+        The directory to download the files of the store into.
+    number_of_workers : int
+        The number of files to download concurrently.
+
+    Returns
+    -------
+    int
+        The number of bytes downloaded.
+    """
+    directory = pathlib.Path(directory)
+    s3_prefix = https_url.replace(_DANDI_S3_HTTPS_PREFIX, "dandiarchive/").rstrip("/")
+    filesystem = s3fs.S3FileSystem(anon=True, skip_instance_cache=True)
+    keys = filesystem.find(s3_prefix)
+
+    def download_file(key: str) -> int:
+        file_path = directory / key.removeprefix(s3_prefix).lstrip("/")
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        response = _get_session().get(f"{_DANDI_S3_HTTPS_PREFIX}{key.removeprefix('dandiarchive/')}")
+        response.raise_for_status()
+        file_path.write_bytes(response.content)
+        return len(response.content)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+        return sum(executor.map(download_file, keys))
@@ -0,0 +1,199 @@
+"""
+Download only the chunks (and metadata) that a set of slices needs from a remote file, into a local sparse copy.
+
+This is a middle strategy between streaming each slice and downloading the entire file: the chunks of all slices are
+fetched in bulk and in parallel, after which the slices are read locally.
+"""
+
+import concurrent.futures
+import io
+import json
+import pathlib
+from typing import List, Tuple, Union
+
+import h5py
+import remfile
+import zarr
+
+from ._chunk_layouts import get_chunk_indices, get_zarr_chunk_keys
+from ._nwb_helpers import build_object_path_index, get_dataset_by_name
+from ._parallel_downloads import fetch_byte_ranges
+
+
+class _RecordingFile(io.RawIOBase):
+    """A read-only file-like object that records every range read from the file it wraps."""
+
+    def __init__(self, file: remfile.File):
+        self._file = file
+        self.reads = []
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        # The seek of remfile does not return the new position
+        self._file.seek(offset, whence)
+        return self._file.tell()
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def readinto(self, buffer) -> int:
+        offset = self._file.tell()
+        data = self._file.read(len(buffer))
+        buffer[: len(data)] = data
+        self.reads.append((offset, bytes(data)))
+        return len(data)
+
+
+def _merge_byte_ranges(byte_ranges: List[Tuple[int, int]], maximum_gap: int) -> List[Tuple[int, int]]:
+    """Merge (start, stop) byte ranges that overlap or are separated by at most `maximum_gap` bytes."""
+    merged_ranges = []
+    for start, stop in sorted(byte_ranges):
+        if merged_ranges and start - merged_ranges[-1][1] <= maximum_gap:
+            merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], stop))
+        else:
+            merged_ranges.append((start, stop))
+    return merged_ranges
+
+
+def _get_hdf5_byte_ranges(dataset: h5py.Dataset, slice_range: Tuple[slice, ...]) -> List[Tuple[int, int]]:
+    """Get the (start, stop) byte ranges in the file of the stored chunks of a dataset that a slice touches."""
+    if dataset.chunks is None:
+        # Contiguous datasets are stored row after row, so take the whole rows covered by the first axis
+        row_size = dataset.dtype.itemsize * (dataset.size // max(dataset.shape[0], 1))
+        start, stop, _ = slice_range[0].indices(dataset.shape[0])
+        return [(dataset.id.get_offset() + start * row_size, dataset.id.get_offset() + stop * row_size)]
+
+    byte_ranges = []
+    for chunk_index in get_chunk_indices(dataset=dataset, slice_range=slice_range):
+        chunk_offset = tuple(index * chunk_length for index, chunk_length in zip(chunk_index, dataset.chunks))
+        chunk_info = dataset.id.get_chunk_info_by_coord(chunk_offset)
+        if chunk_info.byte_offset is not None:
+            byte_ranges.append((chunk_info.byte_offset, chunk_info.byte_offset + chunk_info.size))
+    return byte_ranges
+
+
+def download_hdf5_chunks_for_slices(
+    https_url: str,
+    slices: List[Tuple[str, Tuple[slice, ...]]],
+    file_path: Union[str, pathlib.Path],
+    number_of_workers: int = 8,
+    maximum_gap: int = 2**16,
+) -> int:
+    """
+    Download the chunks of a remote HDF5 file needed by a set of slices into a local sparse copy of the file.
+
+    The metadata read to locate the datasets and their chunks is recorded and written into the copy as well, at the same
+    offsets as in the remote file, so that the copy can be opened with h5py to read the slices locally. Other parts of
+    the file are left empty, so that reading anything else from the copy fails or returns zeros.
+
+    Parameters
+    ----------
+    https_url : str
+        The URL of the HDF5 file, which must support range requests.
+    slices : list of (str, tuple of slice)
+        The name of each dataset (as found by `get_dataset_by_name`) and the slice to read from it.
+    file_path : str or pathlib.Path
+        The path of the local sparse copy to write.
+    number_of_workers : int, default: 8
+        The number of byte ranges to download concurrently.
+    maximum_gap : int, default: 64 KiB
+        The largest gap in bytes between chunks that are merged into a single byte range.
+
+    Returns
+    -------
+    int
+        The number of bytes downloaded, i.e., of the bodies of all responses, including the chunks fetched by remfile
+        (which reads ahead of h5py) to read the metadata.
+    """
+    remote_file = remfile.File(url=https_url)
+    # Count the bytes that remfile fetches rather than those h5py reads, since the read-ahead of remfile fetches more
+    response_sizes = []
+    remote_file.session.hooks["response"].append(
+        lambda response, *args, **kwargs: response_sizes.append(len(response.content))
+    )
+    recording_file = _RecordingFile(file=remote_file)
+    file_size = recording_file.seek(0, io.SEEK_END)
+    recording_file.seek(0)
+
+    byte_ranges = []
+    with h5py.File(name=recording_file, mode="r") as file:
+        object_path_index = build_object_path_index(file=file)
+        for object_name, slice_range in slices:
+            dataset = get_dataset_by_name(file=file, object_name=object_name, object_path_index=object_path_index)
+            byte_ranges.extend(_get_hdf5_byte_ranges(dataset=dataset, slice_range=slice_range))
+    byte_ranges = _merge_byte_ranges(byte_ranges=byte_ranges, maximum_gap=maximum_gap)
+    parts = fetch_byte_ranges(https_url=https_url, byte_ranges=byte_ranges, number_of_workers=number_of_workers)
+
+    with open(file_path, mode="wb") as local_file:
+        local_file.truncate(file_size)
+        for offset, data in recording_file.reads + [(start, part) for (start, _), part in zip(byte_ranges, parts)]:
+            local_file.seek(offset)
+            local_file.write(data)
+    return sum(response_sizes) + sum(len(part) for part in parts)
+
+
+def download_zarr_chunks_for_slices(
+    https_url: str,
+    slices: List[Tuple[str, Tuple[slice, ...]]],
+    directory: Union[str, pathlib.Path],
+    number_of_workers: int = 8,
+) -> int:
+    """
+    Download the chunks of a remote Zarr store needed by a set of slices into a local directory store.
+
+    All metadata of the store is copied from its consolidated metadata, so that the local store can be opened with or
+    without consolidated metadata, while only the chunks of the slices are present.
+
+    Parameters
+    ----------
+    https_url : str
+        The URL of the Zarr store, which must have consolidated metadata.
+    slices : list of (str, tuple of slice)
+        The name of each array (as found by `get_dataset_by_name`) and the slice to read from it.
+    directory : str or pathlib.Path
+        The directory of the local store to write.
+    number_of_workers : int, default: 8
+        The number of chunks to download concurrently.
+
+    Returns
+    -------
+    int
+        The number of bytes downloaded, including the consolidated metadata.
+    """
+    directory = pathlib.Path(directory)
+    store = zarr.storage.FSStore(url=https_url, mode="r")
+
+    consolidated_metadata = store[".zmetadata"]
+    metadata_files = {".zmetadata": consolidated_metadata}
+    for key, metadata in json.loads(consolidated_metadata)["metadata"].items():
+        metadata_files[key] = json.dumps(metadata, indent=4, sort_keys=True).encode("utf-8")
+    # Open the group from the metadata files in memory, so that the consolidated metadata is only fetched once
+    zarr_file = zarr.open_group(store=metadata_files, mode="r", chunk_store=store)
+
+    object_path_index = build_object_path_index(file=zarr_file)
+    chunk_keys = []
+    for object_name, slice_range in slices:
+        array = get_dataset_by_name(file=zarr_file, object_name=object_name, object_path_index=object_path_index)
+        chunk_keys.extend(
+            get_zarr_chunk_keys(array=array, chunk_indices=get_chunk_indices(dataset=array, slice_range=slice_range))
+        )
+
+    def download_chunk(chunk_key: str) -> Tuple[str, bytes]:
+        # Chunks that were never written are filled in with the fill value when read
+        return chunk_key, store.get(chunk_key)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+        chunks = dict(executor.map(download_chunk, dict.fromkeys(chunk_keys)))
+
+    for key, data in {**metadata_files, **chunks}.items():
+        if data is None:
+            continue
+        file_path = directory / key
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(data)
+    return len(consolidated_metadata) + sum(len(data) for data in chunks.values() if data is not None)
@@ -0,0 +1,70 @@
+"""Iterate over consecutive windows of a dataset while the next windows are read in background threads."""
+
+import collections
+import concurrent.futures
+import math
+from typing import Iterator, Optional, Tuple
+
+import numpy
+
+
+def iterate_windows_with_prefetch(
+    dataset,
+    window_length: int,
+    prefetch_depth: int = 1,
+    selection: Tuple[slice, ...] = (),
+    number_of_windows: Optional[int] = None,
+) -> Iterator[numpy.ndarray]:
+    """
+    Iterate over consecutive windows along the first axis of a dataset, reading the next windows in the background.
+
+    While window `k` is processed by the caller, windows `k + 1` to `k + prefetch_depth` are read by a pool of
+    `prefetch_depth` threads, so that the time spent on the network overlaps with the computation on each window.
+
+    NOTE: h5py serializes all calls into the HDF5 library, so for HDF5 files only one window is read at a time, which
+    still overlaps with computations that release the GIL (e.g., most of NumPy); Zarr arrays are read concurrently,
+    but by default Blosc only decompresses with several threads when called from the main thread.
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset, zarr.Array, or any array-like that can be sliced
+        The dataset to iterate over, e.g., one returned by `get_dataset_by_name` on a file from a `read_*` helper.
+    window_length : int
+        The length of each window along the first axis.
+    prefetch_depth : int, default: 1
+        The number of windows to read ahead of the current one. With 0, each window is read when it is requested.
+    selection : tuple of slice, optional
+        The slices of the remaining axes to read within each window; by default, these axes are read entirely.
+    number_of_windows : int, optional
+        The number of windows to iterate over. By default, all windows until the end of the first axis.
+
+    Yields
+    ------
+    numpy.ndarray
+        The data of each window, in order.
+    """
+    maximum_number_of_windows = math.ceil(dataset.shape[0] / window_length)
+    if number_of_windows is None or number_of_windows > maximum_number_of_windows:
+        number_of_windows = maximum_number_of_windows
+
+    def read_window(window_index: int) -> numpy.ndarray:
+        window_slice = slice(window_index * window_length, (window_index + 1) * window_length)
+        return dataset[(window_slice, *selection)]
+
+    if prefetch_depth == 0:
+        for window_index in range(number_of_windows):
+            yield read_window(window_index=window_index)
+        return
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=prefetch_depth)
+    try:
+        futures = collections.deque()
+        for window_index in range(number_of_windows):
+            futures.append(executor.submit(read_window, window_index))
+            if len(futures) > prefetch_depth:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        # Do not read the windows ahead if the iteration is stopped early
+        executor.shutdown(wait=True, cancel_futures=True)
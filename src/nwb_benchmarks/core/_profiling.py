@@ -0,0 +1,121 @@
+"""Helpers for profiling where the time of a benchmarked operation is spent."""
+
+import collections
+import cProfile
+import pathlib
+import pstats
+import sys
+import threading
+import types
+from typing import Callable, Dict, Union
+
+
+def _get_qualified_function_name(file_name: str, function_name: str, package_name: str) -> str | None:
+    """Get the dotted name of a function from the path of its source file, if it belongs to the package."""
+    parts = pathlib.Path(file_name).with_suffix("").parts
+    if package_name not in parts[:-1]:
+        return None
+
+    # Take the last occurrence, e.g., for editable installs from a `src/<package>` layout
+    package_index = len(parts) - 1 - parts[::-1].index(package_name)
+    return ".".join([*parts[package_index:], function_name])
+
+
+def profile_top_functions(
+    function: Callable[[], object], package_name: str = "hdmf", number_of_functions: int = 10
+) -> Dict[str, float]:
+    """
+    Call a function under cProfile and summarize the functions of a package that took the longest.
+
+    Parameters
+    ----------
+    function : callable
+        The function to profile, called without arguments.
+    package_name : str, default: "hdmf"
+        The top-level package whose functions are summarized.
+    number_of_functions : int, default: 10
+        The number of functions to report.
+
+    Returns
+    -------
+    dict
+        The cumulative time in seconds spent within each of the top functions (including the functions they call),
+        keyed by their dotted name and sorted from the longest to the shortest.
+    """
+    profiler = cProfile.Profile()
+    profiler.runcall(function)
+
+    cumulative_times = dict()
+    for (file_name, _, function_name), (_, _, _, cumulative_time, _) in pstats.Stats(profiler).stats.items():
+        qualified_function_name = _get_qualified_function_name(
+            file_name=file_name, function_name=function_name, package_name=package_name
+        )
+        if qualified_function_name is None:
+            continue
+
+        # Functions of the same name within a module (e.g., methods of different classes) keep the longest time
+        cumulative_times[qualified_function_name] = max(
+            cumulative_time, cumulative_times.get(qualified_function_name, 0.0)
+        )
+
+    top_functions = sorted(cumulative_times.items(), key=lambda item: item[1], reverse=True)[:number_of_functions]
+    return dict(top_functions)
+
+
+def _get_frame_label(frame: types.FrameType) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '<unknown>')}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class SamplingProfiler:
+    """
+    Periodically sample the call stack of the thread that enters this context from a background thread.
+
+    Unlike a deterministic profiler, the overhead does not grow with the number of function calls, so the hot paths of
+    the reading libraries can be captured while they are being benchmarked. Only the entering thread is sampled, and
+    stacks start at the functions called by the frame that entered the context.
+
+    Parameters
+    ----------
+    interval : float, default: 0.005
+        The time in seconds between samples.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stack_counts = collections.Counter()
+
+    def __enter__(self) -> "SamplingProfiler":
+        self._thread_id = threading.get_ident()
+        self._root_frame = sys._getframe(1)
+        self._stop_event = threading.Event()
+        self._sampling_thread = threading.Thread(target=self._sample, daemon=True)
+        self._sampling_thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop_event.set()
+        self._sampling_thread.join()
+
+    def _sample(self):
+        while not self._stop_event.wait(timeout=self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None and frame is not self._root_frame:
+                stack.append(_get_frame_label(frame=frame))
+                frame = frame.f_back
+            if len(stack) != 0 and not self._stop_event.is_set():
+                self.stack_counts[";".join(reversed(stack))] += 1
+
+    def write_collapsed_stacks(self, file_path: Union[str, pathlib.Path]) -> None:
+        """
+        Append the sampled stacks to a file in the collapsed stack format (one 'frame;frame;... count' per line).
+
+        Repeated samples of the same benchmark case may be appended to the same file, as the counts of identical stacks
+        are summed by the tools that read this format (e.g., speedscope or flamegraph.pl).
+        """
+        file_path = pathlib.Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_path.open(mode="a") as file_stream:
+            for stack, count in self.stack_counts.items():
+                file_stream.write(f"{stack} {count}\n")
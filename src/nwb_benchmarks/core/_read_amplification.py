@@ -0,0 +1,113 @@
+"""
+Compare the bytes transferred by a read to the bytes of the data it returns, and count the HTTP requests it issues.
+
+The requests are counted on the side of the client, by wrapping the methods through which urllib3 (used by `requests`,
+and so by remfile and LINDI) and aiohttp (used by fsspec and s3fs) send each request. Requests sent by other clients,
+e.g., by the ROS3 driver of HDF5 through libcurl, are not counted.
+"""
+
+import contextlib
+import functools
+from typing import Callable, Dict, Iterator, Optional, Union
+
+BYTES_PER_MEGABYTE = 1e6
+
+
+class HTTPRequestCounter:
+    """
+    The number of HTTP requests sent by urllib3 and aiohttp while a `count_http_requests` context is active.
+
+    :ivar number_of_requests: The number of requests sent so far, including redirects and retries
+    """
+
+    def __init__(self):
+        self.number_of_requests = 0
+
+
+def _wrap_request_method(owner: type, method_name: str, counter: HTTPRequestCounter) -> Callable:
+    """Replace a method sending a request with one that counts it first, and return the original method."""
+    original_method = getattr(owner, method_name)
+
+    if method_name == "_request":
+
+        @functools.wraps(original_method)
+        async def counted_method(*args, **kwargs):
+            counter.number_of_requests += 1
+            return await original_method(*args, **kwargs)
+
+    else:
+
+        @functools.wraps(original_method)
+        def counted_method(*args, **kwargs):
+            counter.number_of_requests += 1
+            return original_method(*args, **kwargs)
+
+    setattr(owner, method_name, counted_method)
+    return original_method
+
+
+@contextlib.contextmanager
+def count_http_requests() -> Iterator[HTTPRequestCounter]:
+    """
+    Context manager for counting the HTTP requests sent by urllib3 and aiohttp for the code executed in the context.
+
+    The requests are counted across all threads and event loops of the process, e.g., those of fsspec.
+    """
+    counter = HTTPRequestCounter()
+    replaced_methods = []
+
+    try:
+        import urllib3.connectionpool
+
+        owner = urllib3.connectionpool.HTTPConnectionPool
+        replaced_methods.append((owner, "_make_request", _wrap_request_method(owner, "_make_request", counter)))
+    except ImportError:
+        pass
+
+    try:
+        import aiohttp
+
+        owner = aiohttp.ClientSession
+        replaced_methods.append((owner, "_request", _wrap_request_method(owner, "_request", counter)))
+    except ImportError:
+        pass
+
+    try:
+        yield counter
+    finally:
+        for owner, method_name, original_method in replaced_methods:
+            setattr(owner, method_name, original_method)
+
+
+def compute_read_amplification(
+    logical_bytes: int, transferred_bytes: Union[int, float], number_of_requests: Optional[int] = None
+) -> Dict[str, float]:
+    """
+    Compute how much more data was transferred over the network than returned by a read.
+
+    Parameters
+    ----------
+    logical_bytes : int
+        The number of bytes of the data returned by the read, e.g., `nbytes` of the sliced array.
+    transferred_bytes : int or float
+        The number of bytes transferred over the network by the read.
+    number_of_requests : int, optional
+        The number of HTTP requests sent by the read, if they were traced.
+
+    Returns
+    -------
+    dict
+        The `logical_bytes`, the `read_amplification` (bytes transferred per byte returned), and the
+        `bytes_wasted_by_read_ahead` (bytes transferred beyond those returned, e.g., by the read-ahead of a buffered
+        file, partially used chunks, or the headers of each packet); and the `requests_per_megabyte` returned if the
+        requests were traced. The ratios are left out if the read returned no data, as they are undefined (and NaN is
+        not valid JSON).
+    """
+    statistics = dict(logical_bytes=logical_bytes, bytes_wasted_by_read_ahead=max(transferred_bytes - logical_bytes, 0))
+    if logical_bytes == 0:
+        return statistics
+
+    statistics["read_amplification"] = transferred_bytes / logical_bytes
+    if number_of_requests is not None:
+        statistics["requests_per_megabyte"] = number_of_requests / (logical_bytes / BYTES_PER_MEGABYTE)
+    return statistics
@@ -0,0 +1,120 @@
+"""Split the benchmark cases into balanced shards that can be run on separate machines."""
+
+import heapq
+import pathlib
+import statistics
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+from ._benchmark_discovery import BenchmarkCase
+from ..utils import get_dictionary_checksum
+
+
+def parse_shard(shard: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification of the form 'i/N', where the shard index `i` counts from 1 to `N`.
+
+    Returns
+    -------
+    tuple of int
+        The shard index and the total number of shards.
+    """
+    try:
+        shard_index, number_of_shards = (int(value) for value in shard.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{shard}'. Expected the form 'i/N', e.g. '1/4'.")
+
+    if number_of_shards < 1 or not 1 <= shard_index <= number_of_shards:
+        raise ValueError(f"Invalid shard '{shard}'. The index must be between 1 and the number of shards.")
+
+    return shard_index, number_of_shards
+
+
+def get_case_cost_key(case: BenchmarkCase) -> Tuple[str, str]:
+    """Get the key used to look up the historical cost of a case: the benchmark name and the parameter case name."""
+    first_param = case.params[0] if len(case.params) > 0 else None
+    parameter_case_name = first_param.get("name") if isinstance(first_param, dict) else case.params_repr
+    return case.name, parameter_case_name
+
+
+def load_historical_case_costs(db_directory: Optional[pathlib.Path] = None) -> Dict[Tuple[str, str], float]:
+    """
+    Load the mean duration of each benchmark case from the local results database, if one exists.
+
+    Returns an empty dictionary if the database dependencies are not installed or no database has been created yet
+    (e.g., by `nwb_benchmarks generate_figures`), in which case all cases are assumed to cost the same.
+    """
+    try:
+        from nwb_benchmarks.database import BenchmarkDatabase
+    except ImportError:
+        warnings.warn("The database dependencies are not installed; assuming all benchmark cases cost the same.")
+        return dict()
+
+    db = BenchmarkDatabase(db_directory=db_directory)
+    if not (db.db_directory / "results.parquet").exists():
+        warnings.warn(f"No results database found in {db.db_directory}; assuming all benchmark cases cost the same.")
+        return dict()
+
+    durations = db.get_case_durations().collect()
+    return {
+        (benchmark_name, parameter_case_name): duration
+        for benchmark_name, parameter_case_name, duration in durations.select(
+            ["benchmark_name", "parameter_case_name", "duration"]
+        ).rows()
+    }
+
+
+def assign_cases_to_shards(
+    cases: List[BenchmarkCase], number_of_shards: int, costs: Optional[Dict[Tuple[str, str], float]] = None
+) -> List[List[BenchmarkCase]]:
+    """
+    Deterministically assign cases to shards so that the estimated total cost of each shard is balanced.
+
+    Cases are placed from the most to the least expensive onto the shard with the lowest total so far (the longest
+    processing time heuristic). Cases without a historical cost are assigned the median of the known costs, while cases
+    marked to be skipped are free.
+
+    Returns
+    -------
+    list of list of BenchmarkCase
+        The cases of each shard, in the original discovery order.
+    """
+    costs = costs or dict()
+    known_costs = [cost for cost in (costs.get(get_case_cost_key(case=case)) for case in cases) if cost is not None]
+    default_cost = statistics.median(known_costs) if len(known_costs) > 0 else 1.0
+
+    case_costs = [0.0 if case.is_skipped else costs.get(get_case_cost_key(case=case), default_cost) for case in cases]
+    order = sorted(range(len(cases)), key=lambda index: (-case_costs[index], cases[index].full_name))
+
+    shard_totals = [(0.0, shard_index) for shard_index in range(number_of_shards)]
+    assignments = [[] for _ in range(number_of_shards)]
+    for case_index in order:
+        total, shard_index = heapq.heappop(shard_totals)
+        assignments[shard_index].append(case_index)
+        heapq.heappush(shard_totals, (total + case_costs[case_index], shard_index))
+
+    return [[cases[case_index] for case_index in sorted(case_indices)] for case_indices in assignments]
+
+
+def get_shard(
+    cases: List[BenchmarkCase],
+    shard_index: int,
+    number_of_shards: int,
+    costs: Optional[Dict[Tuple[str, str], float]] = None,
+) -> List[BenchmarkCase]:
+    """Get the cases of a single shard, where the shard index counts from 1 to the number of shards."""
+    return assign_cases_to_shards(cases=cases, number_of_shards=number_of_shards, costs=costs)[shard_index - 1]
+
+
+def get_shard_plan_checksum(assignments: List[List[BenchmarkCase]]) -> str:
+    """
+    Get a checksum of the assignment of every case to its shard.
+
+    Shards are only complementary if every machine computed the same assignment (i.e., discovered the same cases and
+    used the same historical costs), which is verified by comparing this checksum when merging the results.
+    """
+    plan = {
+        str(shard_index): [case.full_name for case in shard_cases]
+        for shard_index, shard_cases in enumerate(assignments, start=1)
+    }
+    return get_dictionary_checksum(dictionary=plan)
@@ -6,7 +6,7 @@ fsspec, remfile, ros3, lindi
 import tempfile
 import time
 import warnings
-from typing import Any, Callable, Tuple, Union
+from typing import Any, Callable, Optional, Tuple, Union
 
 import fsspec
 import h5py
@@ -20,7 +20,7 @@ from fsspec.implementations.cached import CachingFileSystem
 from fsspec.implementations.http import HTTPFile
 from s3fs.core import S3File
 
-from . import download_asset_if_not_exists
+from ._dandi import download_asset_if_not_exists
 from ..setup import get_temporary_directory
 
 # Useful if running in verbose model
@@ -32,21 +32,31 @@ AWS_REGION = "us-east-2"  # DANDI is hosted on us-east-2
 
 def read_hdf5_h5py_fsspec_https_no_cache(
     https_url: str,
+    page_buffer_size: Optional[int] = None,
 ) -> Tuple[h5py.File, HTTPFile]:
-    """Load the raw HDF5 file using fsspec with an HTTPS filesystem without a cache; does not load into pynwb."""
+    """
+    Load the raw HDF5 file using fsspec with an HTTPS filesystem without a cache; does not load into pynwb.
+
+    A page buffer of `page_buffer_size` bytes can be set for files written with paged aggregation.
+    """
     reset_lock()
     fsspec.get_filesystem_class("https").clear_instance_cache()
     filesystem = fsspec.filesystem("https")
 
     byte_stream = filesystem.open(path=https_url, mode="rb")
-    file = h5py.File(name=byte_stream, aws_region=bytes(AWS_REGION, "ascii"))
+    file = h5py.File(name=byte_stream, aws_region=bytes(AWS_REGION, "ascii"), page_buf_size=page_buffer_size)
     return (file, byte_stream)
 
 
 def read_hdf5_h5py_fsspec_https_with_cache(
     https_url: str,
+    page_buffer_size: Optional[int] = None,
 ) -> Tuple[h5py.File, HTTPFile, tempfile.TemporaryDirectory]:
-    """Load the raw HDF5 file using fsspec with an HTTPS filesystem without a cache; does not load into pynwb."""
+    """
+    Load the raw HDF5 file using fsspec with an HTTPS filesystem without a cache; does not load into pynwb.
+
+    A page buffer of `page_buffer_size` bytes can be set for files written with paged aggregation.
+    """
     reset_lock()
     fsspec.get_filesystem_class("https").clear_instance_cache()
     filesystem = fsspec.filesystem("https")
@@ -56,7 +66,7 @@ def read_hdf5_h5py_fsspec_https_with_cache(
         cache_storage=tmpdir.name,  # Local folder for the cache
     )
     byte_stream = filesystem.open(path=https_url, mode="rb")
-    file = h5py.File(name=byte_stream)
+    file = h5py.File(name=byte_stream, page_buf_size=page_buffer_size)
     return (file, byte_stream, tmpdir)
 
 
@@ -133,19 +143,31 @@ def read_hdf5_pynwb_fsspec_s3_with_cache(
     return (nwbfile, io, file, byte_stream, tmpdir)
 
 
-def read_hdf5_h5py_remfile_no_cache(https_url: str) -> Tuple[h5py.File, remfile.File]:
-    """Load the raw HDF5 file from an S3 URL using remfile without a cache; does not formally read the NWB file."""
+def read_hdf5_h5py_remfile_no_cache(
+    https_url: str, page_buffer_size: Optional[int] = None
+) -> Tuple[h5py.File, remfile.File]:
+    """
+    Load the raw HDF5 file from an S3 URL using remfile without a cache; does not formally read the NWB file.
+
+    A page buffer of `page_buffer_size` bytes can be set for files written with paged aggregation.
+    """
     byte_stream = remfile.File(url=https_url)
-    file = h5py.File(name=byte_stream)
+    file = h5py.File(name=byte_stream, page_buf_size=page_buffer_size)
     return (file, byte_stream)
 
 
-def read_hdf5_h5py_remfile_with_cache(https_url: str) -> Tuple[h5py.File, remfile.File, tempfile.TemporaryDirectory]:
-    """Load the raw HDF5 file from an S3 URL using remfile with a cache; does not formally read the NWB file."""
+def read_hdf5_h5py_remfile_with_cache(
+    https_url: str, page_buffer_size: Optional[int] = None
+) -> Tuple[h5py.File, remfile.File, tempfile.TemporaryDirectory]:
+    """
+    Load the raw HDF5 file from an S3 URL using remfile with a cache; does not formally read the NWB file.
+
+    A page buffer of `page_buffer_size` bytes can be set for files written with paged aggregation.
+    """
     tmpdir = get_temporary_directory()
     disk_cache = remfile.DiskCache(tmpdir.name)
     byte_stream = remfile.File(url=https_url, disk_cache=disk_cache)
-    file = h5py.File(name=byte_stream)
+    file = h5py.File(name=byte_stream, page_buf_size=page_buffer_size)
     return (file, byte_stream, tmpdir)
 
 
@@ -200,10 +222,14 @@ def robust_ros3_read(
     raise TimeoutError(f"Unable to complete the command ({command.__name__}) after {max_retries} attempts!")
 
 
-def read_hdf5_h5py_ros3(https_url: str, retry: bool = False) -> Tuple[h5py.File, Union[int, None]]:
+def read_hdf5_h5py_ros3(
+    https_url: str, retry: bool = False, page_buffer_size: Optional[int] = None
+) -> Tuple[h5py.File, Union[int, None]]:
     """
     Load the raw HDF5 file from an S3 URL using ROS3 driver; does not formally read the NWB file.
 
+    A page buffer of `page_buffer_size` bytes can be set for files written with paged aggregation.
+
     Returns
     -------
     file : h5py.File
@@ -215,11 +241,15 @@ def read_hdf5_h5py_ros3(https_url: str, retry: bool = False) -> Tuple[h5py.File,
     if retry:
         file, retries = robust_ros3_read(
             command=h5py.File,
-            command_kwargs=dict(name=s3_form, driver="ros3", aws_region=bytes(AWS_REGION, "ascii")),
+            command_kwargs=dict(
+                name=s3_form, driver="ros3", aws_region=bytes(AWS_REGION, "ascii"), page_buf_size=page_buffer_size
+            ),
         )
     else:
         retries = None
-        file = h5py.File(name=s3_form, driver="ros3", aws_region=bytes(AWS_REGION, "ascii"))
+        file = h5py.File(
+            name=s3_form, driver="ros3", aws_region=bytes(AWS_REGION, "ascii"), page_buf_size=page_buffer_size
+        )
     return (file, retries)
 
 
@@ -0,0 +1,273 @@
+"""Generate synthetic NWB files of a controllable size, number of objects, and chunking for scaling benchmarks."""
+
+import datetime
+import math
+import pathlib
+from typing import Optional, Tuple
+
+import h5py
+import numpy
+import pynwb
+from hdmf.data_utils import GenericDataChunkIterator
+
+from ..setup import get_persistent_download_directory
+
+# The shape of a single row of the main series of each modality, along with its type and default chunk shape,
+# mirroring the data of the DANDI test files
+SYNTHETIC_MODALITIES = dict(
+    Ecephys=dict(row_shape=(384,), dtype="int16", chunk_shape=(262_144, 32)),
+    Ophys=dict(row_shape=(796, 512), dtype="uint16", chunk_shape=(20, 796, 512)),
+    Icephys=dict(row_shape=(), dtype="float32", chunk_shape=(8192,)),
+)
+
+# Named as in the DANDI test files, so that the same object names can be used in the benchmark parameters
+SYNTHETIC_SERIES_NAMES = dict(Ecephys="ElectricalSeries", Ophys="TwoPhotonSeries", Icephys="data_00002_AD0")
+
+
+class SyntheticDataChunkIterator(GenericDataChunkIterator):
+    """
+    Iterate over deterministic pseudo-random data, generated one block of chunk rows at a time.
+
+    The data of each block only depends on the seed and the position of the block, so that files with the same chunk
+    shape hold the same data regardless of the buffer shape, and files of any size can be written without holding all
+    of their data in memory.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype: str, chunk_shape: Tuple[int, ...], seed: int = 0):
+        # Set before initializing the iterator, which gets the shape and type of the data
+        self._data_shape = shape
+        self._data_dtype = numpy.dtype(dtype)
+        self.seed = seed
+
+        # Buffers span whole rows of chunks and are kept to about 256 MB
+        row_size = self._data_dtype.itemsize * math.prod(shape[1:])
+        rows_per_buffer = max(chunk_shape[0], (2**28 // max(row_size, 1)) // chunk_shape[0] * chunk_shape[0])
+        super().__init__(chunk_shape=chunk_shape, buffer_shape=(min(rows_per_buffer, shape[0]), *shape[1:]))
+
+    def _get_data(self, selection: Tuple[slice, ...]) -> numpy.ndarray:
+        start, stop = selection[0].start, selection[0].stop
+        blocks = []
+        for block_start in range(start, stop, self.chunk_shape[0]):
+            block_shape = (min(self.chunk_shape[0], stop - block_start), *self._data_shape[1:])
+            generator = numpy.random.default_rng(seed=(self.seed, block_start))
+            if self._data_dtype.kind == "f":
+                blocks.append(generator.standard_normal(size=block_shape, dtype=self._data_dtype))
+            else:
+                blocks.append(generator.integers(low=0, high=2**10, size=block_shape, dtype=self._data_dtype))
+        return numpy.concatenate(blocks, axis=0)[(slice(None), *selection[1:])]
+
+    def _get_maxshape(self) -> Tuple[int, ...]:
+        return self._data_shape
+
+    def _get_dtype(self) -> numpy.dtype:
+        return self._data_dtype
+
+
+def create_synthetic_nwbfile(
+    modality: str,
+    data_size: int,
+    number_of_objects: int = 0,
+    chunk_shape: Optional[Tuple[int, ...]] = None,
+    seed: int = 0,
+) -> pynwb.NWBFile:
+    """
+    Create an in-memory NWBFile with a main series of synthetic data and a number of small additional objects.
+
+    Parameters
+    ----------
+    modality : "Ecephys", "Ophys", or "Icephys"
+        The type of main series, which has the same shape per row, type, and name as the data of the DANDI test file
+        of that modality: an `ElectricalSeries` of 384 channels, a `TwoPhotonSeries` of 796 x 512 frames, or a
+        `CurrentClampSeries`.
+    data_size : int
+        The size in bytes of the data of the main series, rounded down to a whole number of rows (of at least one).
+    number_of_objects : int, default: 0
+        The number of small `TimeSeries` to add in a 'synthetic' processing module, to scale the amount of metadata
+        independently of the size of the data.
+    chunk_shape : tuple of int, optional
+        The chunk shape of the main series, limited to its shape.
+        Defaults to the chunk shape of the data of the DANDI test file of that modality.
+    seed : int, default: 0
+        The seed of the data of the main series. Files created with the same arguments hold the same data and
+        structure (though PyNWB assigns new object IDs every time).
+
+    Returns
+    -------
+    pynwb.NWBFile
+        The NWBFile, whose main series iterates over its data while being written. As such, it can only be written once.
+    """
+    if modality not in SYNTHETIC_MODALITIES:
+        raise ValueError(f"Unknown modality '{modality}'; expected one of {tuple(SYNTHETIC_MODALITIES)}.")
+
+    row_shape = SYNTHETIC_MODALITIES[modality]["row_shape"]
+    dtype = SYNTHETIC_MODALITIES[modality]["dtype"]
+    row_size = numpy.dtype(dtype).itemsize * math.prod(row_shape)
+    shape = (max(1, data_size // row_size), *row_shape)
+    chunk_shape = chunk_shape or SYNTHETIC_MODALITIES[modality]["chunk_shape"]
+    chunk_shape = tuple(min(chunk_length, length) for chunk_length, length in zip(chunk_shape, shape))
+    data = SyntheticDataChunkIterator(shape=shape, dtype=dtype, chunk_shape=chunk_shape, seed=seed)
+
+    nwbfile = pynwb.NWBFile(
+        session_description=f"Synthetic {modality.lower()} data for scaling benchmarks.",
+        identifier=f"synthetic-{modality.lower()}-{data_size}-bytes-{number_of_objects}-objects-seed-{seed}",
+        session_start_time=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+    device = nwbfile.create_device(name="Device", description="A synthetic device.")
+    series_name = SYNTHETIC_SERIES_NAMES[modality]
+
+    if modality == "Ecephys":
+        electrode_group = nwbfile.create_electrode_group(
+            name="ElectrodeGroup", description="A synthetic probe.", location="unknown", device=device
+        )
+        for _ in range(row_shape[0]):
+            nwbfile.add_electrode(group=electrode_group, location="unknown")
+        electrodes = nwbfile.create_electrode_table_region(
+            region=list(range(row_shape[0])), description="All electrodes."
+        )
+        nwbfile.add_acquisition(
+            pynwb.ecephys.ElectricalSeries(
+                name=series_name, data=data, electrodes=electrodes, rate=30_000.0, conversion=1e-6
+            )
+        )
+    elif modality == "Ophys":
+        imaging_plane = nwbfile.create_imaging_plane(
+            name="ImagingPlane",
+            optical_channel=pynwb.ophys.OpticalChannel(
+                name="OpticalChannel", description="A synthetic channel.", emission_lambda=500.0
+            ),
+            description="A synthetic imaging plane.",
+            device=device,
+            excitation_lambda=600.0,
+            imaging_rate=30.0,
+            indicator="unknown",
+            location="unknown",
+        )
+        nwbfile.add_acquisition(
+            pynwb.ophys.TwoPhotonSeries(
+                name=series_name, data=data, imaging_plane=imaging_plane, rate=30.0, unit="n.a."
+            )
+        )
+    else:
+        electrode = nwbfile.create_icephys_electrode(
+            name="IntracellularElectrode", description="A synthetic electrode.", device=device
+        )
+        nwbfile.add_acquisition(
+            pynwb.icephys.CurrentClampSeries(name=series_name, data=data, electrode=electrode, rate=50_000.0, gain=1.0)
+        )
+
+    if number_of_objects > 0:
+        processing_module = nwbfile.create_processing_module(name="synthetic", description="Synthetic objects.")
+        for index in range(number_of_objects):
+            processing_module.add(pynwb.TimeSeries(name=f"TimeSeries{index}", data=[0.0], rate=1.0, unit="n.a."))
+
+    return nwbfile
+
+
+def write_synthetic_nwbfile(
+    nwbfile: pynwb.NWBFile,
+    file_path: pathlib.Path,
+    backend: str,
+    page_size: Optional[int] = None,
+    consolidated: bool = True,
+) -> pathlib.Path:
+    """
+    Write an NWBFile to an HDF5 file ("hdf5") or a Zarr directory store ("zarr").
+
+    HDF5 files are written with paged aggregation of their file space if a `page_size` (in bytes) is given, which
+    gathers the metadata of the file into pages of that size. Zarr stores consolidate their metadata into a single
+    `.zmetadata` file unless `consolidated` is False.
+    """
+    if backend == "hdf5":
+        if page_size is None:
+            file = h5py.File(name=file_path, mode="w")
+        else:
+            file = h5py.File(name=file_path, mode="w", fs_strategy="page", fs_persist=True, fs_page_size=page_size)
+        with pynwb.NWBHDF5IO(file=file, mode="w") as io:
+            io.write(nwbfile)
+    elif backend == "zarr":
+        from hdmf_zarr import NWBZarrIO
+
+        with NWBZarrIO(path=str(file_path), mode="w") as io:
+            io.write(nwbfile, consolidate_metadata=consolidated)
+    else:
+        raise ValueError(f"Unknown backend '{backend}'; expected 'hdf5' or 'zarr'.")
+    return file_path
+
+
+def get_synthetic_asset(
+    modality: str,
+    backend: str,
+    data_size: int,
+    number_of_objects: int = 0,
+    chunk_shape: Optional[Tuple[int, ...]] = None,
+    seed: int = 0,
+    page_size: Optional[int] = None,
+    consolidated: bool = True,
+) -> pathlib.Path:
+    """
+    Get a synthetic NWB file, creating it in the persistent download directory if needed.
+
+    See `create_synthetic_nwbfile` for the parameters of the file and `write_synthetic_nwbfile` for the `page_size` of
+    HDF5 files and the `consolidated` metadata of Zarr stores. The backend can be "hdf5", "zarr", or "lindi"; a LINDI
+    JSON file refers to the chunks of the HDF5 file with the same parameters, which is created along with it.
+
+    NOTE: Creating a file generates and writes all of its data, which can take a long time for large sizes, so this
+    function should not be included in the timing of benchmarks.
+    """
+    assets_directory = get_persistent_download_directory() / "synthetic_assets"
+    assets_directory.mkdir(exist_ok=True)
+
+    chunks = "default" if chunk_shape is None else "x".join(str(length) for length in chunk_shape)
+    file_stem = f"{modality.lower()}_{data_size}-bytes_{number_of_objects}-objects_chunks-{chunks}_seed-{seed}"
+    suffix = dict(hdf5=".nwb", zarr=".nwb.zarr", lindi=".nwb.lindi.json").get(backend)
+    if suffix is None:
+        raise ValueError(f"Unknown backend '{backend}'; expected 'hdf5', 'zarr', or 'lindi'.")
+    if page_size is not None:
+        if backend == "zarr":
+            raise ValueError("Paged aggregation only applies to HDF5 files.")
+        file_stem += f"_paged-{page_size}"
+    if not consolidated:
+        if backend != "zarr":
+            raise ValueError("Unconsolidated metadata only applies to Zarr stores.")
+        file_stem += "_unconsolidated"
+    file_path = assets_directory / f"{file_stem}{suffix}"
+    if file_path.exists():
+        return file_path
+
+    # Write to a partial file first so that an interrupted write is not mistaken for a complete one
+    partial_file_path = assets_directory / f"{file_stem}.partial{suffix}"
+    if backend == "lindi":
+        import lindi
+
+        hdf5_file_path = get_synthetic_asset(
+            modality=modality,
+            backend="hdf5",
+            data_size=data_size,
+            number_of_objects=number_of_objects,
+            chunk_shape=chunk_shape,
+            seed=seed,
+            page_size=page_size,
+        )
+        # The chunks of the data are referred to by the absolute path of the HDF5 file
+        hdf5_file_path = str(hdf5_file_path.absolute())
+        client = lindi.LindiH5pyFile.from_hdf5_file(url_or_path=hdf5_file_path, url=hdf5_file_path)
+        client.write_lindi_file(filename=str(partial_file_path))
+        client.close()
+    else:
+        nwbfile = create_synthetic_nwbfile(
+            modality=modality,
+            data_size=data_size,
+            number_of_objects=number_of_objects,
+            chunk_shape=chunk_shape,
+            seed=seed,
+        )
+        write_synthetic_nwbfile(
+            nwbfile=nwbfile,
+            file_path=partial_file_path,
+            backend=backend,
+            page_size=page_size,
+            consolidated=consolidated,
+        )
+    partial_file_path.rename(file_path)
+
+    return file_path
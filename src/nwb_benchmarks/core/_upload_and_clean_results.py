@@ -1,6 +1,7 @@
 import itertools
 import json
 import pathlib
+import shutil
 import time
 import warnings
 
@@ -10,7 +11,10 @@ from ..globals import (
     ENVIRONMENTS_DIR,
     LOGS_DIR,
     MACHINES_DIR,
+    PROFILES_DIR,
+    QUICK_RESULTS_DIR,
     RESULTS_DIR,
+    SHARDS_DIR,
 )
 from ..setup import get_benchmarks_home_directory
 
@@ -21,12 +25,18 @@ def clean_results():
 
     for results_file_path in itertools.chain(
         RESULTS_DIR.rglob(pattern="*.json"),
+        SHARDS_DIR.rglob(pattern="*.json"),
+        PROFILES_DIR.rglob(pattern="*.json"),
+        QUICK_RESULTS_DIR.rglob(pattern="*.json"),
         MACHINES_DIR.rglob(pattern="*.json"),
         ENVIRONMENTS_DIR.rglob(pattern="*.json"),
         LOGS_DIR.rglob(pattern="*.txt"),
     ):
         results_file_path.unlink(missing_ok=True)
 
+    for profiles_directory_path in PROFILES_DIR.glob(pattern="*_profiles"):
+        shutil.rmtree(path=profiles_directory_path, ignore_errors=True)
+
 
 def upload_results():
     upload_tracker_file_path = get_benchmarks_home_directory() / "upload_tracker.json"
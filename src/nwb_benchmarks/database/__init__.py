@@ -6,6 +6,7 @@ from ._parquet import (
     repackage_as_parquet,
 )
 from ._processing import BenchmarkDatabase
+from ._regressions import RegressionDetector
 from ._visualization import BenchmarkVisualizer
 
 __all__ = [
@@ -15,6 +16,7 @@ __all__ = [
     "Environment",
     "BenchmarkDatabase",
     "BenchmarkVisualizer",
+    "RegressionDetector",
     "concat_dataclasses_to_parquet",
     "repackage_as_parquet",
 ]
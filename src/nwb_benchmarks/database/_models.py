@@ -45,8 +45,11 @@ class Results:
 
             return results
 
-        if isinstance(benchmark_results, dict):
+        if isinstance(benchmark_results, dict) and "total_traffic_in_number_of_web_packets" in benchmark_results:
             value_dict = process_network_results(benchmark_results)
+        elif isinstance(benchmark_results, dict):
+            # e.g., adaptive sampling results with the timing samples and the achieved confidence interval
+            value_dict = benchmark_results
         else:
             value_dict = dict(time=benchmark_results)
 
@@ -75,6 +78,12 @@ class Results:
             version="1.0.0"
         ):
             return None
+        # The timings of profiled runs include the overhead of the profiler
+        if data.get("profiled", False):
+            return None
+        # Benchmarks run in the current interpreter are not isolated from each other as they are by ASV
+        if data.get("runner", "asv") != "asv":
+            return None
 
         timestamp = data["timestamp"]
         commit_hash = data["commit_hash"]
@@ -105,6 +114,11 @@ class Results:
     def to_dataframe(self) -> "polars.DataFrame":
         import polars
 
+        def get_shape(parameter_case: dict, key: str) -> list[int] | None:
+            """Get a shape of a parameter case (e.g., the chunk shape of a Zarr v3 layout) as a list, if specified."""
+            shape = parameter_case.get(key)
+            return list(shape) if shape is not None else None
+
         data = {
             "uuid": [result.uuid for result in self.results],
             "version": [result.version for result in self.results],
@@ -117,6 +131,12 @@ class Results:
             "parameter_case_https_url": [result.parameter_case.get("https_url") for result in self.results],
             "parameter_case_object_name": [result.parameter_case.get("object_name") for result in self.results],
             "parameter_case_slice_range": [result.parameter_case.get("slice_range") for result in self.results],
+            "parameter_case_chunk_shape": [get_shape(result.parameter_case, "chunk_shape") for result in self.results],
+            "parameter_case_shard_shape": [get_shape(result.parameter_case, "shard_shape") for result in self.results],
+            "parameter_case_codec": [result.parameter_case.get("codec") for result in self.results],
+            "parameter_case_number_of_threads": [
+                result.parameter_case.get("number_of_threads") for result in self.results
+            ],
             "value": [result.value for result in self.results],
             "variable": [result.variable for result in self.results],
         }
@@ -1,11 +1,16 @@
 import re
+import shutil
+import statistics
+import uuid
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import packaging.version
 import polars as pl
 
 from nwb_benchmarks.database._parquet import repackage_as_parquet
+from nwb_benchmarks.utils import get_dictionary_checksum, get_file_checksum
 
 PACKAGES_OF_INTEREST = [
     "h5py",
@@ -27,6 +32,69 @@ ENVIRONMENT_TIMEPOINTS = {
     "2025-09-01": "052cb4d925793bbbc270d9384a60bc24023025b7",  # note - this environment was created after 2025-09-01 but exact date unknown
 }
 
+# Increment when the definitions below change so that previously materialized tables are not reused
+AGGREGATES_VERSION = "1.0.1"
+AGGREGATES_VERSION_FILE_NAME = "aggregates_version.txt"
+
+AGGREGATE_GROUP_COLUMNS = [
+    "benchmark_name_type",
+    "benchmark_name_label",
+    "benchmark_name_clean",
+    "modality",
+    "slice_number",
+    "is_preloaded",
+    "is_local",
+    "variable",
+]
+
+AGGREGATE_DEFINITIONS = {
+    # Per method/modality/slice summary statistics across all runs
+    "benchmark_statistics": dict(
+        group_by=AGGREGATE_GROUP_COLUMNS,
+        aggregations=[
+            pl.col("value").mean().alias("mean"),
+            pl.col("value").std().alias("std"),
+            pl.col("value").median().alias("median"),
+            pl.col("value").min().alias("min"),
+            pl.col("value").max().alias("max"),
+            pl.col("value").count().alias("count"),
+        ],
+    ),
+    # Per environment medians, used for tracking performance across package versions
+    "environment_medians": dict(
+        group_by=["environment_id", *AGGREGATE_GROUP_COLUMNS],
+        aggregations=[
+            pl.col("value").median().alias("median"),
+            pl.col("value").count().alias("count"),
+        ],
+    ),
+}
+
+
+def _filter_by_column_values(df: pl.LazyFrame, filters: dict) -> pl.LazyFrame:
+    """Filter each column named by a key to its value; list or tuple values match any of the elements."""
+    for column_name, value in filters.items():
+        if isinstance(value, (list, tuple)):
+            df = df.filter(pl.col(column_name).is_in(list(value)))
+        else:
+            df = df.filter(pl.col(column_name) == value)
+
+    return df
+
+
+def _is_stale_aggregates_directory(directory: Path) -> bool:
+    """Whether a directory of materialized aggregates was written by an older version of the aggregates."""
+    # Partial directories are being written by another process
+    if not directory.is_dir() or directory.name.startswith("."):
+        return False
+
+    version_file_path = directory / AGGREGATES_VERSION_FILE_NAME
+    if not version_file_path.exists():
+        return True
+    return packaging.version.Version(version_file_path.read_text().strip()) < packaging.version.Version(
+        AGGREGATES_VERSION
+    )
+
 
 class BenchmarkDatabase:
     """Handles database preprocessing and loading for NWB benchmarks."""
@@ -57,6 +125,34 @@ class BenchmarkDatabase:
 
         self._results_df = None
         self._environments_df = None
+        self._aggregates_directory = None
+
+    @classmethod
+    def from_frames(
+        cls,
+        results_df: pl.DataFrame,
+        environments_df: Optional[pl.DataFrame] = None,
+        aggregates_directory: Optional[Path] = None,
+        **kwargs,
+    ) -> "BenchmarkDatabase":
+        """
+        Create a database handler backed by already preprocessed frames instead of the parquet files.
+
+        This is used to hand collected data to other processes (e.g., for parallel figure generation)
+        without scanning and preprocessing the database again.
+
+        Args:
+            results_df: Preprocessed results, as returned by `get_results`
+            environments_df: Preprocessed environments, as returned by `get_environments`
+            aggregates_directory: Directory of already materialized aggregates
+            **kwargs: Passed to the constructor
+        """
+        db = cls(**kwargs)
+        db._results_df = results_df.lazy()
+        if environments_df is not None:
+            db._environments_df = environments_df.lazy()
+        db._aggregates_directory = aggregates_directory
+        return db
 
     def create_database(self, minimum_results_version: str = "3.0.0", minimum_machines_version: str = "1.4.0") -> None:
         """Create new database file with latest results."""
@@ -67,6 +163,11 @@ class BenchmarkDatabase:
             minimum_machines_version=minimum_machines_version,
         )
 
+        # Any previously loaded frames or aggregates may refer to the old database files
+        self._results_df = None
+        self._environments_df = None
+        self._aggregates_directory = None
+
     @staticmethod
     @lru_cache(maxsize=128)
     def split_camel_case(text: str) -> str:
@@ -85,6 +186,7 @@ class BenchmarkDatabase:
             name.replace("ContinuousSliceBenchmark", "")
             .replace("FileReadBenchmark", "")
             .replace("DownloadBenchmark", "")
+            .replace("FirstPlotBenchmark", "")
         )
         return self.split_camel_case(short_name).lower()
 
@@ -127,7 +229,7 @@ class BenchmarkDatabase:
             .with_columns(
                 [
                     pl.col("benchmark_name_test")
-                    .str.extract(r"(ContinuousSliceBenchmark|FileReadBenchmark|DownloadBenchmark)")
+                    .str.extract(r"(ContinuousSliceBenchmark|FileReadBenchmark|DownloadBenchmark|FirstPlotBenchmark)")
                     .alias("benchmark_name_label"),
                     pl.col("benchmark_name_test")
                     .map_elements(self.clean_benchmark_name_test, return_dtype=pl.String)
@@ -228,6 +330,258 @@ class BenchmarkDatabase:
 
         return self._environments_df
 
+    def get_database_checksum(self) -> str:
+        """
+        Get a checksum identifying the current version of the database.
+
+        This combines the hashes of the source parquet files with the filters applied during preprocessing.
+        """
+        source_checksums = {
+            file_name: get_file_checksum(file_path=self.db_directory / file_name)
+            for file_name in ["results.parquet", "environments.parquet"]
+            if (self.db_directory / file_name).exists()
+        }
+        database_state = dict(
+            aggregates_version=AGGREGATES_VERSION,
+            machine_id=self.machine_id,
+            exclude_older=self.exclude_older,
+            **source_checksums,
+        )
+        return get_dictionary_checksum(dictionary=database_state)
+
+    def materialize_aggregates(self, overwrite: bool = False) -> Path:
+        """
+        Compute the common aggregates once per database version and store them as small parquet files.
+
+        Materialized tables are stored in a subdirectory of the database directory named by the database checksum.
+        Each subdirectory is written in full before being renamed into place, so that concurrent processes never read
+        a partial one. Tables materialized by an older version of the aggregates are removed, while those of other
+        databases of the same version (e.g., filtered for another machine) are kept.
+
+        Args:
+            overwrite: Recompute the aggregates even if they already exist for this version of the database
+
+        Returns:
+            Directory containing one parquet file per aggregate
+        """
+        aggregates_root = self.db_directory / "aggregates"
+        aggregates_directory = aggregates_root / self.get_database_checksum()
+        expected_file_paths = [aggregates_directory / f"{name}.parquet" for name in AGGREGATE_DEFINITIONS]
+        expected_file_paths.append(aggregates_directory / AGGREGATES_VERSION_FILE_NAME)
+
+        if overwrite or not all(file_path.exists() for file_path in expected_file_paths):
+            print("Materializing benchmark aggregates...")
+            partial_directory = aggregates_root / f".{aggregates_directory.name}.partial-{uuid.uuid4().hex}"
+            partial_directory.mkdir(parents=True)
+
+            results_df = self.get_results().collect()
+            for name, definition in AGGREGATE_DEFINITIONS.items():
+                aggregate_df = (
+                    results_df.group_by(definition["group_by"])
+                    .agg(definition["aggregations"])
+                    .sort(definition["group_by"], nulls_last=True)
+                )
+                aggregate_df.write_parquet(file=partial_directory / f"{name}.parquet")
+            (partial_directory / AGGREGATES_VERSION_FILE_NAME).write_text(AGGREGATES_VERSION)
+
+            # Check again, as another process may have materialized the same aggregates in the meantime
+            if overwrite or not all(file_path.exists() for file_path in expected_file_paths):
+                shutil.rmtree(path=aggregates_directory, ignore_errors=True)
+            try:
+                partial_directory.rename(aggregates_directory)
+            except OSError:
+                # Another process materialized the same aggregates first
+                shutil.rmtree(path=partial_directory, ignore_errors=True)
+
+        for directory in aggregates_root.iterdir():
+            if _is_stale_aggregates_directory(directory=directory):
+                shutil.rmtree(path=directory, ignore_errors=True)
+
+        self._aggregates_directory = aggregates_directory
+        return aggregates_directory
+
+    def get_aggregate(self, name: str) -> pl.LazyFrame:
+        """
+        Load a precomputed aggregate table, materializing all aggregates first if needed.
+
+        Args:
+            name: Name of the aggregate (one of 'benchmark_statistics' or 'environment_medians')
+
+        Returns:
+            Lazy scan of the materialized aggregate table
+        """
+        if name not in AGGREGATE_DEFINITIONS:
+            raise ValueError(f"Unknown aggregate '{name}'. Available aggregates are {list(AGGREGATE_DEFINITIONS)}.")
+
+        if self._aggregates_directory is None:
+            self.materialize_aggregates()
+
+        return pl.scan_parquet(self._aggregates_directory / f"{name}.parquet")
+
+    def query_aggregates(self, name: str, **filters) -> pl.LazyFrame:
+        """
+        Query a precomputed aggregate table by column values.
+
+        Each keyword argument filters a column of the aggregate; list or tuple values match any of the elements.
+        For example, `db.query_aggregates("benchmark_statistics", benchmark_name_type="time_remote_slicing",
+        modality=["Ecephys", "Ophys"])`.
+        """
+        return _filter_by_column_values(df=self.get_aggregate(name=name), filters=filters)
+
+    def get_mean_times(
+        self, benchmark_type: str, alias: str, group_by: Optional[list[str]] = None, **filters
+    ) -> pl.LazyFrame:
+        """
+        Get the mean value of each group for a benchmark type from the precomputed statistics.
+
+        The means of the finer-grained groups in the aggregate table are weighted by their counts, so the result is
+        identical to averaging the raw values. Additional keyword arguments are passed to `query_aggregates`.
+        """
+        group_by = group_by or ["modality", "benchmark_name_clean"]
+        return (
+            self.query_aggregates("benchmark_statistics", benchmark_name_type=benchmark_type, **filters)
+            .group_by(group_by)
+            .agg(((pl.col("mean") * pl.col("count")).sum() / pl.col("count").sum()).alias(alias))
+        )
+
+    def get_case_durations(self) -> pl.LazyFrame:
+        """
+        Get the mean recorded duration of each benchmark case, used to estimate its cost when sharding a run.
+
+        Cases are identified by the full benchmark name and the name of the parameter case.
+        """
+        return (
+            self.get_results()
+            .filter(pl.col("variable") == "time")
+            .group_by(["benchmark_name", "parameter_case_name"])
+            .agg(pl.col("value").mean().alias("duration"))
+            .sort(["benchmark_name", "parameter_case_name"])
+        )
+
+    def get_adaptive_sampling_runs(self, benchmark_type: str = "time_remote_slicing_adaptive") -> pl.LazyFrame:
+        """
+        Get one row per run of an adaptively sampled benchmark case.
+
+        Each row holds the median of the timing samples of the run along with the confidence interval of the median
+        and the number of samples recorded by the adaptive sampler.
+        """
+        run_columns = [
+            "machine_id",
+            "timestamp",
+            "environment_id",
+            "benchmark_name",
+            "parameter_case_name",
+            *[column for column in AGGREGATE_GROUP_COLUMNS if column != "variable"],
+        ]
+        return (
+            self.filter_tests(benchmark_type)
+            .group_by(run_columns)
+            .agg(
+                [
+                    pl.col("value").filter(pl.col("variable") == "time").median().alias("median"),
+                    # Results of older versions may hold an infinite relative width where the median was zero
+                    *[
+                        pl.col("value")
+                        .filter((pl.col("variable") == variable) & pl.col("value").is_finite())
+                        .first()
+                        .alias(variable)
+                        for variable in [
+                            "median_confidence_interval_lower",
+                            "median_confidence_interval_upper",
+                            "median_confidence_interval_relative_width",
+                            "number_of_samples",
+                        ]
+                    ],
+                ]
+            )
+        )
+
+    def get_precision_weighted_times(
+        self,
+        benchmark_type: str = "time_remote_slicing_adaptive",
+        alias: str = "value",
+        group_by: Optional[list[str]] = None,
+        confidence: float = 0.95,
+    ) -> pl.LazyFrame:
+        """
+        Combine the medians of adaptively sampled runs, weighting each run by the precision of its median.
+
+        The standard error of each median is estimated from the width of its confidence interval, and runs are weighted
+        by the inverse of its square so that noisy runs with wide intervals contribute less.
+        """
+        group_by = group_by or ["modality", "benchmark_name_clean", "slice_number"]
+        z_score = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+        interval_width = pl.col("median_confidence_interval_upper") - pl.col("median_confidence_interval_lower")
+        standard_error = pl.max_horizontal(interval_width / (2 * z_score), pl.lit(1e-12))
+        return (
+            self.get_adaptive_sampling_runs(benchmark_type=benchmark_type)
+            .with_columns((1 / standard_error**2).alias("weight"))
+            .group_by(group_by)
+            .agg(
+                [
+                    ((pl.col("median") * pl.col("weight")).sum() / pl.col("weight").sum()).alias(alias),
+                    (1 / pl.col("weight").sum().sqrt()).alias("standard_error"),
+                    pl.col("number_of_samples").sum().alias("number_of_samples"),
+                    pl.len().alias("number_of_runs"),
+                ]
+            )
+        )
+
+    def get_percentile_times(
+        self,
+        benchmark_type: str,
+        alias: str,
+        percentile: float = 99.0,
+        group_by: Optional[list[str]] = None,
+        **filters,
+    ) -> pl.LazyFrame:
+        """
+        Get a percentile of the values of each group for a benchmark type, e.g., the p99 of the slicing times.
+
+        Unlike means, percentiles cannot be combined from the precomputed statistics, so they are computed from the
+        results. Additional keyword arguments filter the results as in `query_aggregates`.
+        """
+        group_by = group_by or ["modality", "benchmark_name_clean"]
+        return (
+            _filter_by_column_values(df=self.filter_tests(benchmark_type), filters=filters)
+            .group_by(group_by)
+            .agg(pl.col("value").quantile(percentile / 100, interpolation="higher").alias(alias))
+        )
+
+    def get_latency_percentiles(
+        self,
+        benchmark_type: str = "time_remote_slicing_latency",
+        percentiles: tuple[float, ...] = (50.0, 90.0, 99.0),
+        group_by: Optional[list[str]] = None,
+    ) -> pl.LazyFrame:
+        """
+        Combine the latency percentiles recorded by the runs of the latency distribution benchmarks.
+
+        Each run records the percentiles of the latencies of its own slices (e.g., `latency_p99`); for each group, the
+        median across runs of each percentile is returned in a column named after it (e.g., `p99`).
+        """
+        group_by = group_by or ["modality", "benchmark_name_clean"]
+        return (
+            self.filter_tests(benchmark_type)
+            .group_by(group_by)
+            .agg(
+                [
+                    pl.col("value")
+                    .filter(pl.col("variable") == f"latency_p{percentile:g}")
+                    .median()
+                    .alias(f"p{percentile:g}")
+                    for percentile in percentiles
+                ]
+                + [
+                    pl.col("value")
+                    .filter(pl.col("variable") == "number_of_samples")
+                    .sum()
+                    .cast(pl.Int64)
+                    .alias("number_of_samples")
+                ]
+            )
+        )
+
     def join_results_with_environments(self) -> pl.LazyFrame:
         """Join streaming package versions with results using the environments table."""
         return self.get_results().join(
@@ -269,9 +623,8 @@ class BenchmarkDatabase:
         return (
             df_a.join(
                 # get average file read time
-                self.filter_tests(read_col_name)
-                .group_by(["modality", "benchmark_name_clean"])
-                .agg(pl.col("value").mean().alias("avg_file_open_time")),  # TODO check what average includes
+                # TODO check what average includes
+                self.get_mean_times(benchmark_type=read_col_name, alias="avg_file_open_time"),
                 # match on benchmark_name_clean + parameter_case_name
                 on=["modality", "benchmark_name_clean"],
                 how="left",
@@ -283,17 +636,14 @@ class BenchmarkDatabase:
     def combine_download_read_and_slice_times(
         self, read_col_name: str, slice_col_name: str, with_baseline: bool = False
     ) -> pl.LazyFrame:
-        download_df = self.filter_tests("time_download")
         local_read_and_slice_df = self.combine_read_and_slice_times(
             read_col_name=read_col_name, slice_col_name=slice_col_name, with_baseline=with_baseline
         )
 
         return local_read_and_slice_df.join(
-            download_df.with_columns(
+            self.get_mean_times(benchmark_type="time_download", alias="avg_download_time").with_columns(
                 pl.col("benchmark_name_clean").str.replace("dandi api", "pynwb").alias("benchmark_name_clean")
-            )
-            .group_by(["modality", "benchmark_name_clean"])
-            .agg(pl.col("value").mean().alias("avg_download_time")),
+            ),
             on=["modality", "benchmark_name_clean"],
             how="left",
         ).with_columns(
@@ -0,0 +1,276 @@
+"""Statistical detection of step changes (regressions and improvements) in the benchmark results database."""
+
+import math
+import random
+from typing import Dict, List, Literal, Optional, Tuple
+
+import polars as pl
+
+from nwb_benchmarks.database._processing import BenchmarkDatabase
+
+SERIES_COLUMNS = ["machine_id", "benchmark_name", "parameter_case_name", "variable"]
+
+
+def _median(values: List[float]) -> float:
+    sorted_values = sorted(values)
+    middle = len(sorted_values) // 2
+    if len(sorted_values) % 2 == 1:
+        return sorted_values[middle]
+    return (sorted_values[middle - 1] + sorted_values[middle]) / 2
+
+
+def mann_whitney_u_test(before: List[float], after: List[float]) -> float:
+    """
+    Two-sided Mann-Whitney U test using the normal approximation with tie and continuity corrections.
+
+    Returns
+    -------
+    float
+        The p-value for the null hypothesis that both samples come from the same distribution.
+    """
+    number_before = len(before)
+    number_after = len(after)
+    total = number_before + number_after
+
+    # Rank the pooled samples, assigning the average rank to ties
+    pooled = sorted([(value, 0) for value in before] + [(value, 1) for value in after])
+    ranks = [0.0] * total
+    tie_correction = 0.0
+    start = 0
+    while start < total:
+        end = start
+        while end + 1 < total and pooled[end + 1][0] == pooled[start][0]:
+            end += 1
+        average_rank = (start + end) / 2 + 1
+        for index in range(start, end + 1):
+            ranks[index] = average_rank
+        tie_size = end - start + 1
+        tie_correction += tie_size**3 - tie_size
+        start = end + 1
+
+    rank_sum_before = sum(rank for rank, (_, group) in zip(ranks, pooled) if group == 0)
+    u_statistic = rank_sum_before - number_before * (number_before + 1) / 2
+    expected_u = number_before * number_after / 2
+    variance = number_before * number_after / 12 * ((total + 1) - tie_correction / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+
+    deviation = abs(u_statistic - expected_u) - 0.5
+    z_score = max(deviation, 0.0) / math.sqrt(variance)
+    return math.erfc(z_score / math.sqrt(2))
+
+
+def bootstrap_median_test(
+    before: List[float], after: List[float], number_of_samples: int = 1000, seed: int = 0
+) -> float:
+    """
+    Two-sided bootstrap test on the difference of medians.
+
+    Returns
+    -------
+    float
+        The fraction of bootstrap replicates on the opposite side of zero from the observed difference, doubled.
+    """
+    generator = random.Random(seed)
+    observed_difference = _median(after) - _median(before)
+    if observed_difference == 0:
+        return 1.0
+
+    opposite_sign_count = 0
+    for _ in range(number_of_samples):
+        resampled_before = generator.choices(before, k=len(before))
+        resampled_after = generator.choices(after, k=len(after))
+        difference = _median(resampled_after) - _median(resampled_before)
+        if difference * observed_difference <= 0:
+            opposite_sign_count += 1
+
+    return min(1.0, 2 * (opposite_sign_count + 1) / (number_of_samples + 1))
+
+
+class RegressionDetector:
+    """
+    Detect step changes in benchmark results and tie each one to the package versions that changed.
+
+    Results are grouped into series by machine, benchmark, parameter case and variable. Each series is ordered by
+    timestamp and environment, and consecutive runs are split by binary segmentation: the most likely split is kept if
+    its relative change of the median exceeds the threshold and the chosen test, Bonferroni-adjusted for the number of
+    candidate splits, is significant; both sides are then searched again.
+    """
+
+    def __init__(
+        self,
+        db: BenchmarkDatabase,
+        threshold: float = 0.05,
+        confidence: float = 0.95,
+        method: Literal["mann-whitney", "bootstrap"] = "mann-whitney",
+        minimum_runs_per_segment: int = 2,
+        number_of_bootstrap_samples: int = 1000,
+        seed: int = 0,
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            db: The benchmark database to search
+            threshold: Minimum relative change of the median to report; defaults to the 5% used by ASV
+            confidence: Required confidence level of the change after correcting for the number of candidate splits
+            method: Statistical test used to compare the runs before and after a candidate split
+            minimum_runs_per_segment: Minimum number of runs required on either side of a split
+            number_of_bootstrap_samples: Number of replicates when using the bootstrap test
+            seed: Seed for the bootstrap test
+        """
+        if method not in ["mann-whitney", "bootstrap"]:
+            raise ValueError(f"Unknown method '{method}'. Use 'mann-whitney' or 'bootstrap'.")
+
+        self.db = db
+        self.threshold = threshold
+        self.confidence = confidence
+        self.method = method
+        self.minimum_runs_per_segment = minimum_runs_per_segment
+        self.number_of_bootstrap_samples = number_of_bootstrap_samples
+        self.seed = seed
+
+    def get_runs(self) -> pl.DataFrame:
+        """Collect the samples of every run (timestamp and environment) of every series, in run order."""
+        return (
+            self.db.get_results()
+            .filter(pl.col("value").is_not_nan())
+            .group_by([*SERIES_COLUMNS, "timestamp", "environment_id"])
+            .agg(pl.col("value").alias("values"))
+            .sort([*SERIES_COLUMNS, "timestamp", "environment_id"])
+            .collect()
+        )
+
+    def _test(self, before: List[float], after: List[float]) -> float:
+        if self.method == "mann-whitney":
+            return mann_whitney_u_test(before=before, after=after)
+        return bootstrap_median_test(
+            before=before, after=after, number_of_samples=self.number_of_bootstrap_samples, seed=self.seed
+        )
+
+    def _find_change_points(self, runs: List[List[float]], offset: int = 0) -> List[Tuple[int, float]]:
+        """Recursively find the indices of runs that start a new segment, along with their adjusted p-values."""
+        candidate_splits = range(self.minimum_runs_per_segment, len(runs) - self.minimum_runs_per_segment + 1)
+        if len(candidate_splits) == 0:
+            return []
+
+        # Locate the most likely split with the rank statistic, which is robust to outliers and, unlike the
+        # bootstrap, does not saturate at its resolution for well-separated segments
+        best_split = None
+        best_location_p_value = 1.0
+        best_relative_change = 0.0
+        for split in candidate_splits:
+            before = [value for run in runs[:split] for value in run]
+            after = [value for run in runs[split:] for value in run]
+
+            median_before = _median(before)
+            if median_before == 0:
+                continue
+            relative_change = abs(_median(after) - median_before) / abs(median_before)
+            if relative_change < self.threshold:
+                continue
+
+            location_p_value = mann_whitney_u_test(before=before, after=after)
+            if (location_p_value, -relative_change) < (best_location_p_value, -best_relative_change):
+                best_split = split
+                best_location_p_value = location_p_value
+                best_relative_change = relative_change
+
+        if best_split is None:
+            return []
+
+        before = [value for run in runs[:best_split] for value in run]
+        after = [value for run in runs[best_split:] for value in run]
+        best_p_value = min(1.0, self._test(before=before, after=after) * len(candidate_splits))
+        if best_p_value > 1 - self.confidence:
+            return []
+
+        return [
+            *self._find_change_points(runs=runs[:best_split], offset=offset),
+            (offset + best_split, best_p_value),
+            *self._find_change_points(runs=runs[best_split:], offset=offset + best_split),
+        ]
+
+    def _get_package_versions(self) -> Dict[str, Dict[str, str]]:
+        package_versions = dict()
+        for environment_id, package_name, package_version in (
+            self.db.get_environments().select(["environment_id", "package_name", "package_version"]).collect().rows()
+        ):
+            package_versions.setdefault(environment_id, dict())[package_name] = package_version
+        return package_versions
+
+    @staticmethod
+    def _describe_package_changes(before: Dict[str, str], after: Dict[str, str]) -> str:
+        changes = [
+            f"{package_name} {before.get(package_name)} -> {after.get(package_name)}"
+            for package_name in sorted(set(before) | set(after))
+            if before.get(package_name) != after.get(package_name)
+        ]
+        return ", ".join(changes)
+
+    def detect(self) -> pl.DataFrame:
+        """
+        Run change-point detection over every series in the database.
+
+        Returns
+        -------
+        polars.DataFrame
+            One row per detected step change, ranked by adjusted p-value and then by the size of the change.
+            The `changed_packages` column lists the packages of interest whose versions differ between the
+            environments of the last run before and the first run after the change.
+        """
+        package_versions = self._get_package_versions()
+
+        report_rows = []
+        for series_key, series_df in self.get_runs().group_by(SERIES_COLUMNS, maintain_order=True):
+            runs = series_df["values"].to_list()
+            timestamps = series_df["timestamp"].to_list()
+            environment_ids = series_df["environment_id"].to_list()
+
+            change_points = self._find_change_points(runs=runs)
+            boundaries = [0, *[index for index, _ in change_points], len(runs)]
+            for segment_index, (change_index, p_value) in enumerate(change_points):
+                before = [value for run in runs[boundaries[segment_index] : change_index] for value in run]
+                after = [value for run in runs[change_index : boundaries[segment_index + 2]] for value in run]
+                median_before = _median(before)
+                median_after = _median(after)
+                environment_before = environment_ids[change_index - 1]
+                environment_after = environment_ids[change_index]
+
+                report_rows.append(
+                    dict(
+                        zip(SERIES_COLUMNS, series_key),
+                        direction="regression" if median_after > median_before else "improvement",
+                        relative_change=(median_after - median_before) / abs(median_before),
+                        median_before=median_before,
+                        median_after=median_after,
+                        p_value=p_value,
+                        number_of_samples_before=len(before),
+                        number_of_samples_after=len(after),
+                        last_timestamp_before=timestamps[change_index - 1],
+                        first_timestamp_after=timestamps[change_index],
+                        environment_id_before=environment_before,
+                        environment_id_after=environment_after,
+                        changed_packages=self._describe_package_changes(
+                            before=package_versions.get(environment_before, dict()),
+                            after=package_versions.get(environment_after, dict()),
+                        ),
+                    )
+                )
+
+        if len(report_rows) == 0:
+            return pl.DataFrame(schema={column: pl.String for column in SERIES_COLUMNS})
+
+        return (
+            pl.DataFrame(report_rows)
+            .with_columns(pl.col("relative_change").abs().alias("absolute_relative_change"))
+            .sort(["p_value", "absolute_relative_change"], descending=[False, True])
+            .drop("absolute_relative_change")
+        )
+
+    def write_report(self, file_path, report: Optional[pl.DataFrame] = None) -> pl.DataFrame:
+        """Detect step changes (unless a report is given) and write the ranked report to a CSV file."""
+        report = report if report is not None else self.detect()
+        report.write_csv(file=file_path)
+        print(f"\nRegression report with {len(report)} step changes written to: {file_path}")
+        return report
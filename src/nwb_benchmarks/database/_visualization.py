@@ -1,3 +1,9 @@
+import concurrent.futures
+import dataclasses
+import hashlib
+import io
+import json
+import multiprocessing
 import textwrap
 import warnings
 from pathlib import Path
@@ -12,6 +18,7 @@ import seaborn as sns
 from packaging import version
 
 from nwb_benchmarks.database._processing import BenchmarkDatabase
+from nwb_benchmarks.utils import get_file_checksum
 
 DEFAULT_BENCHMARK_ORDER = [
     "hdf5 h5py remfile no cache",
@@ -26,6 +33,62 @@ DEFAULT_BENCHMARK_ORDER = [
     "zarr s3 force no consolidated",
 ]
 
+FIGURE_CACHE_FILE_NAME = ".figure_cache.json"
+
+# The modules whose code determines the content of the figures
+FIGURE_CODE_FILE_PATHS = [Path(__file__), Path(__file__).with_name("_processing.py")]
+
+# The phases of the time to first plot benchmarks, in order
+FIRST_PLOT_PHASES = ["open", "metadata", "first_screen"]
+
+# The read amplification variables of the network tracking slice benchmarks, with the label of their axis
+READ_AMPLIFICATION_VARIABLES = {
+    "read_amplification": "Bytes downloaded per byte returned",
+    "requests_per_megabyte": "HTTP requests per MB returned",
+    "bytes_wasted_by_read_ahead": "Bytes downloaded beyond those returned",
+}
+# All of the read amplification statistics, which are plotted separately from the other network statistics
+READ_AMPLIFICATION_STATISTICS = ["logical_bytes", *READ_AMPLIFICATION_VARIABLES]
+
+
+@dataclasses.dataclass
+class FigureTask:
+    """A single node of the figure task graph: one plotting method and the benchmark types it reads."""
+
+    method_name: str
+    kwargs: dict
+    benchmark_types: List[str]
+    requires_environments: bool = False
+
+    @property
+    def key(self) -> str:
+        return f"{self.method_name}({json.dumps(self.kwargs, sort_keys=True)})"
+
+
+def _frame_to_ipc_bytes(df: pl.DataFrame) -> bytes:
+    """Serialize a collected frame to Arrow IPC so it can be shipped to a worker process without a re-scan."""
+    buffer = io.BytesIO()
+    df.write_ipc(buffer)
+    return buffer.getvalue()
+
+
+def _render_figure_task(
+    output_directory: Path,
+    task: FigureTask,
+    results_ipc: bytes,
+    environments_ipc: Optional[bytes],
+    aggregates_directory: Optional[Path],
+) -> List[str]:
+    """Render a single figure task and return the paths of the files it saved; runs inside a worker process."""
+    db = BenchmarkDatabase.from_frames(
+        results_df=pl.read_ipc(io.BytesIO(results_ipc)),
+        environments_df=pl.read_ipc(io.BytesIO(environments_ipc)) if environments_ipc is not None else None,
+        aggregates_directory=aggregates_directory,
+    )
+    visualizer = BenchmarkVisualizer(output_directory=output_directory)
+    getattr(visualizer, task.method_name)(db, **task.kwargs)
+    return visualizer.saved_file_paths
+
 
 class BenchmarkVisualizer:
     """Handles plotting and visualization of benchmark results."""
@@ -45,6 +108,7 @@ class BenchmarkVisualizer:
         """
         self.output_directory = output_directory or Path(__file__).parent / "figures"
         self.output_directory.mkdir(parents=True, exist_ok=True)
+        self.saved_file_paths: List[str] = []
         self._setup_matplotlib()
 
     @staticmethod
@@ -54,6 +118,11 @@ class BenchmarkVisualizer:
         matplotlib.rcParams["ps.fonttype"] = 42
         matplotlib.rcParams["font.family"] = "Arial"
 
+    def _save_figure(self, filename: Path, **kwargs):
+        """Save the current figure and record its path so that `plot_all` can tell when it is missing."""
+        plt.savefig(filename, **kwargs)
+        self.saved_file_paths.append(str(filename))
+
     @staticmethod
     def _format_stat_text(mean: float, std: float, count: int) -> str:
         """Format statistical text based on value magnitude."""
@@ -232,6 +301,7 @@ class BenchmarkVisualizer:
         palette: str = "Paired",
         catplot_kwargs: Optional[Dict[str, Any]] = None,
         caption: str = None,
+        xlabel: str = "Time (s)",
     ):
         """Create distribution plot for benchmarks."""
         catplot_kwargs = catplot_kwargs or {}
@@ -257,7 +327,7 @@ class BenchmarkVisualizer:
         if add_annotations:
             g.map_dataframe(self._add_mean_std_annotations, value="value", group=group, order=metric_order)
 
-        g.set(xlabel="Time (s)", ylabel=df["benchmark_name_label"].iloc[0])
+        g.set(xlabel=xlabel, ylabel=df["benchmark_name_label"].iloc[0])
 
         for ax in g.axes.flat:
             wrapped_title = "\n".join(textwrap.wrap(ax.get_title(), width=50))
@@ -270,7 +340,7 @@ class BenchmarkVisualizer:
 
         sns.despine()
         plt.tight_layout()
-        plt.savefig(filename, dpi=300, bbox_inches="tight")
+        self._save_figure(filename, dpi=300, bbox_inches="tight")
         plt.close()
 
     def plot_benchmark_slices_vs_time(
@@ -313,7 +383,7 @@ class BenchmarkVisualizer:
 
         g.set(xlabel="Relative slice size", ylabel="Time (s)")
         sns.despine()
-        plt.savefig(filename, dpi=300, bbox_inches="tight")
+        self._save_figure(filename, dpi=300, bbox_inches="tight")
         plt.close()
 
     def plot_read_benchmarks(
@@ -391,6 +461,7 @@ class BenchmarkVisualizer:
         )
 
         if network_tracking:
+            filtered_df = filtered_df.filter(~pl.col("variable").is_in(READ_AMPLIFICATION_STATISTICS))
             base_kwargs.update({"df": filtered_df.filter(~pl.col("is_preloaded")), "row": "variable", "sharex": "row"})
 
         # Plot box plot for each slice value
@@ -419,6 +490,137 @@ class BenchmarkVisualizer:
         )
         self.plot_benchmark_dist(**base_kwargs)
 
+    def plot_read_amplification(
+        self,
+        db: BenchmarkDatabase,
+        order: List[str] = None,
+        benchmark_type: str = "network_tracking_remote_slicing",
+        col_name: str = "benchmark_name_clean",
+    ):
+        """Plot the read amplification of the network tracking slice benchmarks per method and slice size."""
+        print(f"Plotting read amplification for {benchmark_type}...")
+
+        filtered_df = db.filter_tests(benchmark_type).filter(~pl.col("is_preloaded")).collect()
+
+        for variable, xlabel in READ_AMPLIFICATION_VARIABLES.items():
+            base_kwargs = self._create_plot_kwargs(
+                df=filtered_df.filter(pl.col("variable") == variable).to_pandas(),
+                group=col_name,
+                order=self.pynwb_read_order if order is None else order,
+                filename=self.output_directory / f"network_tracking_{variable}.pdf",
+                row="slice_number",
+                sharex=False,
+                xlabel=xlabel,
+                caption=(
+                    f"{xlabel} when slicing data across different methods, modalities, and slice sizes (rows). "
+                    "Text annotations, if present, display mean ± standard deviation and sample size (n). "
+                ),
+            )
+            self.plot_benchmark_dist(**base_kwargs)
+
+    def plot_latency_percentiles(
+        self,
+        db: BenchmarkDatabase,
+        order: List[str] = None,
+        benchmark_type: str = "time_remote_slicing_latency",
+        percentiles: tuple = (50.0, 90.0, 99.0),
+    ):
+        """Plot the percentiles of the latency of small slices per method."""
+        print(f"Plotting latency percentiles for {benchmark_type}...")
+
+        percentile_columns = [f"p{percentile:g}" for percentile in percentiles]
+        df = (
+            db.get_latency_percentiles(benchmark_type=benchmark_type, percentiles=percentiles)
+            .collect()
+            .unpivot(index=["modality", "benchmark_name_clean"], on=percentile_columns, variable_name="percentile")
+            .to_pandas()
+        )
+
+        filename = self.output_directory / "slicing_latency_percentiles.pdf"
+        if df.empty:
+            warnings.warn(f"Warning: No data available to plot for {filename}. Skipping plot.")
+            return
+
+        g = sns.catplot(
+            data=df,
+            x="percentile",
+            y="value",
+            col="modality",
+            hue="benchmark_name_clean",
+            hue_order=self.pynwb_read_order if order is None else order,
+            order=percentile_columns,
+            palette="Paired",
+            sharey=False,
+            kind="point",
+        )
+        g.set(xlabel="Percentile", ylabel="Latency (s)", yscale="log")
+
+        caption = (
+            "Percentiles of the latency of many small slices read at random positions of the data after opening the "
+            "file once, across different methods and modalities. "
+            "Each point is the median across runs of the percentile recorded by each run. "
+        )
+        g.figure.text(0.5, -0.01, caption, ha="center", va="top", fontsize=9, wrap=True, style="italic")
+
+        sns.despine()
+        self._save_figure(filename, dpi=300, bbox_inches="tight")
+        plt.close()
+
+    def plot_first_plot_breakdown(
+        self,
+        db: BenchmarkDatabase,
+        order: List[str] = None,
+        benchmark_type: str = "time_first_plot",
+    ):
+        """Plot the mean time of each phase from the URL to the first screen of data, stacked per method."""
+        print(f"Plotting time to first plot for {benchmark_type}...")
+
+        df = (
+            db.get_mean_times(
+                benchmark_type=benchmark_type,
+                alias="value",
+                group_by=["modality", "benchmark_name_clean", "variable"],
+                variable=[f"{phase}_time" for phase in FIRST_PLOT_PHASES],
+            )
+            .collect()
+            .to_pandas()
+        )
+
+        filename = self.output_directory / "time_to_first_plot.pdf"
+        if df.empty:
+            warnings.warn(f"Warning: No data available to plot for {filename}. Skipping plot.")
+            return
+
+        order = [
+            method
+            for method in (self.pynwb_read_order if order is None else order)
+            if method in set(df["benchmark_name_clean"])
+        ]
+        modalities = sorted(df["modality"].unique())
+        fig, axes = plt.subplots(1, len(modalities), figsize=(6 * len(modalities), 4), sharey=True, squeeze=False)
+        for ax, modality in zip(axes.flat, modalities):
+            phase_times = (
+                df[df["modality"] == modality]
+                .pivot(index="benchmark_name_clean", columns="variable", values="value")
+                .reindex(index=order, columns=[f"{phase}_time" for phase in FIRST_PLOT_PHASES])
+            )
+            phase_times.columns = [phase.replace("_", " ") for phase in FIRST_PLOT_PHASES]
+            phase_times.plot.barh(stacked=True, ax=ax, colormap="Paired", legend=ax is axes.flat[0])
+            ax.set(title=modality, xlabel="Time (s)", ylabel="")
+            ax.invert_yaxis()
+
+        caption = (
+            "Mean time from the URL of a file to the first screen of data of a viewer, broken down into opening the file, "
+            "reading the displayed metadata, and reading the first window of data. "
+            "The phases run one after another on the same opened file, so caching shared between them is included. "
+        )
+        fig.text(0.5, -0.01, caption, ha="center", va="top", fontsize=9, wrap=True, style="italic")
+
+        sns.despine()
+        plt.tight_layout()
+        self._save_figure(filename, dpi=300, bbox_inches="tight")
+        plt.close()
+
     def plot_linear_extrapolation_with_intersection(
         self,
         remote_group,
@@ -628,26 +830,30 @@ class BenchmarkVisualizer:
 
         sns.despine()
         plt.tight_layout()
-        plt.savefig(filename, dpi=300, bbox_inches="tight")
+        self._save_figure(filename, dpi=300, bbox_inches="tight")
         plt.close()
 
     def plot_method_rankings(self, db: BenchmarkDatabase):
         """Create heatmap showing method rankings across benchmarks."""
         print("Plotting method rankings heatmap...")
 
-        slice_df = db.filter_tests("time_remote_slicing")
-        read_df = db.filter_tests("time_remote_file_reading")
+        # Means are read from the precomputed aggregates rather than recomputed from the raw results
+        mean_kwargs = dict(alias="value", group_by=["modality", "benchmark_name_clean"])
 
         fig, axes = plt.subplots(3, 1, figsize=(8, 16))
         axes[0] = self.plot_benchmark_heatmap(
-            df=read_df.filter(pl.col("benchmark_name_clean").is_in(self.file_open_order)),
+            df=db.get_mean_times(
+                benchmark_type="time_remote_file_reading", benchmark_name_clean=self.file_open_order, **mean_kwargs
+            ),
             ax=axes[0],
             title="Remote File Opening",
             vmin=0,
             vmax=4,
         )
         axes[1] = self.plot_benchmark_heatmap(
-            df=read_df.filter(pl.col("benchmark_name_clean").is_in(self.pynwb_read_order)),
+            df=db.get_mean_times(
+                benchmark_type="time_remote_file_reading", benchmark_name_clean=self.pynwb_read_order, **mean_kwargs
+            ),
             ax=axes[1],
             title="Remote File Opening - PyNWB",
             vmin=0,
@@ -655,10 +861,11 @@ class BenchmarkVisualizer:
         )
         # plot only largest slice range for clarity
         axes[2] = self.plot_benchmark_heatmap(
-            df=(
-                slice_df.filter(pl.col("benchmark_name_clean").is_in(self.pynwb_read_order)).filter(
-                    pl.col("slice_number") == 5
-                )
+            df=db.get_mean_times(
+                benchmark_type="time_remote_slicing",
+                benchmark_name_clean=self.pynwb_read_order,
+                slice_number=5,
+                **mean_kwargs,
             ),  # NOTE - if updating, also update caption in plot_benchmark_heatmap
             ax=axes[2],
             title="Remote Slicing",
@@ -677,7 +884,7 @@ class BenchmarkVisualizer:
         fig.text(0.5, -0.01, caption, ha="center", va="top", fontsize=9, wrap=True, style="italic")
 
         plt.tight_layout()
-        plt.savefig(self.output_directory / "method_rankings_heatmap.pdf", dpi=300)
+        self._save_figure(self.output_directory / "method_rankings_heatmap.pdf", dpi=300)
         plt.close()
 
     def plot_performance_across_versions(
@@ -731,33 +938,160 @@ class BenchmarkVisualizer:
         g.figure.text(0.5, -0.01, caption, ha="center", va="top", fontsize=9, wrap=True, style="italic")
 
         sns.despine()
-        plt.savefig(self.output_directory / f"performance_over_{benchmark_type}.pdf", dpi=300, bbox_inches="tight")
+        self._save_figure(
+            self.output_directory / f"performance_over_{benchmark_type}.pdf", dpi=300, bbox_inches="tight"
+        )
         plt.close()
 
-    def plot_all(self, db: BenchmarkDatabase):
-        """Generate all benchmark visualization plots."""
-
-        # # 1. WHICH LIBRARY SHOULD I USE TO STREAM DATA
-        # Remote file reading / slicing benchmarks
-        self.plot_read_benchmarks(db, suffix="_pynwb")
-        self.plot_read_benchmarks(db, order=self.file_open_order, suffix="")
-        self.plot_slice_benchmarks(db)
-
-        # Network tracking analysis
-        benchmark_type = "network_tracking_remote_file_reading"
-        self.plot_read_benchmarks(db, order=self.file_open_order, benchmark_type=benchmark_type, network_tracking=True)
-        self.plot_read_benchmarks(db, benchmark_type=benchmark_type, network_tracking=True, suffix="pynwb")
-        self.plot_slice_benchmarks(db, benchmark_type="network_tracking_remote_slicing", network_tracking=True)
-
-        # Method rankings
-        self.plot_method_rankings(db)
-
-        # 2. WHEN TO DOWNLOAD VS. STREAM DATA?
-        # baseline download line + time to open + slice locally vs. number of slices
-        # time to open + slice locally vs. number of slices
-        self.plot_download_vs_stream_benchmarks(db)
-
-        # 3. HOW DOES PERFORMANCE CHANGE ACROSS VERSIONS/TIME
-        # performance on a single test (time to read/slice) vs. version (h5py, fsspec, etc.)
-        self.plot_performance_across_versions(db, benchmark_type="time_remote_file_reading")
-        self.plot_performance_across_versions(db, benchmark_type="time_remote_slicing")
+    def get_figure_tasks(self) -> List[FigureTask]:
+        """Define every figure generated by `plot_all` along with the benchmark types each one reads."""
+        remote_read = "time_remote_file_reading"
+        remote_slice = "time_remote_slicing"
+        network_read = "network_tracking_remote_file_reading"
+        network_slice = "network_tracking_remote_slicing"
+        latency_slice = "time_remote_slicing_latency"
+        first_plot = "time_first_plot"
+        download_inputs = [remote_read, remote_slice, "time_local_file_reading", "time_local_slicing", "time_download"]
+
+        return [
+            # 1. WHICH LIBRARY SHOULD I USE TO STREAM DATA
+            # Remote file reading / slicing benchmarks
+            FigureTask("plot_read_benchmarks", dict(suffix="_pynwb"), [remote_read]),
+            FigureTask("plot_read_benchmarks", dict(order=self.file_open_order, suffix=""), [remote_read]),
+            FigureTask("plot_slice_benchmarks", dict(), [remote_slice]),
+            # Network tracking analysis
+            FigureTask(
+                "plot_read_benchmarks",
+                dict(order=self.file_open_order, benchmark_type=network_read, network_tracking=True),
+                [network_read],
+            ),
+            FigureTask(
+                "plot_read_benchmarks",
+                dict(benchmark_type=network_read, network_tracking=True, suffix="pynwb"),
+                [network_read],
+            ),
+            FigureTask(
+                "plot_slice_benchmarks", dict(benchmark_type=network_slice, network_tracking=True), [network_slice]
+            ),
+            FigureTask("plot_read_amplification", dict(benchmark_type=network_slice), [network_slice]),
+            # Tail latency of small slices
+            FigureTask("plot_latency_percentiles", dict(), [latency_slice]),
+            # Time from the URL to the first screen of a viewer
+            FigureTask("plot_first_plot_breakdown", dict(), [first_plot]),
+            # Method rankings
+            FigureTask("plot_method_rankings", dict(), [remote_read, remote_slice]),
+            # 2. WHEN TO DOWNLOAD VS. STREAM DATA?
+            # baseline download line + time to open + slice locally vs. number of slices
+            # time to open + slice locally vs. number of slices
+            FigureTask("plot_download_vs_stream_benchmarks", dict(), download_inputs),
+            # 3. HOW DOES PERFORMANCE CHANGE ACROSS VERSIONS/TIME
+            # performance on a single test (time to read/slice) vs. version (h5py, fsspec, etc.)
+            FigureTask(
+                "plot_performance_across_versions",
+                dict(benchmark_type=remote_read),
+                [remote_read],
+                requires_environments=True,
+            ),
+            FigureTask(
+                "plot_performance_across_versions",
+                dict(benchmark_type=remote_slice),
+                [remote_slice],
+                requires_environments=True,
+            ),
+        ]
+
+    def _read_figure_cache(self) -> Dict[str, Dict[str, Any]]:
+        figure_cache_file_path = self.output_directory / FIGURE_CACHE_FILE_NAME
+        if not figure_cache_file_path.exists():
+            return {}
+
+        with figure_cache_file_path.open(mode="r") as file_stream:
+            return json.load(fp=file_stream)
+
+    def _write_figure_cache(self, figure_cache: Dict[str, Dict[str, Any]]):
+        figure_cache_file_path = self.output_directory / FIGURE_CACHE_FILE_NAME
+        with figure_cache_file_path.open(mode="w") as file_stream:
+            json.dump(obj=figure_cache, fp=file_stream, indent=1)
+
+    def plot_all(self, db: BenchmarkDatabase, max_workers: Optional[int] = None, force: bool = False):
+        """
+        Generate all benchmark visualization plots.
+
+        The database is scanned once; each figure task then receives only the rows of the benchmark types it reads,
+        serialized as Arrow IPC, and is rendered in a pool of worker processes. Figures whose inputs (and plotting
+        code) have the same content hash as the last render into this output directory, and whose files all still
+        exist, are skipped.
+
+        Args:
+            db: The benchmark database to plot
+            max_workers: Number of worker processes; defaults to the number of CPUs. Set to 1 to render serially in
+                the current process.
+            force: Re-render every figure even if its inputs have not changed
+        """
+        results_df = db.get_results().collect()
+        environments_df = db.get_environments().collect()
+        aggregates_directory = db.materialize_aggregates()
+
+        code_checksum = "".join(get_file_checksum(file_path=file_path) for file_path in FIGURE_CODE_FILE_PATHS)
+        environments_ipc = _frame_to_ipc_bytes(environments_df)
+        figure_cache = {} if force else self._read_figure_cache()
+
+        pending_tasks = []
+        for task in self.get_figure_tasks():
+            results_ipc = _frame_to_ipc_bytes(
+                results_df.filter(pl.col("benchmark_name_type").is_in(task.benchmark_types))
+            )
+            task_environments_ipc = environments_ipc if task.requires_environments else None
+
+            hasher = hashlib.sha1(bytes(task.key + code_checksum, encoding="utf-8"))
+            hasher.update(results_ipc)
+            if task_environments_ipc is not None:
+                hasher.update(task_environments_ipc)
+            checksum = hasher.hexdigest()
+
+            cached_render = figure_cache.get(task.key, dict())
+            if cached_render.get("checksum") == checksum and all(
+                Path(file_path).exists() for file_path in cached_render["file_paths"]
+            ):
+                print(f"Skipping {task.key}; inputs are unchanged since the last render.")
+                continue
+
+            pending_tasks.append((task, checksum, results_ipc, task_environments_ipc))
+
+        try:
+            if max_workers == 1:
+                for task, checksum, results_ipc, task_environments_ipc in pending_tasks:
+                    try:
+                        file_paths = _render_figure_task(
+                            self.output_directory, task, results_ipc, task_environments_ipc, aggregates_directory
+                        )
+                    except Exception as exception:
+                        warnings.warn(f"Failed to render {task.key}: {exception}")
+                        continue
+                    figure_cache[task.key] = dict(checksum=checksum, file_paths=file_paths)
+                return
+
+            # Forking a process after polars has started its thread pool can deadlock, so always spawn workers
+            mp_context = multiprocessing.get_context(method="spawn")
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+                future_to_task = {
+                    executor.submit(
+                        _render_figure_task,
+                        self.output_directory,
+                        task,
+                        results_ipc,
+                        task_environments_ipc,
+                        aggregates_directory,
+                    ): (task, checksum)
+                    for task, checksum, results_ipc, task_environments_ipc in pending_tasks
+                }
+                for future in concurrent.futures.as_completed(future_to_task):
+                    task, checksum = future_to_task[future]
+                    try:
+                        file_paths = future.result()
+                    except Exception as exception:
+                        warnings.warn(f"Failed to render {task.key}: {exception}")
+                        continue
+                    figure_cache[task.key] = dict(checksum=checksum, file_paths=file_paths)
+        finally:
+            self._write_figure_cache(figure_cache=figure_cache)
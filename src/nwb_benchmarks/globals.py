@@ -1,11 +1,10 @@
 import pathlib
 
-from .setup import get_benchmarks_home_directory
-
 MACHINE_FILE_VERSION = "1.4.1"
 DATABASE_VERSION = "4.0.0"
 
-HOME_DIR = get_benchmarks_home_directory()
+HOME_DIR = pathlib.Path.home() / ".nwb_benchmarks"
+HOME_DIR.mkdir(exist_ok=True)
 RESULTS_DIR = HOME_DIR / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
 ENVIRONMENTS_DIR = HOME_DIR / "environments"
@@ -14,3 +13,9 @@ MACHINES_DIR = HOME_DIR / "machines"
 MACHINES_DIR.mkdir(exist_ok=True)
 LOGS_DIR = HOME_DIR / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
+SHARDS_DIR = HOME_DIR / "shards"
+SHARDS_DIR.mkdir(exist_ok=True)
+PROFILES_DIR = HOME_DIR / "profiles"
+PROFILES_DIR.mkdir(exist_ok=True)
+QUICK_RESULTS_DIR = HOME_DIR / "quick_results"
+QUICK_RESULTS_DIR.mkdir(exist_ok=True)
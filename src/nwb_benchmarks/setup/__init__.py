@@ -16,7 +16,12 @@ from ._configure_machine import (
     generate_human_readable_machine_name,
     generate_machine_file,
 )
-from ._reduce_results import reduce_results
+from ._reduce_results import (
+    merge_results,
+    reduce_in_process_results,
+    reduce_results,
+    write_reduced_results,
+)
 
 __all__ = [
     "clean_cache",
@@ -27,9 +32,12 @@ __all__ = [
     "get_persistent_download_directory",
     "get_temporary_directory",
     "get_temporary_file",
+    "merge_results",
     "generate_machine_file",
     "generate_human_readable_machine_name",
     "read_config",
+    "reduce_in_process_results",
     "reduce_results",
     "set_cache_directory",
+    "write_reduced_results",
 ]
@@ -3,6 +3,8 @@ import pathlib
 import shutil
 import tempfile
 
+from ..globals import HOME_DIR
+
 
 def get_benchmarks_home_directory() -> pathlib.Path:
     """Get the home directory for NWB Benchmarks.
@@ -12,9 +14,8 @@ def get_benchmarks_home_directory() -> pathlib.Path:
     pathlib.Path
         The home directory path.
     """
-    home_directory = pathlib.Path.home() / ".nwb_benchmarks"
-    home_directory.mkdir(exist_ok=True)
-    return home_directory
+    HOME_DIR.mkdir(exist_ok=True)
+    return HOME_DIR
 
 
 def get_benchmarks_config_file_path() -> pathlib.Path:
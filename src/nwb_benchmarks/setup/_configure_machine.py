@@ -12,7 +12,6 @@ from typing import Any, Dict
 
 import friendlywords
 import psutil
-from numba import cuda
 
 from ..globals import MACHINE_FILE_VERSION, MACHINES_DIR
 from ..setup import read_config
@@ -49,6 +48,9 @@ def collect_machine_info() -> Dict[str, Dict[str, Any]]:
     # TODO: psutil does have some socket stuff in .net_connections, is that useful at all?
 
     # GPU info - mostly taken from https://stackoverflow.com/a/62459332
+    # Importing numba takes about a second, so only do so when the machine info is actually collected
+    from numba import cuda
+
     machine_info["cuda"] = dict()
     try:
         device = cuda.get_current_device()
@@ -9,9 +9,17 @@ import shutil
 import subprocess
 import sys
 import warnings
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-from ..globals import DATABASE_VERSION, ENVIRONMENTS_DIR, MACHINES_DIR, RESULTS_DIR
+from ..globals import (
+    DATABASE_VERSION,
+    ENVIRONMENTS_DIR,
+    MACHINES_DIR,
+    PROFILES_DIR,
+    QUICK_RESULTS_DIR,
+    RESULTS_DIR,
+    SHARDS_DIR,
+)
 from ..utils import get_dictionary_checksum
 
 
@@ -30,8 +38,113 @@ def _parse_environment_info(raw_environment_info: List[str]) -> Dict[str, List[D
     return parsed_environment
 
 
-def reduce_results(machine_id: str, raw_results_file_path: pathlib.Path, raw_environment_info_file_path: pathlib.Path):
-    """Default ASV result file is very inefficient - this routine simplifies it for sharing."""
+def get_reduced_results_file_name(reduced_results_info: dict) -> str:
+    """Get the file name of a reduced results file from its contents."""
+    file_name = (
+        f"timestamp-{reduced_results_info['timestamp']}"
+        f"_environment-{reduced_results_info['environment_id']}"
+        f"_machine-{reduced_results_info['machine_id']}"
+    )
+    if "shard" in reduced_results_info:
+        shard_index, number_of_shards = reduced_results_info["shard"].split("/")
+        file_name += f"_shard-{shard_index}-of-{number_of_shards}"
+    return f"{file_name}_results.json"
+
+
+def write_reduced_results(reduced_results_info: dict, output_directory: pathlib.Path = RESULTS_DIR) -> pathlib.Path:
+    """Write reduced results to a JSON file named after its timestamp, environment, machine, and shard (if any)."""
+    parsed_results_file = output_directory / get_reduced_results_file_name(reduced_results_info=reduced_results_info)
+    with open(file=parsed_results_file, mode="w") as io:
+        json.dump(obj=reduced_results_info, fp=io, indent=1)  # At least one level of indent makes it easier to read
+    print(f"\nResults written to:        {parsed_results_file}")
+
+    return parsed_results_file
+
+
+def merge_results(file_paths: List[pathlib.Path], output_directory: pathlib.Path = RESULTS_DIR) -> pathlib.Path:
+    """
+    Merge the partial reduced results of each shard of a sharded run into a single reduced results file.
+
+    All shards must come from the same commit, environment, and type of machine, and must have been assigned their
+    cases by the same shard plan (the same discovered cases and historical costs). The merged file takes the timestamp
+    of the latest shard. Merged shard files that are located in the shards directory are removed afterwards.
+    """
+    if len(file_paths) == 0:
+        raise ValueError("No shard results files were provided to merge!")
+
+    shard_results_infos = []
+    for file_path in file_paths:
+        with open(file=file_path, mode="r") as io:
+            shard_results_infos.append(json.load(fp=io))
+
+    for key in ["database_version", "commit_hash", "environment_id", "machine_id", "shard_plan_checksum"]:
+        values = {shard_results_info.get(key) for shard_results_info in shard_results_infos}
+        if len(values) != 1:
+            raise ValueError(f"Unable to merge results from different runs: found multiple values of '{key}' {values}.")
+
+    shards = [shard_results_info.get("shard") for shard_results_info in shard_results_infos]
+    if None in shards:
+        raise ValueError("Unable to merge results that were not produced by a sharded run.")
+    if len(set(shards)) != len(shards):
+        raise ValueError(f"Unable to merge results containing the same shard more than once: {sorted(shards)}.")
+
+    number_of_shards = {int(shard.split("/")[1]) for shard in shards}
+    if len(number_of_shards) != 1:
+        raise ValueError(f"Unable to merge results from runs split into different numbers of shards: {shards}.")
+    number_of_shards = number_of_shards.pop()
+    missing_shards = sorted(set(range(1, number_of_shards + 1)) - {int(shard.split("/")[0]) for shard in shards})
+    if len(missing_shards) != 0:
+        warnings.warn(
+            f"Merging an incomplete run - results for shards {missing_shards} of {number_of_shards} are missing."
+        )
+
+    merged_results = collections.defaultdict(dict)
+    for shard_results_info in shard_results_infos:
+        for test_case, results_per_params in shard_results_info["results"].items():
+            duplicated_params = set(merged_results[test_case]) & set(results_per_params)
+            if len(duplicated_params) != 0:
+                raise ValueError(f"Test case {test_case} was run with the same parameters in more than one shard!")
+            merged_results[test_case].update(results_per_params)
+
+    first_results_info = shard_results_infos[0]
+    merged_results_info = dict(
+        database_version=first_results_info["database_version"],
+        timestamp=max(shard_results_info["timestamp"] for shard_results_info in shard_results_infos),
+        commit_hash=first_results_info["commit_hash"],
+        environment_id=first_results_info["environment_id"],
+        machine_id=first_results_info["machine_id"],
+        results=dict(merged_results),
+        shards=sorted(shards, key=lambda shard: int(shard.split("/")[0])),
+        shard_plan_checksum=first_results_info.get("shard_plan_checksum"),
+    )
+    merged_results_file = write_reduced_results(
+        reduced_results_info=merged_results_info, output_directory=output_directory
+    )
+
+    for file_path in file_paths:
+        if pathlib.Path(file_path).resolve().parent == SHARDS_DIR.resolve():
+            pathlib.Path(file_path).unlink()
+
+    return merged_results_file
+
+
+def reduce_results(
+    machine_id: str,
+    raw_results_file_path: pathlib.Path,
+    raw_environment_info_file_path: pathlib.Path,
+    shard: Optional[Tuple[int, int]] = None,
+    shard_plan_checksum: Optional[str] = None,
+    profiled: bool = False,
+) -> pathlib.Path:
+    """
+    Default ASV result file is very inefficient - this routine simplifies it for sharing.
+
+    If the run only covered one shard of the benchmark cases, the shard index and number of shards are recorded and the
+    partial results are written to the shards directory, to be combined with the other shards by `merge_results`.
+    The checksum of the assignment of all cases to shards is recorded to verify that the shards are complementary.
+    Results of runs with the sampling profiler enabled are marked, as their timings include its overhead, and written to
+    the profiles directory instead, so that they are neither uploaded nor loaded into the database.
+    """
     with open(file=raw_results_file_path, mode="r") as io:
         raw_results_info = json.load(fp=io)
     with open(file=raw_environment_info_file_path, mode="r") as io:
@@ -53,6 +166,17 @@ def reduce_results(machine_id: str, raw_results_file_path: pathlib.Path, raw_env
         serialized_params = raw_results_list[1][0]
 
         # Skipped results in JSON are writen as `null` and read back into Python as `None`
+        if shard is not None:
+            # A shard only selects some of the parameter cases of each test case, and the others are recorded as `None`
+            shard_results = {
+                params: raw_result
+                for params, raw_result in zip(serialized_params, raw_results_list[11])
+                if raw_result is not None
+            }
+            if len(shard_results) != 0:
+                reduced_results[test_case] = shard_results
+            continue
+
         non_skipped_results = [result for result in raw_results_list[11] if result is not None]
         if len(serialized_params) != len(non_skipped_results):
             message = (
@@ -81,15 +205,89 @@ def reduce_results(machine_id: str, raw_results_file_path: pathlib.Path, raw_env
         machine_id=machine_id,
         results=reduced_results,
     )
+    if shard is not None:
+        reduced_results_info["shard"] = f"{shard[0]}/{shard[1]}"
+        reduced_results_info["shard_plan_checksum"] = shard_plan_checksum
+    if profiled:
+        reduced_results_info["profiled"] = True
 
-    parsed_results_file = (
-        RESULTS_DIR / f"timestamp-{timestamp}_environment-{environment_id}_machine-{machine_id}_results.json"
+    if profiled:
+        output_directory = PROFILES_DIR
+    elif shard is not None:
+        output_directory = SHARDS_DIR
+    else:
+        output_directory = RESULTS_DIR
+    parsed_results_file = _save_reduced_results(
+        reduced_results_info=reduced_results_info,
+        parsed_environment_info=parsed_environment_info,
+        output_directory=output_directory,
+    )
+
+    raw_results_file_path.unlink()
+
+    return parsed_results_file
+
+
+def reduce_in_process_results(
+    machine_id: str,
+    commit_hash: str,
+    results: Dict[str, Dict[str, object]],
+    raw_environment_info_file_path: pathlib.Path,
+) -> pathlib.Path:
+    """
+    Write the results of benchmarks run in the current interpreter in the same format as `reduce_results`.
+
+    The results are keyed by benchmark name and then by the parameter representation used by ASV.
+    These are marked with the runner that produced them so they can be told apart from results produced by ASV, and
+    written to the quick results directory instead, so that they are neither uploaded nor loaded into the database.
+    """
+    # As for ASV results, this code assumes that test cases are run with one parameter
+    unparameterized_test_cases = [
+        test_case for test_case, results_per_params in results.items() if "" in results_per_params
+    ]
+    if len(unparameterized_test_cases) != 0:
+        warnings.warn(f"Results of test cases without parameters are not recorded: {unparameterized_test_cases}")
+    results = {
+        test_case: {params: result for params, result in results_per_params.items() if params != ""}
+        for test_case, results_per_params in results.items()
+    }
+    results = {test_case: results_per_params for test_case, results_per_params in results.items() if results_per_params}
+
+    if len(results) == 0:
+        raise ValueError("No benchmark cases completed successfully - no results were written!")
+
+    with open(file=raw_environment_info_file_path, mode="r") as io:
+        raw_environment_info = io.readlines()
+    parsed_environment_info = _parse_environment_info(raw_environment_info=raw_environment_info)
+
+    reduced_results_info = dict(
+        database_version=DATABASE_VERSION,
+        timestamp=datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S"),
+        commit_hash=commit_hash,
+        environment_id=get_dictionary_checksum(dictionary=parsed_environment_info),
+        machine_id=machine_id,
+        results=results,
+        runner="in_process",
+    )
+    return _save_reduced_results(
+        reduced_results_info=reduced_results_info,
+        parsed_environment_info=parsed_environment_info,
+        output_directory=QUICK_RESULTS_DIR,
+    )
+
+
+def _save_reduced_results(
+    reduced_results_info: dict,
+    parsed_environment_info: Dict[str, List[Dict[str, str]]],
+    output_directory: pathlib.Path = RESULTS_DIR,
+) -> pathlib.Path:
+    """Write reduced results along with the parsed environment info and make the files accessible to the user."""
+    parsed_results_file = write_reduced_results(
+        reduced_results_info=reduced_results_info, output_directory=output_directory
     )
-    with open(file=parsed_results_file, mode="w") as io:
-        json.dump(obj=reduced_results_info, fp=io, indent=1)  # At least one level of indent makes it easier to read
-    print(f"\nResults written to:        {parsed_results_file}")
 
     # Save parsed environment info within machine subdirectory of .asv
+    environment_id = reduced_results_info["environment_id"]
     parsed_environment_file_path = ENVIRONMENTS_DIR / f"environment-{environment_id}.json"
     if not parsed_environment_file_path.exists():
         with open(file=parsed_environment_file_path, mode="w") as io:
@@ -97,10 +295,10 @@ def reduce_results(machine_id: str, raw_results_file_path: pathlib.Path, raw_env
     print(f"\nEnvironment info written to:        {parsed_environment_file_path}\n")
 
     # Network tests require admin permissions, which can alter write permissions of any files created
-    machine_file_path = MACHINES_DIR / f"machine-{machine_id}.json"
+    machine_file_path = MACHINES_DIR / f"machine-{reduced_results_info['machine_id']}.json"
     if sys.platform in ["darwin", "linux"]:
         subprocess.run(["chmod", "-R", "+rw", parsed_results_file.absolute()])
         subprocess.run(["chmod", "-R", "+rw", machine_file_path.absolute()])
         subprocess.run(["chmod", "-R", "+rw", parsed_environment_file_path.absolute()])
 
-    raw_results_file_path.unlink()
+    return parsed_results_file
@@ -1,5 +1,6 @@
-from ._checksums import get_dictionary_checksum
+from ._checksums import get_dictionary_checksum, get_file_checksum
 
 __all__ = [
     "get_dictionary_checksum",
+    "get_file_checksum",
 ]
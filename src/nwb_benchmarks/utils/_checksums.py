@@ -1,5 +1,6 @@
 import hashlib
 import json
+import pathlib
 
 
 def get_dictionary_checksum(dictionary: dict) -> str:
@@ -8,3 +9,13 @@ def get_dictionary_checksum(dictionary: dict) -> str:
     hasher = hashlib.sha1(string=bytes(json.dumps(obj=sorted_dictionary), encoding="utf-8"))
     checksum = hasher.hexdigest()
     return checksum
+
+
+def get_file_checksum(file_path: pathlib.Path, block_size: int = 2**20) -> str:
+    """Get the SHA1 hash of the contents of a file, read in blocks to limit memory usage."""
+    hasher = hashlib.sha1()
+    with open(file=file_path, mode="rb") as file_stream:
+        for block in iter(lambda: file_stream.read(block_size), b""):
+            hasher.update(block)
+    checksum = hasher.hexdigest()
+    return checksum